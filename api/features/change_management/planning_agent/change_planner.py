@@ -88,6 +88,8 @@ Available actions:
 
 Always explain the reason for each change."""
 
+_CHANGE_PLANNER_SYSTEM_SHA256 = sha256_text(CHANGE_PLANNER_SYSTEM_PROMPT)
+
 
 CHANGE_PLANNER_PROMPT = """A User Story has been modified. Please analyze the impact and generate a change plan.
 
@@ -306,7 +308,7 @@ def generate_change_plan(
                 "prompt_sha256": sha256_text(prompt),
                 "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
                 "system_len": len(CHANGE_PLANNER_SYSTEM_PROMPT),
-                "system_sha256": sha256_text(CHANGE_PLANNER_SYSTEM_PROMPT),
+                "system_sha256": _CHANGE_PLANNER_SYSTEM_SHA256,
             }
         )
 
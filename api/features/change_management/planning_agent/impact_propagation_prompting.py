@@ -9,12 +9,17 @@ def extract_json_from_llm_text(text: str) -> str:
     """
     if not text:
         return ""
-    content = text
-    if "```json" in content:
-        content = content.split("```json", 1)[1].split("```", 1)[0]
-    elif "```" in content:
-        content = content.split("```", 1)[1].split("```", 1)[0]
-    return content.strip()
+    # find + one slice: no intermediate split lists for long responses.
+    start = text.find("```json")
+    if start >= 0:
+        start += len("```json")
+    else:
+        start = text.find("```")
+        if start < 0:
+            return text.strip()
+        start += len("```")
+    end = text.find("```", start)
+    return (text[start:end] if end >= 0 else text[start:]).strip()
 
 
 def format_subgraph_for_prompt(center_id: str, subgraph: Dict[str, Any], max_nodes: int = 60, max_rels: int = 120) -> str:
@@ -23,6 +23,7 @@ from api.platform.env import (
 
 from .change_planning_contracts import ChangePlanningPhase, ChangePlanningState, ProposedChange
 from .change_planning_runtime import get_llm
+from .impact_propagation_prompting import extract_json_from_llm_text
 
 
 def revise_plan_node(state: ChangePlanningState) -> Dict[str, Any]:
@@ -110,13 +111,7 @@ Provide the revised plan in the same JSON format:
         )
 
     try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        result = json.loads(content.strip())
+        result = json.loads(extract_json_from_llm_text(response.content))
 
         proposed_changes = []
         for change in result.get("changes", []):
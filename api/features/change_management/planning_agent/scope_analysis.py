@@ -23,6 +23,7 @@ from api.platform.env import (
 
 from .change_planning_contracts import ChangePlanningPhase, ChangePlanningState, ChangeScope
 from .change_planning_runtime import get_llm
+from .impact_propagation_prompting import extract_json_from_llm_text
 
 
 def analyze_scope_node(state: ChangePlanningState) -> Dict[str, Any]:
@@ -132,13 +133,7 @@ Respond in this exact JSON format:
 
     try:
         # Extract JSON from response
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        result = json.loads(content.strip())
+        result = json.loads(extract_json_from_llm_text(response.content))
 
         scope_map = {
             "LOCAL": ChangeScope.LOCAL,
@@ -8,16 +8,19 @@ while keeping a single stable access point (`get_neo4j_client`) for the ingestio
 from __future__ import annotations
 
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 
-from neo4j import Driver, GraphDatabase
+from neo4j import Driver, GraphDatabase, Session
 
 from api.platform.env import (
+    env_str,
     get_neo4j_database,
     get_neo4j_password,
     get_neo4j_uri,
     get_neo4j_user,
 )
+from api.platform.neo4j import NEO4J_POOL_OPTIONS, get_driver
 
 from .neo4j_ops.aggregates import AggregateOps
 from .neo4j_ops.analysis import GraphAnalysisOps
@@ -27,6 +30,13 @@ from .neo4j_ops.events import EventOps
 from .neo4j_ops.policies import PolicyOps
 from .neo4j_ops.user_stories import UserStoryOps
 
+# Bulk writes at/above this many rows are committed in transactions of this size.
+BULK_TX_ROWS = int(env_str("INGESTION_NEO4J_BULK_TX_ROWS", "500") or "500")
+
+# Session handed out by `Neo4jClient.session()` inside `Neo4jClient.shared_session()`.
+# A ContextVar keeps it private to the task that opened it (other requests share the client).
+_shared_session: ContextVar[Session | None] = ContextVar("neo4j_shared_session", default=None)
+
 
 @dataclass
 class Neo4jConfig:
@@ -50,23 +60,35 @@ class Neo4jClient(
     """Neo4j client for Event Storming graph operations."""
 
     def __init__(self, config: Neo4jConfig | None = None):
+        # Without an explicit config this talks to the app's database: share the app-wide
+        # driver so the process keeps a single connection pool.
+        self._shares_app_driver = config is None
         self.config = config or Neo4jConfig()
         self._driver: Driver | None = None
 
     @property
     def driver(self) -> Driver:
+        if self._shares_app_driver:
+            return get_driver()
         if self._driver is None:
-            self._driver = GraphDatabase.driver(self.config.uri, auth=(self.config.user, self.config.password))
+            self._driver = GraphDatabase.driver(
+                self.config.uri, auth=(self.config.user, self.config.password), **NEO4J_POOL_OPTIONS
+            )
         return self._driver
 
     def close(self):
+        """Close this client's own driver (the shared app driver is closed by the app lifespan)."""
         if self._driver:
             self._driver.close()
             self._driver = None
 
     @contextmanager
     def session(self):
-        """Context manager for Neo4j sessions."""
+        """Context manager for Neo4j sessions (the `shared_session()` one while that is active)."""
+        shared = _shared_session.get()
+        if shared is not None:
+            yield shared
+            return
         if self.config.database:
             session = self.driver.session(database=self.config.database)
         else:
@@ -76,6 +98,56 @@ class Neo4jClient(
         finally:
             session.close()
 
+    @contextmanager
+    def shared_session(self):
+        """
+        Serve every `session()` call made in this context from one session, e.g. for a whole
+        ingestion run, instead of acquiring and releasing one per write.
+
+        Writes stay auto-commit (one transaction per statement): bulk writes may use
+        `CALL { } IN TRANSACTIONS`, which cannot run inside an explicit transaction.
+        """
+        with self.session() as session:
+            token = _shared_session.set(session)
+            try:
+                yield session
+            finally:
+                _shared_session.reset(token)
+
+    def run_unwind_write(self, body: str, rows: list[dict], *, written: str, **params) -> int:
+        """
+        Run `body` once per element of `rows` (bound as `row`) and return how many rows wrote `written`.
+
+        Small batches run as a single UNWIND transaction. Large ones are committed BULK_TX_ROWS
+        at a time with `CALL { } IN TRANSACTIONS`, which needs an auto-commit transaction, so
+        this always goes through `session.run`. The chunks run one after another: bodies MERGE
+        relationships onto shared parents (the same BC/Aggregate/Command), which concurrent
+        transactions would deadlock on.
+
+        If a chunk fails, the chunks before it stay committed and the error propagates. Bodies
+        are MERGE-based, so re-running the same rows completes the write without duplicates.
+        """
+        if not rows:
+            return 0
+        if len(rows) >= BULK_TX_ROWS:
+            query = f"""
+            UNWIND $rows AS row
+            CALL {{
+                WITH row
+                {body}
+                RETURN {written} as written
+            }} IN TRANSACTIONS OF {BULK_TX_ROWS} ROWS
+            RETURN count(written) as written
+            """
+        else:
+            query = f"""
+            UNWIND $rows AS row
+            {body}
+            RETURN count({written}) as written
+            """
+        with self.session() as session:
+            return session.run(query, rows=rows, **params).single()["written"]
+
     def verify_connection(self) -> bool:
         """Verify Neo4j connection."""
         try:
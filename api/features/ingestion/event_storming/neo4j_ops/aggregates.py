@@ -75,6 +75,49 @@ class AggregateOps:
             )
             return dict(result.single()["aggregate"])
 
+    def bulk_create_aggregates(self, rows: list[dict[str, Any]]) -> int:
+        """Create many aggregates and link each to its bounded context in one round-trip.
+
+        Each row: {id, name, bc_id, root_entity, invariants}.
+        Enforces the same one-BC-per-Aggregate rule as `create_aggregate`, both against
+        the graph and within the batch itself.
+        """
+        if not rows:
+            return 0
+
+        owner: dict[str, str] = {}
+        for row in rows:
+            prev = owner.setdefault(row["id"], row["bc_id"])
+            if prev != row["bc_id"]:
+                raise ValueError(
+                    f"Aggregate {row['id']} already belongs to BC {prev}. "
+                    f"An Aggregate can only belong to ONE Bounded Context."
+                )
+
+        check_query = """
+        UNWIND $rows AS row
+        MATCH (existing:Aggregate {id: row.id})<-[:HAS_AGGREGATE]-(otherBC:BoundedContext)
+        WHERE otherBC.id <> row.bc_id
+        RETURN existing.id as id, otherBC.id as existing_bc
+        LIMIT 1
+        """
+        body = """
+        MATCH (bc:BoundedContext {id: row.bc_id})
+        MERGE (agg:Aggregate {id: row.id})
+        SET agg.name = row.name,
+            agg.rootEntity = coalesce(row.root_entity, row.name),
+            agg.invariants = coalesce(row.invariants, [])
+        MERGE (bc)-[:HAS_AGGREGATE {isPrimary: false}]->(agg)
+        """
+        with self.session() as session:
+            record = session.run(check_query, rows=rows).single()
+            if record:
+                raise ValueError(
+                    f"Aggregate {record['id']} already belongs to BC {record['existing_bc']}. "
+                    f"An Aggregate can only belong to ONE Bounded Context."
+                )
+        return self.run_unwind_write(body, rows, written="agg")
+
     def link_user_story_to_aggregate(self, user_story_id: str, aggregate_id: str, confidence: float = 0.9) -> bool:
         """Link a user story to an aggregate via IMPLEMENTS relationship."""
         query = """
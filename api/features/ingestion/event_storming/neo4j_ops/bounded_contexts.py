@@ -60,4 +60,29 @@ class BoundedContextOps:
             result = session.run(query, user_story_id=user_story_id, bc_id=bc_id, confidence=confidence)
             return result.single() is not None
 
+    def bulk_create_bounded_contexts(self, rows: list[dict[str, Any]]) -> int:
+        """Create/update many bounded contexts in one round-trip.
 
+        Each row: {id, name, description, owner}.
+        """
+        body = """
+        MERGE (bc:BoundedContext {id: row.id})
+        SET bc.name = row.name,
+            bc.description = row.description,
+            bc.owner = row.owner
+        """
+        return self.run_unwind_write(body, rows, written="bc")
+
+    def bulk_link_user_stories_to_bc(self, pairs: list[dict[str, Any]], confidence: float = 0.9) -> int:
+        """Link many user stories to bounded contexts via IMPLEMENTS in one round-trip.
+
+        Each pair: {user_story_id, bc_id}. Pairs whose endpoints do not exist are skipped.
+        """
+        body = """
+        MATCH (us:UserStory {id: row.user_story_id})
+        MATCH (bc:BoundedContext {id: row.bc_id})
+        MERGE (us)-[r:IMPLEMENTS]->(bc)
+        SET r.confidence = $confidence,
+            r.createdAt = datetime()
+        """
+        return self.run_unwind_write(body, pairs, written="r", confidence=confidence)
@@ -37,6 +37,21 @@ class CommandOps:
             )
             return dict(result.single()["command"])
 
+    def bulk_create_commands(self, rows: list[dict[str, Any]]) -> int:
+        """Create many commands and link each to its aggregate in one round-trip.
+
+        Each row: {id, name, aggregate_id, actor, input_schema}.
+        """
+        body = """
+        MATCH (agg:Aggregate {id: row.aggregate_id})
+        MERGE (cmd:Command {id: row.id})
+        SET cmd.name = row.name,
+            cmd.actor = coalesce(row.actor, 'user'),
+            cmd.inputSchema = row.input_schema
+        MERGE (agg)-[:HAS_COMMAND]->(cmd)
+        """
+        return self.run_unwind_write(body, rows, written="cmd")
+
     def get_commands_by_aggregate(self, aggregate_id: str) -> list[dict[str, Any]]:
         """Fetch commands belonging to an aggregate."""
         query = """
@@ -38,4 +38,18 @@ class EventOps:
             )
             return dict(result.single()["event"])
 
+    def bulk_create_events(self, rows: list[dict[str, Any]]) -> int:
+        """Create many events and link each to its command via EMITS in one round-trip.
 
+        Each row: {id, name, command_id, version, schema}.
+        """
+        body = """
+        MATCH (cmd:Command {id: row.command_id})
+        MERGE (evt:Event {id: row.id})
+        SET evt.name = row.name,
+            evt.version = coalesce(row.version, '1.0.0'),
+            evt.schema = row.schema,
+            evt.isBreaking = false
+        MERGE (cmd)-[:EMITS {isGuaranteed: true}]->(evt)
+        """
+        return self.run_unwind_write(body, rows, written="evt")
@@ -42,4 +42,21 @@ class PolicyOps:
             )
             return dict(result.single()["policy"])
 
+    def bulk_create_policies(self, rows: list[dict[str, Any]]) -> int:
+        """Create many policies with their HAS_POLICY/TRIGGERS/INVOKES relationships in one round-trip.
 
+        Each row: {id, name, bc_id, trigger_event_id, invoke_command_id, description}.
+        Rows whose BC, event or command does not exist are skipped.
+        """
+        body = """
+        MATCH (bc:BoundedContext {id: row.bc_id})
+        MATCH (evt:Event {id: row.trigger_event_id})
+        MATCH (cmd:Command {id: row.invoke_command_id})
+        MERGE (pol:Policy {id: row.id})
+        SET pol.name = row.name,
+            pol.description = row.description
+        MERGE (bc)-[:HAS_POLICY]->(pol)
+        MERGE (evt)-[:TRIGGERS {priority: 1, isEnabled: true}]->(pol)
+        MERGE (pol)-[:INVOKES {isAsync: true}]->(cmd)
+        """
+        return self.run_unwind_write(body, rows, written="pol")
@@ -85,4 +85,17 @@ class UserStoryOps:
             )
             return dict(result.single()["user_story"])
 
+    def bulk_create_user_stories(self, rows: list[dict[str, Any]]) -> int:
+        """Create/update many user stories in one round-trip.
 
+        Each row: {id, role, action, benefit, priority, status}.
+        """
+        body = """
+        MERGE (us:UserStory {id: row.id})
+        SET us.role = row.role,
+            us.action = row.action,
+            us.benefit = row.benefit,
+            us.priority = coalesce(row.priority, 'medium'),
+            us.status = coalesce(row.status, 'draft')
+        """
+        return self.run_unwind_write(body, rows, written="us")
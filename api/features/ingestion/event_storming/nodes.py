@@ -11,6 +11,8 @@ from __future__ import annotations
 # Structured outputs (used by other ingestion flows too)
 from .structured_outputs import (
     AggregateList,
+    BCCommandList,
+    BCEventList,
     BoundedContextList,
     CommandList,
     EventList,
@@ -34,6 +36,8 @@ __all__ = [
     "AggregateList",
     "CommandList",
     "EventList",
+    "BCCommandList",
+    "BCEventList",
     "PolicyList",
     # Nodes
     "init_node",
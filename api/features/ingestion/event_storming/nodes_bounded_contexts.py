@@ -23,6 +23,8 @@ from .prompts import IDENTIFY_BC_FROM_STORIES_PROMPT, SYSTEM_PROMPT
 from .state import EventStormingState, WorkflowPhase
 from .structured_outputs import BoundedContextList
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 def identify_bc_node(state: EventStormingState) -> Dict[str, Any]:
     """Identify Bounded Context candidates from user stories."""
@@ -55,7 +57,7 @@ def identify_bc_node(state: EventStormingState) -> Dict[str, Any]:
                 "prompt_sha256": sha256_text(prompt),
                 "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
                 "system_len": len(SYSTEM_PROMPT),
-                "system_sha256": sha256_text(SYSTEM_PROMPT),
+                "system_sha256": _SYSTEM_PROMPT_SHA256,
             }
         )
 
@@ -22,6 +22,8 @@ from .node_runtime import dump_model, get_llm
 from .prompts import BREAKDOWN_USER_STORY_PROMPT, SYSTEM_PROMPT
 from .state import EventStormingState, UserStoryBreakdown, WorkflowPhase, format_user_story
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 def breakdown_user_story_node(state: EventStormingState) -> Dict[str, Any]:
     """Break down user stories within the current Bounded Context."""
@@ -62,7 +64,7 @@ def breakdown_user_story_node(state: EventStormingState) -> Dict[str, Any]:
                     "prompt_len": len(prompt),
                     "prompt_sha256": sha256_text(prompt),
                     "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                    "system_sha256": sha256_text(SYSTEM_PROMPT),
+                    "system_sha256": _SYSTEM_PROMPT_SHA256,
                 }
             )
 
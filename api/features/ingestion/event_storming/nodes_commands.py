@@ -23,6 +23,8 @@ from .prompts import EXTRACT_COMMANDS_PROMPT, SYSTEM_PROMPT
 from .state import EventStormingState, WorkflowPhase
 from .structured_outputs import CommandList
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 def extract_commands_node(state: EventStormingState) -> Dict[str, Any]:
     """Extract Commands for each Aggregate."""
@@ -67,7 +69,7 @@ def extract_commands_node(state: EventStormingState) -> Dict[str, Any]:
                         "prompt_len": len(prompt),
                         "prompt_sha256": sha256_text(prompt),
                         "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                        "system_sha256": sha256_text(SYSTEM_PROMPT),
+                        "system_sha256": _SYSTEM_PROMPT_SHA256,
                     }
                 )
 
@@ -23,6 +23,8 @@ from .prompts import EXTRACT_EVENTS_PROMPT, SYSTEM_PROMPT
 from .state import EventStormingState, WorkflowPhase
 from .structured_outputs import EventList
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 def extract_events_node(state: EventStormingState) -> Dict[str, Any]:
     """Extract Events for each Command."""
@@ -69,7 +71,7 @@ def extract_events_node(state: EventStormingState) -> Dict[str, Any]:
                     "prompt_len": len(prompt),
                     "prompt_sha256": sha256_text(prompt),
                     "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                    "system_sha256": sha256_text(SYSTEM_PROMPT),
+                    "system_sha256": _SYSTEM_PROMPT_SHA256,
                 }
             )
 
@@ -23,48 +23,40 @@ from .prompts import IDENTIFY_POLICIES_PROMPT, SYSTEM_PROMPT
 from .state import EventStormingState, WorkflowPhase
 from .structured_outputs import PolicyList
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 def identify_policies_node(state: EventStormingState) -> Dict[str, Any]:
     """Identify Policies for cross-BC communication."""
     llm = get_llm()
 
-    # Collect all events
-    all_events = []
-    for agg_id, events in state.event_candidates.items():
-        # Find which BC this aggregate belongs to
-        bc_name = "Unknown"
-        for bc_id, aggregates in state.approved_aggregates.items():
-            for agg in aggregates:
-                if agg.id == agg_id:
-                    bc = next((b for b in state.approved_bcs if b.id == bc_id), None)
-                    bc_name = bc.name if bc else bc_id
-                    break
-
-        for evt in events:
-            all_events.append(f"- {evt.name} (from {bc_name}): {evt.description}")
+    # Events are keyed by aggregate: resolve each aggregate's BC name once.
+    bc_name_by_id = {bc.id: bc.name for bc in state.approved_bcs}
+    bc_name_by_agg_id = {
+        agg.id: bc_name_by_id.get(bc_id, bc_id)
+        for bc_id, aggregates in state.approved_aggregates.items()
+        for agg in aggregates
+    }
+    all_events = [
+        f"- {evt.name} (from {bc_name_by_agg_id.get(agg_id, 'Unknown')}): {evt.description}"
+        for agg_id, events in state.event_candidates.items()
+        for evt in events
+    ]
 
     events_text = "\n".join(all_events)
 
-    # Collect commands by BC
-    commands_by_bc = {}
-    for bc in state.approved_bcs:
-        bc_commands = []
-        for agg_id, aggregates in state.approved_aggregates.items():
-            if agg_id == bc.id or any(a.id.startswith(bc.id.replace("BC-", "AGG-")) for a in aggregates):
-                continue
-        # Get commands for aggregates in this BC
-        for agg_id, commands in state.command_candidates.items():
-            for aggregates in state.approved_aggregates.get(bc.id, []):
-                if agg_id == aggregates.id:
-                    bc_commands.extend([f"- {cmd.name}: {cmd.description}" for cmd in commands])
-        if not bc_commands:
-            # Fallback: collect all commands for this BC's aggregates
-            for agg in state.approved_aggregates.get(bc.id, []):
-                for cmd in state.command_candidates.get(agg.id, []):
-                    bc_commands.append(f"- {cmd.name}: {cmd.description}")
-        commands_by_bc[bc.name] = "\n".join(bc_commands) if bc_commands else "No commands"
-
-    commands_text = "\n".join([f"{bc_name}:\n{cmds}" for bc_name, cmds in commands_by_bc.items()])
+    # Commands per BC, keyed by BC id (two BCs may share a name).
+    command_lines_by_bc_id = {
+        bc.id: [
+            f"- {cmd.name}: {cmd.description}"
+            for agg in state.approved_aggregates.get(bc.id, [])
+            for cmd in state.command_candidates.get(agg.id, [])
+        ]
+        for bc in state.approved_bcs
+    }
+    commands_text = "\n".join(
+        f"{bc.name}:\n" + ("\n".join(command_lines_by_bc_id[bc.id]) or "No commands") for bc in state.approved_bcs
+    )
 
     bc_text = "\n".join([f"- {bc.name}: {bc.description}" for bc in state.approved_bcs])
 
@@ -89,7 +81,7 @@ def identify_policies_node(state: EventStormingState) -> Dict[str, Any]:
                 "prompt_len": len(prompt),
                 "prompt_sha256": sha256_text(prompt),
                 "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                "system_sha256": sha256_text(SYSTEM_PROMPT),
+                "system_sha256": _SYSTEM_PROMPT_SHA256,
             }
         )
 
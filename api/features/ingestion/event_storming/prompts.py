@@ -221,6 +221,73 @@ This creates traceability: UserStory -> Command -> Event
 
 Output should be a list of EventCandidate objects."""
 
+# Per-Bounded-Context variants: one call covers every Aggregate of the BC.
+# Static guidelines come first so all calls share a cacheable prefix.
+
+EXTRACT_COMMANDS_FOR_BC_PROMPT = """Guidelines for identifying Commands:
+1. Commands represent user/system intentions to change state
+2. Name commands as imperative verbs (CreateOrder, CancelOrder)
+3. Each command should map to a user action or system trigger
+4. Commands are handled by exactly one aggregate
+5. IMPORTANT: Track which user story each command implements
+
+For each Command, provide:
+- A unique ID: CMD-BCNAME-VERB-NOUN (e.g., CMD-ORDER-CANCEL-ORDER)
+- aggregate_id: the ID of the Aggregate (from the list below) that handles this command
+- The command name in PascalCase
+- Who/what triggers this command (user, system, policy)
+- A description of what the command does
+- user_story_ids: List of User Story IDs that this command directly implements
+
+Example:
+- CMD-ORDER-PLACE-ORDER: PlaceOrder, aggregate AGG-ORDER-ORDER, implements [US-001]
+- CMD-ORDER-CANCEL-ORDER: CancelOrder, aggregate AGG-ORDER-ORDER, implements [US-002]
+
+This creates traceability: UserStory -> Command
+
+Output should be a list of CommandCandidate objects covering every Aggregate below.
+---
+Identify Commands for each Aggregate of the given Bounded Context based on user story requirements.
+
+Bounded Context: {bc_name}
+
+Aggregates:
+{aggregates}
+
+User Stories for this Bounded Context:
+{user_story_context}"""
+
+EXTRACT_EVENTS_FOR_BC_PROMPT = """Guidelines for identifying Events:
+1. Events represent facts that happened (past tense)
+2. Name events as NounPastVerb (OrderCreated, PaymentProcessed)
+3. Every command should emit at least one event on success
+4. Events are immutable facts - they cannot be changed
+5. IMPORTANT: Inherit user_story_ids from the command that emits this event
+
+For each Event, provide:
+- A unique ID: EVT-BCNAME-NOUN-PASTVERB (e.g., EVT-ORDER-ORDER-CANCELLED)
+- aggregate_id: the ID of the Aggregate (from the list below) whose command emits this event
+- The event name in PascalCase
+- A description of what happened
+- user_story_ids: List of User Story IDs (inherited from the emitting command)
+
+List each Aggregate's events in the same order as its commands.
+
+Example:
+- EVT-ORDER-ORDER-PLACED: OrderPlaced, aggregate AGG-ORDER-ORDER, implements [US-001]
+- EVT-ORDER-ORDER-CANCELLED: OrderCancelled, aggregate AGG-ORDER-ORDER, implements [US-002]
+
+This creates traceability: UserStory -> Command -> Event
+
+Output should be a list of EventCandidate objects covering every Aggregate below.
+---
+Identify Events emitted by Commands in each Aggregate of this Bounded Context.
+
+Bounded Context: {bc_name}
+
+Aggregates and their Commands:
+{aggregates}"""
+
 # =============================================================================
 # Policy Identification
 # =============================================================================
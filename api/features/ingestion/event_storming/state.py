@@ -96,6 +96,18 @@ class EventCandidate(BaseModel):
     )
 
 
+class BCCommandCandidate(CommandCandidate):
+    """A candidate Command extracted for a whole Bounded Context, tagged with its Aggregate."""
+
+    aggregate_id: str = Field(..., description="ID of the Aggregate that handles this command")
+
+
+class BCEventCandidate(EventCandidate):
+    """A candidate Event extracted for a whole Bounded Context, tagged with its Aggregate."""
+
+    aggregate_id: str = Field(..., description="ID of the Aggregate whose command emits this event")
+
+
 class PolicyCandidate(BaseModel):
     """A candidate Policy for cross-BC communication."""
 
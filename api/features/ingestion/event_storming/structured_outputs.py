@@ -10,7 +10,15 @@ from typing import List
 
 from pydantic import BaseModel, Field
 
-from .state import AggregateCandidate, BoundedContextCandidate, CommandCandidate, EventCandidate, PolicyCandidate
+from .state import (
+    AggregateCandidate,
+    BCCommandCandidate,
+    BCEventCandidate,
+    BoundedContextCandidate,
+    CommandCandidate,
+    EventCandidate,
+    PolicyCandidate,
+)
 
 
 class BoundedContextList(BaseModel):
@@ -37,6 +45,18 @@ class EventList(BaseModel):
     events: List[EventCandidate] = Field(description="List of identified events")
 
 
+class BCCommandList(BaseModel):
+    """Command candidates for every Aggregate of one Bounded Context."""
+
+    commands: List[BCCommandCandidate] = Field(description="List of identified commands, each tagged with its aggregate")
+
+
+class BCEventList(BaseModel):
+    """Event candidates for every Aggregate of one Bounded Context."""
+
+    events: List[BCEventCandidate] = Field(description="List of identified events, each tagged with its aggregate")
+
+
 class PolicyList(BaseModel):
     """List of Policy candidates."""
 
@@ -34,6 +34,52 @@ class ProgressEvent(BaseModel):
     progress: int  # 0-100
     data: Optional[dict] = None  # Created objects / step payloads
 
+    @classmethod
+    def compact(
+        cls,
+        phase: IngestionPhase,
+        message: str,
+        progress: int,
+        *,
+        object_type: str,
+        object_id: str,
+        name: str,
+        parent_id: Optional[str],
+    ) -> ProgressEvent:
+        """
+        Created-object event carrying only what the navigator needs to place the node.
+
+        Skips validation (`model_construct`): these are emitted per object and built from
+        already-validated LLM output.
+        """
+        return cls.model_construct(
+            phase=phase,
+            message=message,
+            progress=progress,
+            data={"object": {"id": object_id, "name": name, "type": object_type, "parentId": parent_id}},
+        )
+
+    @classmethod
+    def retraction(
+        cls,
+        phase: IngestionPhase,
+        message: str,
+        progress: int,
+        *,
+        object_type: str,
+        object_ids: list[str],
+    ) -> ProgressEvent:
+        """
+        Withdraw objects already announced by `compact` events that will not be persisted
+        (their extraction or write failed), so the navigator can drop them again.
+        """
+        return cls.model_construct(
+            phase=phase,
+            message=message,
+            progress=progress,
+            data={"retracted": {"type": object_type, "ids": object_ids}},
+        )
+
 
 class CreatedObject(BaseModel):
     """Information about a created DDD object."""
@@ -0,0 +1,53 @@
+"""
+Ingestion Graph Stats
+
+Business capability: report how many nodes of each label the Event Storming graph holds.
+
+Counting scans every node, and the UI polls /stats, so counts are cached for
+INGESTION_STATS_TTL_SEC. Writers that change the graph wholesale (clear-all, a
+finished ingestion run) call `invalidate_stats_cache()`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from api.platform.env import env_str
+from api.platform.neo4j import run_read
+
+STATS_TTL_SEC = float(env_str("INGESTION_STATS_TTL_SEC", "3") or "0")
+
+_LABEL_COUNTS_QUERY = """
+MATCH (n)
+WITH labels(n)[0] as label, count(n) as count
+RETURN collect({label: label, count: count}) as counts
+"""
+
+_stats_cache: dict[str, Any] = {"expires": 0.0, "value": None}
+
+
+def count_nodes_by_label(*, use_cache: bool = True, session: Any | None = None) -> dict[str, int]:
+    """{label: node count} for the whole graph (first label of each node).
+
+    Pass `session` to count on a caller-owned session (e.g. the one about to delete).
+    """
+    now = time.monotonic()
+    if use_cache and _stats_cache["value"] is not None and now < _stats_cache["expires"]:
+        return dict(_stats_cache["value"])
+
+    if session is not None:
+        record = session.run(_LABEL_COUNTS_QUERY).single()
+        records = [record] if record else []
+    else:
+        records = run_read(_LABEL_COUNTS_QUERY)
+    counts = {item["label"]: item["count"] for item in records[0]["counts"]} if records else {}
+
+    _stats_cache["value"] = counts
+    _stats_cache["expires"] = now + STATS_TTL_SEC
+    return dict(counts)
+
+
+def invalidate_stats_cache() -> None:
+    _stats_cache["value"] = None
+    _stats_cache["expires"] = 0.0
@@ -7,14 +7,39 @@ Kept feature-local to avoid creating a generic global LLM layer.
 
 from __future__ import annotations
 
-from api.platform.env import get_llm_provider_model
+import asyncio
+import string
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable
 
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from api.platform.env import (
+    AI_AUDIT_LOG_ENABLED,
+    AI_AUDIT_LOG_FULL_OUTPUT,
+    AI_AUDIT_LOG_FULL_PROMPT,
+    env_str,
+    get_llm_provider_model,
+)
+from api.platform.observability.request_logging import summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
+# Bounds concurrent provider calls when a phase fans out per aggregate (rate limits).
+LLM_CONCURRENCY = int(env_str("INGESTION_LLM_CONCURRENCY", "8") or "8")
+llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+# Exact-match structured-response cache (temperature=0): re-ingesting the same document
+# replays earlier answers instead of paying for the same provider calls again.
+LLM_CACHE_TTL_SEC = float(env_str("INGESTION_LLM_CACHE_TTL_SEC", "604800") or "0")
+LLM_CACHE_MAX_ENTRIES = int(env_str("INGESTION_LLM_CACHE_MAX_ENTRIES", "512") or "0")
+_llm_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
 
-def get_llm():
-    """Get configured LLM instance."""
-    provider, model = get_llm_provider_model()
+
+def get_llm(provider_model: tuple[str, str] | None = None):
+    """Get configured LLM instance (for `provider_model`, or the current env settings)."""
+    provider, model = provider_model or get_llm_provider_model()
     SmartLogger.log("INFO", "LLM configured", category="ingestion.llm", params={"provider": provider, "model": model})
 
     if provider == "anthropic":
@@ -27,3 +52,138 @@ def get_llm():
         return ChatOpenAI(model=model, temperature=0)
 
 
+def audit_log(message: str, category: str, params: Callable[[], dict]) -> None:
+    """INFO audit record; `params` is only built when auditing is on and the logger keeps it."""
+    if AI_AUDIT_LOG_ENABLED:
+        SmartLogger.log("INFO", message, category=category, params=params)
+
+
+def audit_prompt(prompt: str):
+    """Prompt as it goes into an audit record (full text only with AI_AUDIT_LOG_FULL_PROMPT)."""
+    return prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt)
+
+
+def audit_response(response):
+    """Structured LLM response as it goes into an audit record (full dump only with AI_AUDIT_LOG_FULL_OUTPUT)."""
+    try:
+        dump = response.model_dump() if hasattr(response, "model_dump") else response.dict()
+    except Exception:
+        dump = {"__type__": type(response).__name__, "__repr__": repr(response)[:1000]}
+    return dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(dump)
+
+
+def compile_prompt(template: str) -> Callable[..., str]:
+    """
+    Equivalent of `template.format`, with the template parsed once up front.
+
+    Only plain `{name}` fields are pre-split; templates using conversions or format specs
+    fall back to `template.format`.
+    """
+    parsed = list(string.Formatter().parse(template))
+    if any(spec or conversion for _, _, spec, conversion in parsed):
+        return template.format
+    parts = [(literal, field) for literal, field, _, _ in parsed]
+
+    def render(**values) -> str:
+        return "".join([literal if field is None else literal + str(values[field]) for literal, field in parts])
+
+    return render
+
+
+@lru_cache(maxsize=32)
+def _system_message(content: str) -> SystemMessage:
+    # System prompts are module constants: share one message object across calls.
+    return SystemMessage(content=content)
+
+
+def _cache_key(schema: type, system_sha256: str, prompt_sha256: str, provider_model: tuple[str, str]) -> str:
+    provider, model = provider_model
+    return f"{provider}:{model}:{system_sha256}:{prompt_sha256}:{schema.__name__}"
+
+
+def _caching() -> bool:
+    return LLM_CACHE_TTL_SEC > 0 and LLM_CACHE_MAX_ENTRIES > 0
+
+
+def _cache_get(key: str, schema: type):
+    entry = _llm_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _llm_cache[key]
+        return None
+    _llm_cache.move_to_end(key)
+    return schema.model_validate(entry[1])
+
+
+def _cache_put(key: str, response) -> None:
+    _llm_cache[key] = (time.monotonic() + LLM_CACHE_TTL_SEC, response.model_dump())
+    _llm_cache.move_to_end(key)
+    while len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+        _llm_cache.popitem(last=False)
+
+
+async def cached_structured_invoke(
+    structured_llm,
+    schema: type,
+    system: str,
+    prompt: str,
+    *,
+    system_sha256: str,
+    prompt_sha256: str,
+    provider_model: tuple[str, str],
+):
+    """
+    `structured_llm.ainvoke(...)` (bounded by `llm_semaphore`) for a `schema` response, served from
+    the response cache when the same provider/model/system/prompt/schema was answered recently.
+
+    Entries are stored as `model_dump()` and re-validated on a hit, so callers get their own copy.
+    Returns (response, cache_hit).
+    """
+    key = _cache_key(schema, system_sha256, prompt_sha256, provider_model)
+    if _caching() and (cached := _cache_get(key, schema)) is not None:
+        return cached, True
+
+    async with llm_semaphore:
+        response = await structured_llm.ainvoke(
+            [_system_message(system), HumanMessage(content=prompt)]
+        )
+
+    if _caching():
+        _cache_put(key, response)
+    return response, False
+
+
+async def cached_structured_stream(
+    structured_llm,
+    schema: type,
+    system: str,
+    prompt: str,
+    *,
+    system_sha256: str,
+    prompt_sha256: str,
+    provider_model: tuple[str, str],
+) -> AsyncIterator[tuple[Any, bool]]:
+    """
+    Streaming counterpart of `cached_structured_invoke`: yields (response, cache_hit) each time
+    `structured_llm.astream(...)` has parsed more of the output. The last yield is the complete
+    response; earlier ones are partial (their last list item may still be cut off mid-field).
+
+    A cache hit yields the stored response once; only complete responses are cached.
+    """
+    key = _cache_key(schema, system_sha256, prompt_sha256, provider_model)
+    if _caching() and (cached := _cache_get(key, schema)) is not None:
+        yield cached, True
+        return
+
+    response = None
+    async with llm_semaphore:
+        async for response in structured_llm.astream(
+            [_system_message(system), HumanMessage(content=prompt)]
+        ):
+            yield response, False
+
+    if response is None:
+        raise ValueError(f"LLM stream ended without a parseable {schema.__name__}")
+    if _caching():
+        _cache_put(key, response)
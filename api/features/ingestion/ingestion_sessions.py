@@ -1,16 +1,54 @@
 """
-Ingestion Sessions (in-memory)
+Ingestion Sessions (in-memory, optionally mirrored to Redis)
 
 Business capability: track an ingestion run across upload -> streaming workflow execution.
+
+Sessions expire after INGESTION_SESSION_TTL_SEC without activity, and at most
+INGESTION_MAX_SESSIONS are kept (least recently active evicted first), so uploads
+that are never streamed do not pin their document text forever.
+
+With INGESTION_SESSION_BACKEND=redis, sessions are also written to Redis
+(INGESTION_REDIS_URL) so the SSE stream can land on a different worker than the
+upload. The run itself still streams from the worker's in-memory copy; Redis gets
+the content plus status/progress/message on each phase change, and a per-session
+summary in the `ingestion:sessions:index` hash that session listing reads.
 """
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
 from api.features.ingestion.ingestion_contracts import CreatedObject, IngestionPhase, ProgressEvent
+from api.platform.env import env_flag, env_str
+
+SESSION_TTL_SEC = float(env_str("INGESTION_SESSION_TTL_SEC", "3600") or "3600")
+MAX_SESSIONS = int(env_str("INGESTION_MAX_SESSIONS", "1024") or "1024")
+SESSION_BACKEND = (env_str("INGESTION_SESSION_BACKEND", "memory") or "memory").lower()
+REDIS_URL = env_str("INGESTION_REDIS_URL", "redis://localhost:6379/0")
+_REDIS_KEY_PREFIX = "ingestion:session:"
+# Hash of session id -> JSON summary (plus expiry), kept in step with the session hashes
+# so GET /sessions is one HGETALL instead of a SCAN over every session key.
+_REDIS_INDEX_KEY = "ingestion:sessions:index"
+
+# Opt-in: an upload identical to one still waiting for its stream reuses that session.
+DEDUP_ENABLED = env_flag("INGESTION_DEDUP_ENABLED", False)
+DEDUP_TTL_SEC = float(env_str("INGESTION_DEDUP_TTL_SEC", "300") or "300")
+_REDIS_SEEN_PREFIX = "ingestion:seen:"
+
+if SESSION_BACKEND == "redis":
+    # Fail at startup, not on the first upload, when the optional dependency is missing.
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError(
+            "INGESTION_SESSION_BACKEND=redis requires the 'redis' package. Install with: pip install 'msaez2[redis]'"
+        ) from e
 
 
 @dataclass
@@ -25,40 +63,215 @@ class IngestionSession:
     created_objects: list[CreatedObject] = field(default_factory=list)
     error: Optional[str] = None
     content: str = ""
+    content_sha256: Optional[str] = None
+    # Set by `claim_stream()`: only the first /stream connection runs the workflow.
+    streaming: bool = False
+    last_active: float = field(default_factory=time.monotonic)
+
+
+# Active sessions (feature-local, in-memory), ordered least -> most recently active.
+_sessions: OrderedDict[str, IngestionSession] = OrderedDict()
+_lock = threading.Lock()
+# Public view of each entry in `_sessions` (what GET /sessions returns), kept in step with
+# session updates so listing does not rebuild it per poll. Entries are replaced, never mutated.
+_summaries: dict[str, dict] = {}
+# content sha256 -> (session id, dedup deadline), for DEDUP_ENABLED.
+_pending_by_sha: dict[str, tuple[str, float]] = {}
+
+
+def _touch(session: IngestionSession) -> None:
+    session.last_active = time.monotonic()
+    if session.id in _sessions:
+        _sessions.move_to_end(session.id)
+
+
+def _summarize(session: IngestionSession) -> dict:
+    return {"id": session.id, "status": session.status.value, "progress": session.progress, "message": session.message}
+
+
+def _evict_locked() -> None:
+    cutoff = time.monotonic() - SESSION_TTL_SEC
+    while _sessions:
+        oldest = next(iter(_sessions.values()))
+        if oldest.last_active >= cutoff and len(_sessions) <= MAX_SESSIONS:
+            break
+        _, evicted = _sessions.popitem(last=False)
+        _summaries.pop(evicted.id, None)
+        _forget_sha_locked(evicted)
+
+
+def _forget_sha_locked(session: IngestionSession) -> None:
+    entry = _pending_by_sha.get(session.content_sha256 or "")
+    if entry is not None and entry[0] == session.id:
+        del _pending_by_sha[session.content_sha256]
+
+
+_redis_client = None
 
 
-# Active sessions (feature-local, in-memory)
-_sessions: dict[str, IngestionSession] = {}
+def _redis():
+    """Shared client for the redis backend (the `redis` package is only needed then)."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+def _redis_save(session: IngestionSession, *, with_content: bool = False) -> None:
+    key = _REDIS_KEY_PREFIX + session.id
+    fields = {"status": session.status.value, "progress": session.progress, "message": session.message}
+    if with_content:
+        fields["content"] = session.content
+    index_entry = {**_summarize(session), "expires": time.time() + SESSION_TTL_SEC}
+    pipe = _redis().pipeline()
+    pipe.hset(key, mapping=fields)
+    pipe.expire(key, int(SESSION_TTL_SEC))
+    pipe.hset(_REDIS_INDEX_KEY, session.id, json.dumps(index_entry))
+    pipe.execute()
+
+
+def _redis_load(session_id: str) -> Optional[IngestionSession]:
+    data = _redis().hgetall(_REDIS_KEY_PREFIX + session_id)
+    if not data:
+        return None
+    return IngestionSession(
+        id=session_id,
+        status=IngestionPhase(data.get("status") or IngestionPhase.UPLOAD.value),
+        progress=int(data.get("progress") or 0),
+        message=data.get("message") or "",
+        content=data.get("content") or "",
+    )
+
+
+def _redis_list_summaries() -> list[dict]:
+    """Read the session index in one HGETALL, pruning entries whose session has expired."""
+    now = time.time()
+    summaries, stale = [], []
+    for session_id, raw in _redis().hgetall(_REDIS_INDEX_KEY).items():
+        entry = json.loads(raw)
+        if entry.pop("expires", 0) > now:
+            summaries.append(entry)
+        else:
+            stale.append(session_id)
+    if stale:
+        _redis().hdel(_REDIS_INDEX_KEY, *stale)
+    return summaries
 
 
 def get_session(session_id: str) -> Optional[IngestionSession]:
-    return _sessions.get(session_id)
+    with _lock:
+        _evict_locked()
+        session = _sessions.get(session_id)
+        if session is not None:
+            _touch(session)
+            return session
+    if SESSION_BACKEND != "redis":
+        return None
+
+    # Uploaded through another worker: adopt it here for the streaming run.
+    session = _redis_load(session_id)
+    if session is None:
+        return None
+    with _lock:
+        session = _sessions.setdefault(session_id, session)
+        _summaries.setdefault(session_id, _summarize(session))
+        _touch(session)
+        _evict_locked()
+    return session
 
 
-def create_session() -> IngestionSession:
-    session_id = str(uuid.uuid4())[:8]
-    session = IngestionSession(id=session_id)
-    _sessions[session_id] = session
+def create_session(content: str = "", content_sha256: Optional[str] = None) -> IngestionSession:
+    """New session for `content`; pass `content_sha256` to make it findable by `find_pending_session`."""
+    session_id = uuid.uuid4().hex[:8]
+    session = IngestionSession(id=session_id, content=content, content_sha256=content_sha256)
+    with _lock:
+        _sessions[session_id] = session
+        _summaries[session_id] = _summarize(session)
+        if content_sha256:
+            _pending_by_sha[content_sha256] = (session_id, time.monotonic() + DEDUP_TTL_SEC)
+        _evict_locked()
+    if SESSION_BACKEND == "redis":
+        _redis_save(session, with_content=True)
+        if content_sha256:
+            _redis().set(_REDIS_SEEN_PREFIX + content_sha256, session_id, ex=int(DEDUP_TTL_SEC))
     return session
 
 
+def find_pending_session(content_sha256: str) -> Optional[IngestionSession]:
+    """
+    Session created for the same content within INGESTION_DEDUP_TTL_SEC whose stream has
+    not started yet (a started run is not shared: each stream runs the workflow).
+    """
+    session_id = None
+    with _lock:
+        entry = _pending_by_sha.get(content_sha256)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                session_id = entry[0]
+            else:
+                del _pending_by_sha[content_sha256]
+    if SESSION_BACKEND == "redis":
+        # The stream may have started on another worker: its status is only current in Redis.
+        session_id = session_id or _redis().get(_REDIS_SEEN_PREFIX + content_sha256)
+        if session_id is None:
+            return None
+        status, streaming = _redis().hmget(_REDIS_KEY_PREFIX + session_id, "status", "streaming")
+        if status != IngestionPhase.UPLOAD.value or streaming:
+            return None
+    if session_id is None:
+        return None
+    session = get_session(session_id)
+    if session is None or session.streaming or session.status != IngestionPhase.UPLOAD:
+        return None
+    return session
+
+
+def claim_stream(session: IngestionSession) -> bool:
+    """
+    Mark `session` as being streamed. True for the first caller only, so a session shared by
+    deduplicated uploads (or reconnecting clients) runs its workflow once.
+    """
+    with _lock:
+        if session.streaming:
+            return False
+        session.streaming = True
+    if SESSION_BACKEND == "redis" and not _redis().hsetnx(_REDIS_KEY_PREFIX + session.id, "streaming", "1"):
+        return False  # claimed by a stream on another worker
+    return True
+
+
 def add_event(session: IngestionSession, event: ProgressEvent) -> None:
     """Add event to session and update status."""
+    phase_changed = session.status != event.phase
     session.events.append(event.model_dump())
     session.status = event.phase
     session.progress = event.progress
     session.message = event.message
+    with _lock:
+        if session.id in _sessions:
+            _summaries[session.id] = _summarize(session)
+        _touch(session)
+    if phase_changed and SESSION_BACKEND == "redis":
+        _redis_save(session)
 
 
 def delete_session(session_id: str) -> None:
-    _sessions.pop(session_id, None)
-
-
-def list_active_sessions() -> list[IngestionSession]:
-    return list(_sessions.values())
-
-
-def active_session_count() -> int:
-    return len(_sessions)
+    with _lock:
+        session = _sessions.pop(session_id, None)
+        _summaries.pop(session_id, None)
+        if session is not None:
+            _forget_sha_locked(session)
+    if SESSION_BACKEND == "redis":
+        pipe = _redis().pipeline()
+        pipe.delete(_REDIS_KEY_PREFIX + session_id)
+        pipe.hdel(_REDIS_INDEX_KEY, session_id)
+        pipe.execute()
 
 
+def list_session_summaries() -> list[dict]:
+    """{id, status, progress, message} for every active session."""
+    if SESSION_BACKEND == "redis":
+        return _redis_list_summaries()
+    with _lock:
+        _evict_locked()
+        return list(_summaries.values())
@@ -7,9 +7,11 @@ emitting real-time progress events for the UI (SSE).
 
 from __future__ import annotations
 
+import asyncio
 from typing import AsyncGenerator
 
 from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
+from api.features.ingestion.ingestion_graph_stats import invalidate_stats_cache
 from api.features.ingestion.ingestion_llm_runtime import get_llm
 from api.features.ingestion.ingestion_sessions import IngestionSession
 from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
@@ -20,25 +22,79 @@ from api.features.ingestion.workflow.phases.events import extract_events_phase
 from api.features.ingestion.workflow.phases.parsing import parsing_phase
 from api.features.ingestion.workflow.phases.policies import identify_policies_phase
 from api.features.ingestion.workflow.phases.user_stories import extract_user_stories_phase
+from api.platform.env import env_str, get_llm_provider_model
 from api.platform.observability.smart_logger import SmartLogger
 
 
+# While the workflow is busy (e.g. waiting on an LLM call), re-send the latest progress this
+# often so the SSE client sees the run is alive. 0 disables heartbeats.
+HEARTBEAT_INTERVAL_SEC = float(env_str("INGESTION_HEARTBEAT_SEC", "1.0") or "0")
+_QUEUE_MAX_EVENTS = 256
+_DONE = object()
+
+
 async def run_ingestion_workflow(session: IngestionSession, content: str) -> AsyncGenerator[ProgressEvent, None]:
     """
     Run the full ingestion workflow with streaming progress updates.
+
+    The phases run in a background task that feeds a queue; this generator drains it, so a
+    slow LLM call never keeps the consumer waiting without news (see HEARTBEAT_INTERVAL_SEC).
     """
     from api.features.ingestion.event_storming.neo4j_client import get_neo4j_client
 
     client = get_neo4j_client()
-    llm = get_llm()
-    ctx = IngestionWorkflowContext(session=session, content=content, client=client, llm=llm)
+    provider_model = get_llm_provider_model()
+    llm = get_llm(provider_model)
+    ctx = IngestionWorkflowContext(
+        session=session, content=content, client=client, llm=llm, provider_model=provider_model
+    )
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAX_EVENTS)
+
+    async def produce() -> None:
+        try:
+            # One Neo4j session for all of this run's writes (see Neo4jClient.shared_session).
+            with client.shared_session():
+                async for event in _run_phases(ctx):
+                    await queue.put(event)
+        finally:
+            # When the consumer cancelled us nobody is waiting for _DONE (and the queue may be full).
+            if not asyncio.current_task().cancelling():
+                await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    last: ProgressEvent | None = None
+    try:
+        while True:
+            if HEARTBEAT_INTERVAL_SEC > 0:
+                try:
+                    event = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL_SEC)
+                except asyncio.TimeoutError:
+                    if last is not None:
+                        yield ProgressEvent.model_construct(
+                            phase=last.phase, message=last.message, progress=last.progress, data={"heartbeat": True}
+                        )
+                    continue
+            else:
+                event = await queue.get()
+
+            if event is _DONE:
+                break
+            last = event
+            yield event
+    finally:
+        # Client went away (or we finished): stop the phases and their in-flight LLM calls.
+        producer.cancel()
+
 
+async def _run_phases(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
+    session = ctx.session
     try:
         SmartLogger.log(
             "INFO",
             "Ingestion workflow started",
             category="ingestion.workflow",
-            params={"session_id": session.id, "content_length": len(content)},
+            params={"session_id": session.id, "content_length": len(ctx.content)},
         )
 
         async for event in parsing_phase(ctx):
@@ -62,37 +118,32 @@ async def run_ingestion_workflow(session: IngestionSession, content: str) -> Asy
         async for event in identify_policies_phase(ctx):
             yield event
 
+        # Clients refresh on COMPLETE: don't serve them pre-run counts.
+        invalidate_stats_cache()
+
+        summary = {
+            "user_stories": len(ctx.user_stories),
+            "bounded_contexts": len(ctx.bounded_contexts),
+            "aggregates": sum(len(aggs) for aggs in ctx.aggregates_by_bc.values()),
+            "commands": sum(len(cmds) for cmds in ctx.commands_by_agg.values()),
+            "events": sum(len(evts) for evts in ctx.events_by_agg.values()),
+            "policies": len(ctx.policies),
+        }
         yield ProgressEvent(
             phase=IngestionPhase.COMPLETE,
             message="✅ 모델 생성 완료!",
             progress=100,
-            data={
-                "summary": {
-                    "user_stories": len(ctx.user_stories),
-                    "bounded_contexts": len(ctx.bounded_contexts),
-                    "aggregates": sum(len(aggs) for aggs in ctx.aggregates_by_bc.values()),
-                    "commands": sum(len(cmds) for cmds in ctx.commands_by_agg.values()),
-                    "events": sum(len(evts) for evts in ctx.events_by_agg.values()),
-                    "policies": len(ctx.policies),
-                }
-            },
+            data={"summary": summary},
         )
         SmartLogger.log(
             "INFO",
             "Ingestion workflow complete",
             category="ingestion.workflow",
-            params={
-                "session_id": session.id,
-                "user_stories": len(ctx.user_stories),
-                "bounded_contexts": len(ctx.bounded_contexts),
-                "aggregates": sum(len(aggs) for aggs in ctx.aggregates_by_bc.values()),
-                "commands": sum(len(cmds) for cmds in ctx.commands_by_agg.values()),
-                "events": sum(len(evts) for evts in ctx.events_by_agg.values()),
-                "policies": len(ctx.policies),
-            },
+            params={"session_id": session.id, **summary},
         )
 
     except Exception as e:
+        invalidate_stats_cache()  # earlier phases may have written already
         SmartLogger.log(
             "ERROR",
             "Ingestion workflow failed",
@@ -6,25 +6,32 @@ Business capability: parse incoming requirements documents into plain text for d
 
 from __future__ import annotations
 
+import io
+from typing import Iterator
+
 from fastapi import HTTPException
 
 from api.platform.observability.smart_logger import SmartLogger
 
 
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file using PyMuPDF."""
-    try:
-        import fitz  # PyMuPDF
+def iter_pdf_page_texts(file_content: bytes) -> Iterator[str]:
+    """Yield each page's text in order; only the current page is held by PyMuPDF."""
+    import fitz  # PyMuPDF
 
-        doc = fitz.open(stream=file_content, filetype="pdf")
-        text_parts: list[str] = []
+    with fitz.open(stream=file_content, filetype="pdf") as doc:
+        for page in doc:
+            yield page.get_text()
 
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text_parts.append(page.get_text())
 
-        doc.close()
-        return "\n".join(text_parts)
+def extract_text_from_pdf(file_content: bytes) -> str:
+    """Extract text from PDF file using PyMuPDF."""
+    try:
+        buf = io.StringIO()
+        for page_num, page_text in enumerate(iter_pdf_page_texts(file_content)):
+            if page_num:
+                buf.write("\n")
+            buf.write(page_text)
+        return buf.getvalue()
     except ImportError:
         SmartLogger.log(
             "ERROR",
@@ -43,7 +43,7 @@ User Story ID는 US-001, US-002 형식으로 순차적으로 부여하세요.
 """
 
 
-def extract_user_stories_from_text(text: str) -> list[GeneratedUserStory]:
+async def extract_user_stories_from_text(text: str) -> list[GeneratedUserStory]:
     """Extract user stories from text using LLM."""
     llm = get_llm()
     structured_llm = llm.with_structured_output(UserStoryList)
@@ -76,7 +76,7 @@ User Story는 명확하고 테스트 가능해야 합니다."""
         )
 
     t_llm0 = time.perf_counter()
-    response = structured_llm.invoke([SystemMessage(content=system_prompt), HumanMessage(content=prompt)])
+    response = await structured_llm.ainvoke([SystemMessage(content=system_prompt), HumanMessage(content=prompt)])
     llm_ms = int((time.perf_counter() - t_llm0) * 1000)
 
     if AI_AUDIT_LOG_ENABLED:
@@ -9,27 +9,33 @@ Business capability:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import sys
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
-from sse_starlette.sse import EventSourceResponse
+from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 from starlette.requests import Request
 
+from api.features.ingestion.ingestion_graph_stats import count_nodes_by_label, invalidate_stats_cache
 from api.features.ingestion.ingestion_sessions import (
-    active_session_count,
+    DEDUP_ENABLED,
+    SESSION_BACKEND,
     add_event,
+    claim_stream,
     create_session,
     delete_session,
+    find_pending_session,
     get_session,
-    list_active_sessions,
+    list_session_summaries,
 )
 from api.features.ingestion.ingestion_workflow_runner import run_ingestion_workflow
 from api.features.ingestion.requirements_document_text import extract_text_from_pdf
 from api.platform.observability.request_logging import (
     http_context,
-    sha256_bytes,
     sha256_text,
     summarize_for_log,
 )
@@ -43,6 +49,56 @@ if _PROJECT_ROOT and _PROJECT_ROOT not in sys.path:
 
 router = APIRouter(prefix="/api/ingest", tags=["ingestion"])
 
+_T = TypeVar("_T")
+
+_CLEAR_ALL_BATCH_ROWS = 10000
+
+# Text uploads at/above this size are decoded in a worker thread, like PDF parsing.
+_THREADED_DECODE_BYTES = 1024 * 1024
+
+
+# Uploads are read (and hashed) in chunks of this size.
+_UPLOAD_READ_CHUNK = 64 * 1024
+
+
+async def _read_upload(file: UploadFile) -> tuple[bytearray, str]:
+    """Read an upload into one growing buffer, hashing each chunk as it arrives (bytes, sha256)."""
+    buf = bytearray()
+    digest = hashlib.sha256(usedforsecurity=False)
+    while chunk := await file.read(_UPLOAD_READ_CHUNK):
+        digest.update(chunk)
+        buf += chunk
+    return buf, digest.hexdigest()
+
+
+def _decode_text(file_content: bytes | bytearray) -> str:
+    try:
+        return file_content.decode("utf-8")
+    except UnicodeDecodeError:
+        return file_content.decode("latin-1")
+
+
+async def _session_store(fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Call an ingestion_sessions function; the Redis backend does blocking I/O, so off the loop."""
+    if SESSION_BACKEND == "redis":
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+def _weak_etag(body: Any) -> str:
+    digest = hashlib.blake2b(
+        json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
 
 @router.post("/upload")
 async def upload_document(
@@ -57,20 +113,20 @@ async def upload_document(
     content = ""
 
     if file:
-        file_content = await file.read()
+        file_content, file_sha256 = await _read_upload(file)
         filename = file.filename or ""
         SmartLogger.log(
             "INFO",
             "Ingestion upload received (file): reading file bytes and extracting text.",
             category="ingestion.api.upload.inputs",
-            params={
+            params=lambda: {
                 **http_context(request),
                 "inputs": {
                     "file": {
                         "filename": filename,
                         "content_type": getattr(file, "content_type", None),
                         "bytes": len(file_content),
-                        "sha256": sha256_bytes(file_content),
+                        "sha256": file_sha256,
                     },
                     "text_form_provided": bool(text),
                 },
@@ -84,19 +140,20 @@ async def upload_document(
         )
 
         if filename.lower().endswith(".pdf"):
-            content = extract_text_from_pdf(file_content)
+            # CPU-bound parsing: keep it off the event loop serving other SSE streams.
+            content = await asyncio.to_thread(extract_text_from_pdf, file_content)
+        elif len(file_content) >= _THREADED_DECODE_BYTES:
+            content = await asyncio.to_thread(_decode_text, file_content)
         else:
-            try:
-                content = file_content.decode("utf-8")
-            except UnicodeDecodeError:
-                content = file_content.decode("latin-1")
+            content = _decode_text(file_content)
     elif text:
         content = text
         SmartLogger.log(
             "INFO",
             "Ingestion upload received (text): starting ingestion session from raw text.",
             category="ingestion.api.upload.inputs",
-            params={**http_context(request), "inputs": {"text": summarize_for_log(text), "text_sha256": sha256_text(text)}},
+            # Hash and preview are logged once, with "Ingestion content prepared" below.
+            params=lambda: {**http_context(request), "inputs": {"text_chars": len(text)}},
         )
         SmartLogger.log("INFO", "Upload received (text)", category="ingestion.api.upload", params={"chars": len(content)})
     else:
@@ -104,7 +161,7 @@ async def upload_document(
             "WARNING",
             "Ingestion upload rejected: neither 'file' nor 'text' was provided.",
             category="ingestion.api.upload.invalid",
-            params=http_context(request),
+            params=lambda: http_context(request),
         )
         raise HTTPException(status_code=400, detail="Either 'file' or 'text' must be provided")
 
@@ -113,22 +170,37 @@ async def upload_document(
             "WARNING",
             "Ingestion upload rejected: extracted content is empty after parsing.",
             category="ingestion.api.upload.empty",
-            params={**http_context(request), "content_len": len(content)},
+            params=lambda: {**http_context(request), "content_len": len(content)},
         )
         raise HTTPException(status_code=400, detail="Document content is empty")
 
+    # Only hashed up front when dedup needs it; otherwise just for the log below, if emitted.
+    content_sha256 = sha256_text(content) if DEDUP_ENABLED else None
     SmartLogger.log(
         "INFO",
         "Ingestion content prepared: extracted text ready for workflow.",
         category="ingestion.api.upload.content",
-        params={
+        params=lambda: {
             **http_context(request),
-            "content": {"len": len(content), "sha256": sha256_text(content), "preview": summarize_for_log(content)},
+            "content": {
+                "len": len(content),
+                "sha256": content_sha256 or sha256_text(content),
+                "preview": summarize_for_log(content),
+            },
         },
     )
+    preview = content[:500] + "..." if len(content) > 500 else content
+
+    if content_sha256 and (pending := await _session_store(find_pending_session, content_sha256)) is not None:
+        SmartLogger.log(
+            "INFO",
+            "Ingestion upload deduplicated: identical content is already waiting to be streamed.",
+            category="ingestion.api.upload.deduped",
+            params=lambda: {**http_context(request), "session_id": pending.id, "content_sha256": content_sha256},
+        )
+        return {"session_id": pending.id, "content_length": len(content), "preview": preview, "cached": True}
 
-    session = create_session()
-    session.content = content
+    session = await _session_store(create_session, content, content_sha256=content_sha256)
     SmartLogger.log(
         "INFO",
         "Ingestion session created",
@@ -136,7 +208,7 @@ async def upload_document(
         params={"session_id": session.id, "content_length": len(content)},
     )
 
-    return {"session_id": session.id, "content_length": len(content), "preview": content[:500] + "..." if len(content) > 500 else content}
+    return {"session_id": session.id, "content_length": len(content), "preview": preview}
 
 
 @router.get("/stream/{session_id}")
@@ -145,22 +217,31 @@ async def stream_progress(session_id: str, request: Request):
     SSE endpoint for streaming ingestion progress.
     Client should connect after receiving session_id from /upload.
     """
-    session = get_session(session_id)
+    session = await _session_store(get_session, session_id)
 
     if not session:
         SmartLogger.log(
             "WARNING",
             "Ingestion stream requested for missing session: client may be using an expired/invalid session_id.",
             category="ingestion.api.stream.not_found",
-            params={**http_context(request), "inputs": {"session_id": session_id}, "active_sessions": active_session_count()},
+            params=lambda: {**http_context(request), "inputs": {"session_id": session_id}},
         )
         raise HTTPException(status_code=404, detail="Session not found")
 
+    if not await _session_store(claim_stream, session):
+        SmartLogger.log(
+            "WARNING",
+            "Ingestion stream rejected: another connection is already streaming this session.",
+            category="ingestion.api.stream.conflict",
+            params=lambda: {**http_context(request), "inputs": {"session_id": session_id}},
+        )
+        raise HTTPException(status_code=409, detail="Session is already being streamed")
+
     SmartLogger.log(
         "INFO",
         "Ingestion stream connected: starting SSE progress events for workflow execution.",
         category="ingestion.api.stream.connected",
-        params={**http_context(request), "inputs": {"session_id": session_id}},
+        params=lambda: {**http_context(request), "inputs": {"session_id": session_id}},
     )
 
     async def event_generator():
@@ -168,36 +249,40 @@ async def stream_progress(session_id: str, request: Request):
             "INFO",
             "Ingestion stream generator started: emitting 'progress' SSE events.",
             category="ingestion.api.stream.generator_start",
-            params={**http_context(request), "inputs": {"session_id": session_id}},
+            params=lambda: {**http_context(request), "inputs": {"session_id": session_id}},
         )
         async for event in run_ingestion_workflow(session, session.content):
-            add_event(session, event)
-            yield {"event": "progress", "data": event.model_dump_json()}
+            if not (event.data or {}).get("heartbeat"):
+                await _session_store(add_event, session, event)
+            # ServerSentEvent goes straight to the encoder (a dict is first re-wrapped into one).
+            yield ServerSentEvent(data=event.model_dump_json(exclude_none=True), event="progress")
 
-        delete_session(session_id)
+        await _session_store(delete_session, session_id)
         SmartLogger.log(
             "INFO",
             "Ingestion session cleaned up: workflow completed and session removed from memory.",
             category="ingestion.api.stream.cleaned",
-            params={**http_context(request), "inputs": {"session_id": session_id}},
+            params=lambda: {**http_context(request), "inputs": {"session_id": session_id}},
         )
 
     return EventSourceResponse(event_generator())
 
 
 @router.get("/sessions")
-async def list_sessions(request: Request) -> list[dict[str, Any]]:
-    """List all active ingestion sessions."""
+async def list_sessions(request: Request, response: Response) -> list[dict[str, Any]]:
+    """List all active ingestion sessions (ETag-aware: unchanged polls get 304)."""
+    body = await _session_store(list_session_summaries)
     SmartLogger.log(
         "INFO",
-        "List ingestion sessions: returning in-memory active sessions.",
+        "List ingestion sessions: returning active sessions.",
         category="ingestion.api.sessions.request",
-        params={**http_context(request), "active": active_session_count()},
+        params=lambda: {**http_context(request), "active": len(body)},
     )
-    return [
-        {"id": s.id, "status": s.status.value, "progress": s.progress, "message": s.message}
-        for s in list_active_sessions()
-    ]
+    etag = _weak_etag(body)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return body
 
 
 @router.delete("/clear-all")
@@ -214,28 +299,26 @@ async def clear_all_data(request: Request) -> dict[str, Any]:
             "WARNING",
             "Clear-all requested: deleting all nodes/relationships from Neo4j (destructive).",
             category="ingestion.api.clear_all.request",
-            params=http_context(request),
+            params=lambda: http_context(request),
         )
         with client.session() as session:
-            count_query = """
+            before_counts = count_nodes_by_label(use_cache=False, session=session)
+            # Delete in fixed-size transactions so memory/locks stay bounded on large graphs
+            # (needs an auto-commit transaction, hence session.run).
+            delete_query = f"""
             MATCH (n)
-            WITH labels(n)[0] as label, count(n) as count
-            RETURN collect({label: label, count: count}) as counts
+            CALL {{
+                WITH n
+                DETACH DELETE n
+            }} IN TRANSACTIONS OF {_CLEAR_ALL_BATCH_ROWS} ROWS
             """
-            result = session.run(count_query)
-            record = result.single()
-            before_counts = {item["label"]: item["count"] for item in record["counts"]} if record else {}
-
-            delete_query = """
-            MATCH (n)
-            DETACH DELETE n
-            """
-            session.run(delete_query)
+            session.run(delete_query).consume()
+            invalidate_stats_cache()
             SmartLogger.log(
                 "INFO",
                 "Clear-all completed: Neo4j graph wiped.",
                 category="ingestion.api.clear_all.done",
-                params={**http_context(request), "deleted": before_counts},
+                params=lambda: {**http_context(request), "deleted": before_counts},
             )
 
             return {"success": True, "message": "모든 데이터가 삭제되었습니다", "deleted": before_counts}
@@ -244,52 +327,44 @@ async def clear_all_data(request: Request) -> dict[str, Any]:
             "ERROR",
             "Clear-all failed: Neo4j delete operation raised an exception.",
             category="ingestion.api.clear_all.error",
-            params={**http_context(request), "error": {"type": type(e).__name__, "message": str(e)}},
+            params=lambda: {**http_context(request), "error": {"type": type(e).__name__, "message": str(e)}},
         )
         return {"success": False, "message": f"삭제 실패: {str(e)}", "deleted": {}}
 
 
 @router.get("/stats")
-async def get_data_stats(request: Request) -> dict[str, Any]:
+async def get_data_stats(request: Request, response: Response) -> dict[str, Any]:
     """
-    Get current data statistics from Neo4j.
+    Get current data statistics from Neo4j (ETag-aware: unchanged polls get 304).
     """
-    from api.features.ingestion.event_storming.neo4j_client import get_neo4j_client
-
-    client = get_neo4j_client()
-
     try:
         SmartLogger.log(
             "INFO",
             "Ingestion stats requested: counting Neo4j nodes by label.",
             category="ingestion.api.stats.request",
-            params=http_context(request),
+            params=lambda: http_context(request),
+        )
+        counts = count_nodes_by_label()
+        total = sum(counts.values())
+        SmartLogger.log(
+            "INFO",
+            "Ingestion stats returned.",
+            category="ingestion.api.stats.done",
+            params=lambda: {**http_context(request), "total": total, "counts": counts},
         )
-        with client.session() as session:
-            query = """
-            MATCH (n)
-            WITH labels(n)[0] as label, count(n) as count
-            RETURN collect({label: label, count: count}) as counts
-            """
-            result = session.run(query)
-            record = result.single()
-            counts = {item["label"]: item["count"] for item in record["counts"]} if record else {}
-
-            total = sum(counts.values())
-            SmartLogger.log(
-                "INFO",
-                "Ingestion stats returned.",
-                category="ingestion.api.stats.done",
-                params={**http_context(request), "total": total, "counts": counts},
-            )
 
-            return {"total": total, "counts": counts, "hasData": total > 0}
+        body = {"total": total, "counts": counts, "hasData": total > 0}
+        etag = _weak_etag(body)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return body
     except Exception as e:
         SmartLogger.log(
             "ERROR",
             "Ingestion stats failed: Neo4j count query raised an exception.",
             category="ingestion.api.stats.error",
-            params={**http_context(request), "error": {"type": type(e).__name__, "message": str(e)}},
+            params=lambda: {**http_context(request), "error": {"type": type(e).__name__, "message": str(e)}},
         )
         return {"total": 0, "counts": {}, "hasData": False, "error": str(e)}
 
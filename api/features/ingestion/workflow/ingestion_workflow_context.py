@@ -1,9 +1,48 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from api.features.ingestion.ingestion_sessions import IngestionSession
+from api.platform.env import env_str, get_llm_provider_model
+
+# Optional delay (seconds) after each streamed object, for demos; 0 streams as fast as the work runs.
+UI_PACING_DELAY = float(env_str("INGESTION_UI_DELAY", "0") or "0")
+
+
+async def ui_pacing_pause() -> None:
+    if UI_PACING_DELAY > 0:
+        await asyncio.sleep(UI_PACING_DELAY)
+
+
+def match_aggregate(item: Any, aggregates: list[Any]) -> Optional[str]:
+    """
+    Aggregate id a per-BC LLM item (carrying `aggregate_id`) belongs to, or None.
+
+    Items naming an unknown aggregate go to the BC's only aggregate when there is just one.
+    """
+    agg_id = getattr(item, "aggregate_id", None)
+    if any(agg.id == agg_id for agg in aggregates):
+        return agg_id
+    return aggregates[0].id if len(aggregates) == 1 else None
+
+
+def group_by_aggregate(items: list[Any], aggregates: list[Any]) -> tuple[Dict[str, list[Any]], list[Any]]:
+    """
+    Split per-BC LLM output into {aggregate id: items} (see `match_aggregate`), keeping order.
+
+    Items that match no aggregate are returned as unmatched.
+    """
+    grouped: Dict[str, list[Any]] = {agg.id: [] for agg in aggregates}
+    unmatched: list[Any] = []
+    for item in items:
+        agg_id = match_aggregate(item, aggregates)
+        if agg_id is None:
+            unmatched.append(item)
+        else:
+            grouped[agg_id].append(item)
+    return grouped, unmatched
 
 
 @dataclass
@@ -18,6 +57,8 @@ class IngestionWorkflowContext:
     content: str
     client: Any
     llm: Any
+    # (provider, model) read from env once at run start, so every phase logs/caches the same values.
+    provider_model: tuple[str, str] = field(default_factory=get_llm_provider_model)
 
     user_stories: list[Any] = field(default_factory=list)
     bounded_contexts: list[Any] = field(default_factory=list)
@@ -27,4 +68,17 @@ class IngestionWorkflowContext:
     events_by_agg: Dict[str, Any] = field(default_factory=dict)
     policies: List[Any] = field(default_factory=list)
 
+    # Prompt lines for the policy phase, appended as commands/events are extracted.
+    command_lines_by_bc_id: Dict[str, List[str]] = field(default_factory=dict)
+    event_lines: List[str] = field(default_factory=list)
+
+    structured_llms: Dict[type, Any] = field(default_factory=dict)
+
+    def structured_llm(self, schema: type) -> Any:
+        """`llm.with_structured_output(schema)`, built once per schema for this run."""
+        runnable = self.structured_llms.get(schema)
+        if runnable is None:
+            runnable = self.structured_llms[schema] = self.llm.with_structured_output(schema)
+        return runnable
+
 
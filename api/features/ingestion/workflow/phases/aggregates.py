@@ -1,24 +1,25 @@
 from __future__ import annotations
 
-import asyncio
 import time
 from typing import Any, AsyncGenerator
 
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from api.platform.env import (
-    AI_AUDIT_LOG_ENABLED,
-    AI_AUDIT_LOG_FULL_OUTPUT,
-    AI_AUDIT_LOG_FULL_PROMPT,
-)
 from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
 from api.features.ingestion.event_storming.nodes import AggregateList
 from api.features.ingestion.event_storming.prompts import EXTRACT_AGGREGATES_PROMPT, SYSTEM_PROMPT
-from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
-from api.platform.env import get_llm_provider_model
+from api.features.ingestion.ingestion_llm_runtime import (
+    audit_log,
+    audit_prompt,
+    audit_response,
+    cached_structured_invoke,
+    compile_prompt,
+)
+from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext, ui_pacing_pause
 from api.platform.observability.request_logging import sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+_render_prompt = compile_prompt(EXTRACT_AGGREGATES_PROMPT)
+
 
 async def extract_aggregates_phase(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
     """
@@ -27,13 +28,14 @@ async def extract_aggregates_phase(ctx: IngestionWorkflowContext) -> AsyncGenera
     yield ProgressEvent(phase=IngestionPhase.EXTRACTING_AGGREGATES, message="Aggregate 추출 중...", progress=45)
 
     all_aggregates: dict[str, Any] = {}
+    aggregate_rows: list[dict[str, Any]] = []
     progress_per_bc = 10 // max(len(ctx.bounded_contexts), 1)
 
     for bc_idx, bc in enumerate(ctx.bounded_contexts):
         bc_id_short = bc.id.replace("BC-", "")
         breakdowns_text = f"User Stories: {', '.join(bc.user_story_ids)}"
 
-        prompt = EXTRACT_AGGREGATES_PROMPT.format(
+        prompt = _render_prompt(
             bc_name=bc.name,
             bc_id=bc.id,
             bc_id_short=bc_id_short,
@@ -41,51 +43,50 @@ async def extract_aggregates_phase(ctx: IngestionWorkflowContext) -> AsyncGenera
             breakdowns=breakdowns_text,
         )
 
-        structured_llm = ctx.llm.with_structured_output(AggregateList)
-
-        provider, model = get_llm_provider_model()
-        if AI_AUDIT_LOG_ENABLED:
-            SmartLogger.log(
-                "INFO",
-                "Ingestion: extract aggregates - LLM invoke starting.",
-                category="ingestion.llm.extract_aggregates.start",
-                params={
-                    "session_id": ctx.session.id,
-                    "llm": {"provider": provider, "model": model},
-                    "bc": {"id": bc.id, "name": bc.name},
-                    "prompt_len": len(prompt),
-                    "prompt_sha256": sha256_text(prompt),
-                    "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                    "system_sha256": sha256_text(SYSTEM_PROMPT),
-                }
-            )
+        prompt_sha256 = sha256_text(prompt)
+        provider, model = ctx.provider_model
+        audit_log(
+            "Ingestion: extract aggregates - LLM invoke starting.",
+            "ingestion.llm.extract_aggregates.start",
+            lambda: {
+                "session_id": ctx.session.id,
+                "llm": {"provider": provider, "model": model},
+                "bc": {"id": bc.id, "name": bc.name},
+                "prompt_len": len(prompt),
+                "prompt_sha256": prompt_sha256,
+                "prompt": audit_prompt(prompt),
+                "system_sha256": _SYSTEM_PROMPT_SHA256,
+            },
+        )
 
         t_llm0 = time.perf_counter()
-        agg_response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+        agg_response, cache_hit = await cached_structured_invoke(
+            ctx.structured_llm(AggregateList),
+            AggregateList,
+            SYSTEM_PROMPT,
+            prompt,
+            system_sha256=_SYSTEM_PROMPT_SHA256,
+            prompt_sha256=prompt_sha256,
+            provider_model=ctx.provider_model,
+        )
         llm_ms = int((time.perf_counter() - t_llm0) * 1000)
 
-        if AI_AUDIT_LOG_ENABLED:
-            try:
-                resp_dump = agg_response.model_dump() if hasattr(agg_response, "model_dump") else agg_response.dict()
-            except Exception:
-                resp_dump = {"__type__": type(agg_response).__name__, "__repr__": repr(agg_response)[:1000]}
-            aggs = getattr(agg_response, "aggregates", []) or []
-            SmartLogger.log(
-                "INFO",
-                "Ingestion: extract aggregates - LLM invoke completed.",
-                category="ingestion.llm.extract_aggregates.done",
-                params={
-                    "session_id": ctx.session.id,
-                    "llm": {"provider": provider, "model": model},
-                    "bc": {"id": bc.id, "name": bc.name},
-                    "llm_ms": llm_ms,
-                    "result": {
-                        "aggregates_count": len(aggs),
-                        "aggregate_ids": summarize_for_log([getattr(a, "id", None) for a in aggs]),
-                        "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
-                    },
-                }
-            )
+        audit_log(
+            "Ingestion: extract aggregates - LLM invoke completed.",
+            "ingestion.llm.extract_aggregates.done",
+            lambda: {
+                "session_id": ctx.session.id,
+                "llm": {"provider": provider, "model": model},
+                "bc": {"id": bc.id, "name": bc.name},
+                "llm_ms": llm_ms,
+                "cache_hit": cache_hit,
+                "result": {
+                    "aggregates_count": len(agg_response.aggregates),
+                    "aggregate_ids": summarize_for_log([getattr(a, "id", None) for a in agg_response.aggregates]),
+                    "response": audit_response(agg_response),
+                },
+            },
+        )
 
         aggregates = agg_response.aggregates
         all_aggregates[bc.id] = aggregates
@@ -98,22 +99,40 @@ async def extract_aggregates_phase(ctx: IngestionWorkflowContext) -> AsyncGenera
         )
 
         for agg in aggregates:
-            ctx.client.create_aggregate(
-                id=agg.id,
-                name=agg.name,
-                bc_id=bc.id,
-                root_entity=agg.root_entity,
-                invariants=agg.invariants,
+            aggregate_rows.append(
+                {
+                    "id": agg.id,
+                    "name": agg.name,
+                    "bc_id": bc.id,
+                    "root_entity": agg.root_entity,
+                    "invariants": agg.invariants,
+                }
             )
 
-            yield ProgressEvent(
-                phase=IngestionPhase.EXTRACTING_AGGREGATES,
-                message=f"Aggregate 생성: {agg.name}",
-                progress=45 + progress_per_bc * bc_idx,
-                data={"type": "Aggregate", "object": {"id": agg.id, "name": agg.name, "type": "Aggregate", "parentId": bc.id}},
+            yield ProgressEvent.compact(
+                IngestionPhase.EXTRACTING_AGGREGATES,
+                f"Aggregate 생성: {agg.name}",
+                45 + progress_per_bc * bc_idx,
+                object_type="Aggregate",
+                object_id=agg.id,
+                name=agg.name,
+                parent_id=bc.id,
             )
-            await asyncio.sleep(0.15)
-
+            await ui_pacing_pause()
+
+    # One UNWIND write for the whole phase; commands MATCH these aggregates next.
+    try:
+        ctx.client.bulk_create_aggregates(aggregate_rows)
+    except Exception:
+        # The aggregates above were announced before the write: withdraw them, then fail the run.
+        yield ProgressEvent.retraction(
+            IngestionPhase.EXTRACTING_AGGREGATES,
+            "Aggregate 저장 실패",
+            55,
+            object_type="Aggregate",
+            object_ids=[row["id"] for row in aggregate_rows],
+        )
+        raise
     ctx.aggregates_by_bc = all_aggregates
 
 
@@ -1,24 +1,23 @@
 from __future__ import annotations
 
-import asyncio
 import time
 from typing import AsyncGenerator
 
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from api.platform.env import (
-    AI_AUDIT_LOG_ENABLED,
-    AI_AUDIT_LOG_FULL_OUTPUT,
-    AI_AUDIT_LOG_FULL_PROMPT,
-)
 from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
 from api.features.ingestion.event_storming.nodes import BoundedContextList
 from api.features.ingestion.event_storming.prompts import IDENTIFY_BC_FROM_STORIES_PROMPT, SYSTEM_PROMPT
-from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
-from api.platform.env import get_llm_provider_model
+from api.features.ingestion.ingestion_llm_runtime import (
+    audit_log,
+    audit_prompt,
+    audit_response,
+    cached_structured_invoke,
+)
+from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext, ui_pacing_pause
 from api.platform.observability.request_logging import sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+
 
 async def identify_bounded_contexts_phase(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
     """
@@ -30,51 +29,51 @@ async def identify_bounded_contexts_phase(ctx: IngestionWorkflowContext) -> Asyn
         [f"[{us.id}] As a {us.role}, I want to {us.action}, so that {us.benefit}" for us in ctx.user_stories]
     )
 
-    structured_llm = ctx.llm.with_structured_output(BoundedContextList)
     prompt = IDENTIFY_BC_FROM_STORIES_PROMPT.format(user_stories=stories_text)
 
-    provider, model = get_llm_provider_model()
-    if AI_AUDIT_LOG_ENABLED:
-        SmartLogger.log(
-            "INFO",
-            "Ingestion: identify BCs - LLM invoke starting.",
-            category="ingestion.llm.identify_bc.start",
-            params={
-                "session_id": ctx.session.id,
-                "llm": {"provider": provider, "model": model},
-                "user_stories_count": len(ctx.user_stories),
-                "prompt_len": len(prompt),
-                "prompt_sha256": sha256_text(prompt),
-                "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                "system_sha256": sha256_text(SYSTEM_PROMPT),
-            }
-        )
+    prompt_sha256 = sha256_text(prompt)
+    provider, model = ctx.provider_model
+    audit_log(
+        "Ingestion: identify BCs - LLM invoke starting.",
+        "ingestion.llm.identify_bc.start",
+        lambda: {
+            "session_id": ctx.session.id,
+            "llm": {"provider": provider, "model": model},
+            "user_stories_count": len(ctx.user_stories),
+            "prompt_len": len(prompt),
+            "prompt_sha256": prompt_sha256,
+            "prompt": audit_prompt(prompt),
+            "system_sha256": _SYSTEM_PROMPT_SHA256,
+        },
+    )
 
     t_llm0 = time.perf_counter()
-    bc_response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
+    bc_response, cache_hit = await cached_structured_invoke(
+        ctx.structured_llm(BoundedContextList),
+        BoundedContextList,
+        SYSTEM_PROMPT,
+        prompt,
+        system_sha256=_SYSTEM_PROMPT_SHA256,
+        prompt_sha256=prompt_sha256,
+        provider_model=ctx.provider_model,
+    )
     llm_ms = int((time.perf_counter() - t_llm0) * 1000)
 
-    if AI_AUDIT_LOG_ENABLED:
-        try:
-            resp_dump = bc_response.model_dump() if hasattr(bc_response, "model_dump") else bc_response.dict()
-        except Exception:
-            resp_dump = {"__type__": type(bc_response).__name__, "__repr__": repr(bc_response)[:1000]}
-        bcs = getattr(bc_response, "bounded_contexts", []) or []
-        SmartLogger.log(
-            "INFO",
-            "Ingestion: identify BCs - LLM invoke completed.",
-            category="ingestion.llm.identify_bc.done",
-            params={
-                "session_id": ctx.session.id,
-                "llm": {"provider": provider, "model": model},
-                "llm_ms": llm_ms,
-                "result": {
-                    "bounded_contexts_count": len(bcs),
-                    "bounded_context_ids": summarize_for_log([getattr(bc, "id", None) for bc in bcs]),
-                    "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
-                },
-            }
-        )
+    audit_log(
+        "Ingestion: identify BCs - LLM invoke completed.",
+        "ingestion.llm.identify_bc.done",
+        lambda: {
+            "session_id": ctx.session.id,
+            "llm": {"provider": provider, "model": model},
+            "llm_ms": llm_ms,
+            "cache_hit": cache_hit,
+            "result": {
+                "bounded_contexts_count": len(bc_response.bounded_contexts),
+                "bounded_context_ids": summarize_for_log([getattr(bc, "id", None) for bc in bc_response.bounded_contexts]),
+                "response": audit_response(bc_response),
+            },
+        },
+    )
 
     bc_candidates = bc_response.bounded_contexts
     ctx.bounded_contexts = bc_candidates
@@ -86,15 +85,30 @@ async def identify_bounded_contexts_phase(ctx: IngestionWorkflowContext) -> Asyn
         params={"session_id": ctx.session.id, "count": len(bc_candidates), "ids": [bc.id for bc in bc_candidates][:10]},
     )
 
-    for bc_idx, bc in enumerate(bc_candidates):
-        ctx.client.create_bounded_context(id=bc.id, name=bc.name, description=bc.description)
+    ctx.client.bulk_create_bounded_contexts(
+        [{"id": bc.id, "name": bc.name, "description": bc.description, "owner": None} for bc in bc_candidates]
+    )
+    stories_linked = True
+    try:
+        ctx.client.bulk_link_user_stories_to_bc(
+            [{"user_story_id": us_id, "bc_id": bc.id} for bc in bc_candidates for us_id in bc.user_story_ids]
+        )
+    except Exception as e:
+        SmartLogger.log(
+            "WARNING",
+            "User story to BC link skipped",
+            category="ingestion.neo4j.us_to_bc",
+            params={"session_id": ctx.session.id, "bc_ids": [bc.id for bc in bc_candidates][:10], "error": str(e)},
+        )
+        stories_linked = False
+        yield ProgressEvent(phase=IngestionPhase.IDENTIFYING_BC, message=f"User Story 연결 실패: {e}", progress=30)
 
-        yield ProgressEvent(
+    for bc_idx, bc in enumerate(bc_candidates):
+        yield ProgressEvent.model_construct(
             phase=IngestionPhase.IDENTIFYING_BC,
             message=f"Bounded Context 생성: {bc.name}",
             progress=30 + (10 * bc_idx // max(len(bc_candidates), 1)),
             data={
-                "type": "BoundedContext",
                 "object": {
                     "id": bc.id,
                     "name": bc.name,
@@ -104,27 +118,17 @@ async def identify_bounded_contexts_phase(ctx: IngestionWorkflowContext) -> Asyn
                 },
             },
         )
-        await asyncio.sleep(0.2)
-
-        for us_id in bc.user_story_ids:
-            try:
-                ctx.client.link_user_story_to_bc(us_id, bc.id)
-                yield ProgressEvent(
-                    phase=IngestionPhase.IDENTIFYING_BC,
-                    message=f"User Story {us_id} → {bc.name}",
-                    progress=30 + (10 * bc_idx // max(len(bc_candidates), 1)),
-                    data={
-                        "type": "UserStoryAssigned",
-                        "object": {"id": us_id, "type": "UserStory", "targetBcId": bc.id, "targetBcName": bc.name},
-                    },
-                )
-                await asyncio.sleep(0.1)
-            except Exception as e:
-                SmartLogger.log(
-                    "WARNING",
-                    "User story to BC link skipped",
-                    category="ingestion.neo4j.us_to_bc",
-                    params={"session_id": ctx.session.id, "user_story_id": us_id, "bc_id": bc.id, "error": str(e)},
-                )
-
-
+        await ui_pacing_pause()
+
+        # Assignments are animated only when the links were actually saved.
+        for us_id in bc.user_story_ids if stories_linked else ():
+            yield ProgressEvent.model_construct(
+                phase=IngestionPhase.IDENTIFYING_BC,
+                message=f"User Story {us_id} → {bc.name}",
+                progress=30 + (10 * bc_idx // max(len(bc_candidates), 1)),
+                data={
+                    "type": "UserStoryAssigned",
+                    "object": {"id": us_id, "type": "UserStory", "targetBcId": bc.id, "targetBcName": bc.name},
+                },
+            )
+            await ui_pacing_pause()
@@ -4,124 +4,205 @@ import asyncio
 import time
 from typing import Any, AsyncGenerator
 
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from api.platform.env import (
-    AI_AUDIT_LOG_ENABLED,
-    AI_AUDIT_LOG_FULL_OUTPUT,
-    AI_AUDIT_LOG_FULL_PROMPT,
-)
 from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
-from api.features.ingestion.event_storming.nodes import CommandList
-from api.features.ingestion.event_storming.prompts import EXTRACT_COMMANDS_PROMPT, SYSTEM_PROMPT
-from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
-from api.platform.env import get_llm_provider_model
+from api.features.ingestion.event_storming.nodes import BCCommandList
+from api.features.ingestion.event_storming.prompts import EXTRACT_COMMANDS_FOR_BC_PROMPT, SYSTEM_PROMPT
+from api.features.ingestion.ingestion_llm_runtime import (
+    audit_log,
+    audit_prompt,
+    audit_response,
+    cached_structured_stream,
+    compile_prompt,
+)
+from api.features.ingestion.workflow.ingestion_workflow_context import (
+    IngestionWorkflowContext,
+    group_by_aggregate,
+    match_aggregate,
+    ui_pacing_pause,
+)
 from api.platform.observability.request_logging import sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+_render_prompt = compile_prompt(EXTRACT_COMMANDS_FOR_BC_PROMPT)
+
 
 async def extract_commands_phase(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
     """
-    Phase 5: extract commands per aggregate and persist them.
+    Phase 5: extract commands for every aggregate (one LLM call per BC) and persist them.
     """
     yield ProgressEvent(phase=IngestionPhase.EXTRACTING_COMMANDS, message="Command 추출 중...", progress=60)
 
     all_commands: dict[str, Any] = {}
 
-    for bc in ctx.bounded_contexts:
-        bc_id_short = bc.id.replace("BC-", "")
-        bc_aggregates = ctx.aggregates_by_bc.get(bc.id, [])
-
-        for agg in bc_aggregates:
-            stories_context = "\n".join(
-                [f"[{us.id}] As a {us.role}, I want to {us.action}" for us in ctx.user_stories if us.id in bc.user_story_ids]
+    us_by_id = {us.id: us for us in ctx.user_stories}
+
+    async def extract_for(bc: Any, aggregates: list[Any], stream: asyncio.Queue) -> dict[str, list[Any]]:
+        """Grouped commands for `bc`; each command is also put on `stream` once complete, then None."""
+        try:
+            return await _extract(bc, aggregates, stream)
+        finally:
+            stream.put_nowait(None)
+
+    async def _extract(bc: Any, aggregates: list[Any], stream: asyncio.Queue) -> dict[str, list[Any]]:
+        stories_context = "\n".join(
+            f"[{us.id}] As a {us.role}, I want to {us.action}"
+            for us in (us_by_id.get(uid) for uid in bc.user_story_ids)
+            if us is not None
+        )[:2000]
+        prompt = _render_prompt(
+            bc_name=bc.name,
+            aggregates="\n".join(f"- {agg.id}: {agg.name}" for agg in aggregates),
+            user_story_context=stories_context,
+        )
+
+        try:
+            prompt_sha256 = sha256_text(prompt)
+            provider, model = ctx.provider_model
+            audit_log(
+                "Ingestion: extract commands - LLM invoke starting.",
+                "ingestion.llm.extract_commands.start",
+                lambda: {
+                    "session_id": ctx.session.id,
+                    "llm": {"provider": provider, "model": model},
+                    "bc": {"id": bc.id, "name": bc.name},
+                    "aggregate_ids": [agg.id for agg in aggregates],
+                    "prompt_len": len(prompt),
+                    "prompt_sha256": prompt_sha256,
+                    "prompt": audit_prompt(prompt),
+                    "system_sha256": _SYSTEM_PROMPT_SHA256,
+                },
             )
 
-            prompt = EXTRACT_COMMANDS_PROMPT.format(
-                aggregate_name=agg.name,
-                aggregate_id=agg.id,
-                bc_name=bc.name,
-                bc_short=bc_id_short,
-                user_story_context=stories_context[:2000],
+            t_llm0 = time.perf_counter()
+            streamed = 0
+            async for cmd_response, cache_hit in cached_structured_stream(
+                ctx.structured_llm(BCCommandList),
+                BCCommandList,
+                SYSTEM_PROMPT,
+                prompt,
+                system_sha256=_SYSTEM_PROMPT_SHA256,
+                prompt_sha256=prompt_sha256,
+                provider_model=ctx.provider_model,
+            ):
+                # Every command but the last is final; the last may still be growing.
+                for cmd in cmd_response.commands[streamed:-1]:
+                    stream.put_nowait(cmd)
+                streamed = max(streamed, len(cmd_response.commands) - 1)
+            llm_ms = int((time.perf_counter() - t_llm0) * 1000)
+            commands = cmd_response.commands
+            for cmd in commands[streamed:]:
+                stream.put_nowait(cmd)
+
+            audit_log(
+                "Ingestion: extract commands - LLM invoke completed.",
+                "ingestion.llm.extract_commands.done",
+                lambda: {
+                    "session_id": ctx.session.id,
+                    "llm": {"provider": provider, "model": model},
+                    "bc": {"id": bc.id, "name": bc.name},
+                    "llm_ms": llm_ms,
+                    "cache_hit": cache_hit,
+                    "result": {
+                        "commands_count": len(commands),
+                        "command_ids": summarize_for_log([getattr(c, "id", None) for c in commands]),
+                        "response": audit_response(cmd_response),
+                    },
+                },
             )
+        except Exception as e:
+            SmartLogger.log(
+                "WARNING",
+                "Command extraction failed (LLM)",
+                category="ingestion.workflow.commands",
+                params={"session_id": ctx.session.id, "bc_id": bc.id, "error": str(e)},
+            )
+            return {}
+
+        grouped, unmatched = group_by_aggregate(commands, aggregates)
+        if unmatched:
+            SmartLogger.log(
+                "WARNING",
+                "Commands dropped: unknown aggregate_id",
+                category="ingestion.workflow.commands",
+                params={
+                    "session_id": ctx.session.id,
+                    "bc_id": bc.id,
+                    "commands": [{"id": c.id, "aggregate_id": c.aggregate_id} for c in unmatched][:10],
+                },
+            )
+        return grouped
+
+    # BCs are independent: start every LLM call now (bounded by llm_semaphore), then stream
+    # each BC's commands in the original BC order, as the model produces them.
+    jobs = [(bc, aggs) for bc in ctx.bounded_contexts if (aggs := ctx.aggregates_by_bc.get(bc.id, []))]
+    streams: list[asyncio.Queue] = [asyncio.Queue() for _ in jobs]
+    tasks = [asyncio.ensure_future(extract_for(bc, aggs, stream)) for (bc, aggs), stream in zip(jobs, streams)]
+    command_rows: list[dict[str, Any]] = []
+
+    try:
+        for (bc, aggregates), stream, task in zip(jobs, streams, tasks):
+            shown_ids: list[str] = []
+            while (cmd := await stream.get()) is not None:
+                agg_id = match_aggregate(cmd, aggregates)
+                if agg_id is None:
+                    continue
+                yield ProgressEvent.compact(
+                    IngestionPhase.EXTRACTING_COMMANDS,
+                    f"Command 생성: {cmd.name}",
+                    65,
+                    object_type="Command",
+                    object_id=cmd.id,
+                    name=cmd.name,
+                    parent_id=agg_id,
+                )
+                shown_ids.append(cmd.id)
+                await ui_pacing_pause()
+
+            commands_by_agg = await task
+            # Streamed items are provisional: withdraw any the final result does not keep
+            # (e.g. the LLM stream failed part-way, so nothing is persisted for this BC).
+            kept_ids = {cmd.id for items in commands_by_agg.values() for cmd in items}
+            if withdrawn := [item_id for item_id in shown_ids if item_id not in kept_ids]:
+                yield ProgressEvent.retraction(
+                    IngestionPhase.EXTRACTING_COMMANDS,
+                    f"Command 생성 취소: {bc.name}",
+                    65,
+                    object_type="Command",
+                    object_ids=withdrawn,
+                )
+            command_lines = ctx.command_lines_by_bc_id.setdefault(bc.id, [])
 
-            structured_llm = ctx.llm.with_structured_output(CommandList)
-
-            try:
-                provider, model = get_llm_provider_model()
-                if AI_AUDIT_LOG_ENABLED:
-                    SmartLogger.log(
-                        "INFO",
-                        "Ingestion: extract commands - LLM invoke starting.",
-                        category="ingestion.llm.extract_commands.start",
-                        params={
-                            "session_id": ctx.session.id,
-                            "llm": {"provider": provider, "model": model},
-                            "bc": {"id": bc.id, "name": bc.name},
-                            "aggregate": {"id": agg.id, "name": agg.name},
-                            "prompt_len": len(prompt),
-                            "prompt_sha256": sha256_text(prompt),
-                            "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                            "system_sha256": sha256_text(SYSTEM_PROMPT),
-                        }
-                    )
-
-                t_llm0 = time.perf_counter()
-                cmd_response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
-                llm_ms = int((time.perf_counter() - t_llm0) * 1000)
-                commands = cmd_response.commands
-
-                if AI_AUDIT_LOG_ENABLED:
-                    try:
-                        resp_dump = cmd_response.model_dump() if hasattr(cmd_response, "model_dump") else cmd_response.dict()
-                    except Exception:
-                        resp_dump = {"__type__": type(cmd_response).__name__, "__repr__": repr(cmd_response)[:1000]}
+            for agg in aggregates:
+                commands = commands_by_agg.get(agg.id, [])
+                all_commands[agg.id] = commands
+                if commands:
                     SmartLogger.log(
                         "INFO",
-                        "Ingestion: extract commands - LLM invoke completed.",
-                        category="ingestion.llm.extract_commands.done",
-                        params={
-                            "session_id": ctx.session.id,
-                            "llm": {"provider": provider, "model": model},
-                            "bc": {"id": bc.id, "name": bc.name},
-                            "aggregate": {"id": agg.id, "name": agg.name},
-                            "llm_ms": llm_ms,
-                            "result": {
-                                "commands_count": len(commands),
-                                "command_ids": summarize_for_log([getattr(c, "id", None) for c in commands]),
-                                "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
-                            },
-                        }
+                        "Commands extracted",
+                        category="ingestion.workflow.commands",
+                        params={"session_id": ctx.session.id, "agg_id": agg.id, "count": len(commands)},
                     )
-            except Exception as e:
-                SmartLogger.log(
-                    "WARNING",
-                    "Command extraction failed (LLM)",
-                    category="ingestion.workflow.commands",
-                    params={"session_id": ctx.session.id, "bc_id": bc.id, "agg_id": agg.id, "error": str(e)},
-                )
-                commands = []
-
-            all_commands[agg.id] = commands
-            if commands:
-                SmartLogger.log(
-                    "INFO",
-                    "Commands extracted",
-                    category="ingestion.workflow.commands",
-                    params={"session_id": ctx.session.id, "agg_id": agg.id, "count": len(commands)},
-                )
-
-            for cmd in commands:
-                ctx.client.create_command(id=cmd.id, name=cmd.name, aggregate_id=agg.id, actor=cmd.actor)
-
-                yield ProgressEvent(
-                    phase=IngestionPhase.EXTRACTING_COMMANDS,
-                    message=f"Command 생성: {cmd.name}",
-                    progress=65,
-                    data={"type": "Command", "object": {"id": cmd.id, "name": cmd.name, "type": "Command", "parentId": agg.id}},
-                )
-                await asyncio.sleep(0.1)
 
+                for cmd in commands:
+                    command_rows.append({"id": cmd.id, "name": cmd.name, "aggregate_id": agg.id, "actor": cmd.actor})
+                    command_lines.append(f"- {cmd.name}")
+    finally:
+        # Client disconnects close this generator early; don't leave LLM calls running.
+        for task in tasks:
+            task.cancel()
+
+    # One UNWIND write for the whole phase; events MATCH these commands next.
+    try:
+        ctx.client.bulk_create_commands(command_rows)
+    except Exception:
+        # The commands above were announced before the write: withdraw them, then fail the run.
+        yield ProgressEvent.retraction(
+            IngestionPhase.EXTRACTING_COMMANDS,
+            "Command 저장 실패",
+            65,
+            object_type="Command",
+            object_ids=[row["id"] for row in command_rows],
+        )
+        raise
     ctx.commands_by_agg = all_commands
-
-
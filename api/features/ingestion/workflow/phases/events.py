@@ -4,133 +4,217 @@ import asyncio
 import time
 from typing import Any, AsyncGenerator
 
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from api.platform.env import (
-    AI_AUDIT_LOG_ENABLED,
-    AI_AUDIT_LOG_FULL_OUTPUT,
-    AI_AUDIT_LOG_FULL_PROMPT,
-)
 from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
-from api.features.ingestion.event_storming.nodes import EventList
-from api.features.ingestion.event_storming.prompts import EXTRACT_EVENTS_PROMPT, SYSTEM_PROMPT
-from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
-from api.platform.env import get_llm_provider_model
+from api.features.ingestion.event_storming.nodes import BCEventList
+from api.features.ingestion.event_storming.prompts import EXTRACT_EVENTS_FOR_BC_PROMPT, SYSTEM_PROMPT
+from api.features.ingestion.ingestion_llm_runtime import (
+    audit_log,
+    audit_prompt,
+    audit_response,
+    cached_structured_stream,
+    compile_prompt,
+)
+from api.features.ingestion.workflow.ingestion_workflow_context import (
+    IngestionWorkflowContext,
+    group_by_aggregate,
+    match_aggregate,
+    ui_pacing_pause,
+)
 from api.platform.observability.request_logging import sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
+_SYSTEM_PROMPT_SHA256 = sha256_text(SYSTEM_PROMPT)
+_render_prompt = compile_prompt(EXTRACT_EVENTS_FOR_BC_PROMPT)
+
+
+def _format_command(cmd: Any) -> str:
+    return f"  - {cmd.name}: {cmd.description}" if hasattr(cmd, "description") else f"  - {cmd.name}"
+
+
+def _command_id_for(commands: list[Any], index: int) -> str | None:
+    # The i-th event of an aggregate comes from its i-th command (or the first, past the end).
+    return commands[index].id if index < len(commands) else commands[0].id if commands else None
+
 
 async def extract_events_phase(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
     """
-    Phase 6: extract events per aggregate and persist them.
+    Phase 6: extract events for every aggregate with commands (one LLM call per BC) and persist them.
     """
     yield ProgressEvent(phase=IngestionPhase.EXTRACTING_EVENTS, message="Event 추출 중...", progress=75)
 
     all_events: dict[str, Any] = {}
 
-    for bc in ctx.bounded_contexts:
-        bc_id_short = bc.id.replace("BC-", "")
-        bc_aggregates = ctx.aggregates_by_bc.get(bc.id, [])
-
-        for agg in bc_aggregates:
-            commands = ctx.commands_by_agg.get(agg.id, [])
-            if not commands:
-                continue
-
-            commands_text = "\n".join(
-                [
-                    f"- {cmd.name}: {cmd.description}" if hasattr(cmd, "description") else f"- {cmd.name}"
-                    for cmd in commands
-                ]
+    async def extract_for(bc: Any, aggregates: list[Any], stream: asyncio.Queue) -> dict[str, list[Any]]:
+        """Grouped events for `bc`; each event is also put on `stream` once complete, then None."""
+        try:
+            return await _extract(bc, aggregates, stream)
+        finally:
+            stream.put_nowait(None)
+
+    async def _extract(bc: Any, aggregates: list[Any], stream: asyncio.Queue) -> dict[str, list[Any]]:
+        aggregates_text = "\n".join(
+            f"- {agg.id}: {agg.name}\n" + "\n".join(_format_command(cmd) for cmd in ctx.commands_by_agg[agg.id])
+            for agg in aggregates
+        )
+        prompt = _render_prompt(bc_name=bc.name, aggregates=aggregates_text)
+
+        try:
+            prompt_sha256 = sha256_text(prompt)
+            provider, model = ctx.provider_model
+            audit_log(
+                "Ingestion: extract events - LLM invoke starting.",
+                "ingestion.llm.extract_events.start",
+                lambda: {
+                    "session_id": ctx.session.id,
+                    "llm": {"provider": provider, "model": model},
+                    "bc": {"id": bc.id, "name": bc.name},
+                    "aggregate_ids": [agg.id for agg in aggregates],
+                    "prompt_len": len(prompt),
+                    "prompt_sha256": prompt_sha256,
+                    "prompt": audit_prompt(prompt),
+                    "system_sha256": _SYSTEM_PROMPT_SHA256,
+                },
             )
 
-            prompt = EXTRACT_EVENTS_PROMPT.format(
-                aggregate_name=agg.name,
-                bc_name=bc.name,
-                bc_short=bc_id_short,
-                commands=commands_text,
+            t_llm0 = time.perf_counter()
+            streamed = 0
+            async for evt_response, cache_hit in cached_structured_stream(
+                ctx.structured_llm(BCEventList),
+                BCEventList,
+                SYSTEM_PROMPT,
+                prompt,
+                system_sha256=_SYSTEM_PROMPT_SHA256,
+                prompt_sha256=prompt_sha256,
+                provider_model=ctx.provider_model,
+            ):
+                # Every event but the last is final; the last may still be growing.
+                for evt in evt_response.events[streamed:-1]:
+                    stream.put_nowait(evt)
+                streamed = max(streamed, len(evt_response.events) - 1)
+            llm_ms = int((time.perf_counter() - t_llm0) * 1000)
+            events = evt_response.events
+            for evt in events[streamed:]:
+                stream.put_nowait(evt)
+
+            audit_log(
+                "Ingestion: extract events - LLM invoke completed.",
+                "ingestion.llm.extract_events.done",
+                lambda: {
+                    "session_id": ctx.session.id,
+                    "llm": {"provider": provider, "model": model},
+                    "bc": {"id": bc.id, "name": bc.name},
+                    "llm_ms": llm_ms,
+                    "cache_hit": cache_hit,
+                    "result": {
+                        "events_count": len(events),
+                        "event_ids": summarize_for_log([getattr(e, "id", None) for e in events]),
+                        "response": audit_response(evt_response),
+                    },
+                },
             )
+        except Exception as e:
+            SmartLogger.log(
+                "WARNING",
+                "Event extraction failed (LLM)",
+                category="ingestion.workflow.events",
+                params={"session_id": ctx.session.id, "bc_id": bc.id, "error": str(e)},
+            )
+            return {}
+
+        grouped, unmatched = group_by_aggregate(events, aggregates)
+        if unmatched:
+            SmartLogger.log(
+                "WARNING",
+                "Events dropped: unknown aggregate_id",
+                category="ingestion.workflow.events",
+                params={
+                    "session_id": ctx.session.id,
+                    "bc_id": bc.id,
+                    "events": [{"id": e.id, "aggregate_id": e.aggregate_id} for e in unmatched][:10],
+                },
+            )
+        return grouped
+
+    # BCs are independent: start every LLM call now (bounded by llm_semaphore), then stream
+    # each BC's events in the original BC order, as the model produces them.
+    jobs = [
+        (bc, aggs)
+        for bc in ctx.bounded_contexts
+        if (aggs := [agg for agg in ctx.aggregates_by_bc.get(bc.id, []) if ctx.commands_by_agg.get(agg.id)])
+    ]
+    streams: list[asyncio.Queue] = [asyncio.Queue() for _ in jobs]
+    tasks = [asyncio.ensure_future(extract_for(bc, aggs, stream)) for (bc, aggs), stream in zip(jobs, streams)]
+    event_rows: list[dict[str, Any]] = []
+
+    try:
+        for (bc, aggregates), stream, task in zip(jobs, streams, tasks):
+            seen_by_agg: dict[str, int] = {}
+            shown_ids: list[str] = []
+            while (evt := await stream.get()) is not None:
+                agg_id = match_aggregate(evt, aggregates)
+                if agg_id is None:
+                    continue
+                index = seen_by_agg[agg_id] = seen_by_agg.get(agg_id, -1) + 1
+                cmd_id = _command_id_for(ctx.commands_by_agg[agg_id], index)
+                if not cmd_id:
+                    continue
+                yield ProgressEvent.compact(
+                    IngestionPhase.EXTRACTING_EVENTS,
+                    f"Event 생성: {evt.name}",
+                    80,
+                    object_type="Event",
+                    object_id=evt.id,
+                    name=evt.name,
+                    parent_id=cmd_id,
+                )
+                shown_ids.append(evt.id)
+                await ui_pacing_pause()
+
+            events_by_agg = await task
+            # Streamed items are provisional: withdraw any the final result does not keep
+            # (e.g. the LLM stream failed part-way, so nothing is persisted for this BC).
+            kept_ids = {evt.id for items in events_by_agg.values() for evt in items}
+            if withdrawn := [item_id for item_id in shown_ids if item_id not in kept_ids]:
+                yield ProgressEvent.retraction(
+                    IngestionPhase.EXTRACTING_EVENTS,
+                    f"Event 생성 취소: {bc.name}",
+                    80,
+                    object_type="Event",
+                    object_ids=withdrawn,
+                )
 
-            structured_llm = ctx.llm.with_structured_output(EventList)
-
-            try:
-                provider, model = get_llm_provider_model()
-                if AI_AUDIT_LOG_ENABLED:
-                    SmartLogger.log(
-                        "INFO",
-                        "Ingestion: extract events - LLM invoke starting.",
-                        category="ingestion.llm.extract_events.start",
-                        params={
-                            "session_id": ctx.session.id,
-                            "llm": {"provider": provider, "model": model},
-                            "bc": {"id": bc.id, "name": bc.name},
-                            "aggregate": {"id": agg.id, "name": agg.name},
-                            "prompt_len": len(prompt),
-                            "prompt_sha256": sha256_text(prompt),
-                            "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
-                            "system_sha256": sha256_text(SYSTEM_PROMPT),
-                        }
-                    )
-
-                t_llm0 = time.perf_counter()
-                evt_response = structured_llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=prompt)])
-                llm_ms = int((time.perf_counter() - t_llm0) * 1000)
-                events = evt_response.events
-
-                if AI_AUDIT_LOG_ENABLED:
-                    try:
-                        resp_dump = evt_response.model_dump() if hasattr(evt_response, "model_dump") else evt_response.dict()
-                    except Exception:
-                        resp_dump = {"__type__": type(evt_response).__name__, "__repr__": repr(evt_response)[:1000]}
+            for agg in aggregates:
+                commands = ctx.commands_by_agg[agg.id]
+                events = events_by_agg.get(agg.id, [])
+                all_events[agg.id] = events
+                if events:
                     SmartLogger.log(
                         "INFO",
-                        "Ingestion: extract events - LLM invoke completed.",
-                        category="ingestion.llm.extract_events.done",
-                        params={
-                            "session_id": ctx.session.id,
-                            "llm": {"provider": provider, "model": model},
-                            "bc": {"id": bc.id, "name": bc.name},
-                            "aggregate": {"id": agg.id, "name": agg.name},
-                            "llm_ms": llm_ms,
-                            "result": {
-                                "events_count": len(events),
-                                "event_ids": summarize_for_log([getattr(e, "id", None) for e in events]),
-                                "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
-                            },
-                        }
+                        "Events extracted",
+                        category="ingestion.workflow.events",
+                        params={"session_id": ctx.session.id, "agg_id": agg.id, "count": len(events)},
                     )
-            except Exception as e:
-                SmartLogger.log(
-                    "WARNING",
-                    "Event extraction failed (LLM)",
-                    category="ingestion.workflow.events",
-                    params={"session_id": ctx.session.id, "bc_id": bc.id, "agg_id": agg.id, "error": str(e)},
-                )
-                events = []
-
-            all_events[agg.id] = events
-            if events:
-                SmartLogger.log(
-                    "INFO",
-                    "Events extracted",
-                    category="ingestion.workflow.events",
-                    params={"session_id": ctx.session.id, "agg_id": agg.id, "count": len(events)},
-                )
-
-            for i, evt in enumerate(events):
-                cmd_id = commands[i].id if i < len(commands) else commands[0].id if commands else None
-                if not cmd_id:
-                    continue
-
-                ctx.client.create_event(id=evt.id, name=evt.name, command_id=cmd_id)
-                yield ProgressEvent(
-                    phase=IngestionPhase.EXTRACTING_EVENTS,
-                    message=f"Event 생성: {evt.name}",
-                    progress=80,
-                    data={"type": "Event", "object": {"id": evt.id, "name": evt.name, "type": "Event", "parentId": cmd_id}},
-                )
-                await asyncio.sleep(0.1)
 
+                ctx.event_lines.extend(f"- {evt.name}" for evt in events)
+                for i, evt in enumerate(events):
+                    cmd_id = _command_id_for(commands, i)
+                    if cmd_id:
+                        event_rows.append({"id": evt.id, "name": evt.name, "command_id": cmd_id})
+    finally:
+        # Client disconnects close this generator early; don't leave LLM calls running.
+        for task in tasks:
+            task.cancel()
+
+    try:
+        ctx.client.bulk_create_events(event_rows)
+    except Exception:
+        # The events above were announced before the write: withdraw them, then fail the run.
+        yield ProgressEvent.retraction(
+            IngestionPhase.EXTRACTING_EVENTS,
+            "Event 저장 실패",
+            80,
+            object_type="Event",
+            object_ids=[row["id"] for row in event_rows],
+        )
+        raise
     ctx.events_by_agg = all_events
-
-
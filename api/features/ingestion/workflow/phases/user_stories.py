@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import asyncio
 from typing import AsyncGenerator
 
-from api.features.ingestion.ingestion_contracts import IngestionPhase, ProgressEvent
+from pydantic import TypeAdapter
+
+from api.features.ingestion.ingestion_contracts import GeneratedUserStory, IngestionPhase, ProgressEvent
 from api.features.ingestion.requirements_to_user_stories import extract_user_stories_from_text
-from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext
+from api.features.ingestion.workflow.ingestion_workflow_context import IngestionWorkflowContext, ui_pacing_pause
 from api.platform.observability.smart_logger import SmartLogger
 
+# Dumps the whole story list in one pydantic-core call; rows feed both Neo4j and the progress events.
+_STORIES_ADAPTER = TypeAdapter(list[GeneratedUserStory])
+_STORY_FIELDS = {"__all__": {"id", "role", "action", "benefit", "priority"}}
+
 
 async def extract_user_stories_phase(ctx: IngestionWorkflowContext) -> AsyncGenerator[ProgressEvent, None]:
     """
@@ -15,7 +20,7 @@ async def extract_user_stories_phase(ctx: IngestionWorkflowContext) -> AsyncGene
     """
     yield ProgressEvent(phase=IngestionPhase.EXTRACTING_USER_STORIES, message="User Story 추출 중...", progress=10)
 
-    user_stories = extract_user_stories_from_text(ctx.content)
+    user_stories = await extract_user_stories_from_text(ctx.content)
     ctx.user_stories = user_stories
 
     SmartLogger.log(
@@ -25,42 +30,33 @@ async def extract_user_stories_phase(ctx: IngestionWorkflowContext) -> AsyncGene
         params={"session_id": ctx.session.id, "count": len(user_stories)},
     )
 
-    for i, us in enumerate(user_stories):
-        try:
-            ctx.client.create_user_story(
-                id=us.id,
-                role=us.role,
-                action=us.action,
-                benefit=us.benefit,
-                priority=us.priority,
-                status="draft",
-            )
+    story_rows = _STORIES_ADAPTER.dump_python(user_stories, include=_STORY_FIELDS)
+    try:
+        # status is left out: new stories default to 'draft' in the write.
+        ctx.client.bulk_create_user_stories(story_rows)
+    except Exception as e:
+        SmartLogger.log(
+            "WARNING",
+            "User story create skipped",
+            category="ingestion.neo4j.user_story",
+            params={"session_id": ctx.session.id, "count": len(user_stories), "error": str(e)},
+        )
+        # Nothing was saved: report it instead of announcing the stories as created objects.
+        story_rows = []
+        yield ProgressEvent(
+            phase=IngestionPhase.EXTRACTING_USER_STORIES,
+            message=f"User Story 저장 실패: {e}",
+            progress=20,
+        )
 
-            yield ProgressEvent(
-                phase=IngestionPhase.EXTRACTING_USER_STORIES,
-                message=f"User Story 생성: {us.id}",
-                progress=10 + (10 * (i + 1) // max(len(user_stories), 1)),
-                data={
-                    "type": "UserStory",
-                    "object": {
-                        "id": us.id,
-                        "name": f"{us.role}: {us.action[:30]}...",
-                        "type": "UserStory",
-                        "role": us.role,
-                        "action": us.action,
-                        "benefit": us.benefit,
-                        "priority": us.priority,
-                    },
-                },
-            )
-            await asyncio.sleep(0.15)
-        except Exception as e:
-            SmartLogger.log(
-                "WARNING",
-                "User story create skipped",
-                category="ingestion.neo4j.user_story",
-                params={"session_id": ctx.session.id, "id": us.id, "error": str(e)},
-            )
+    for i, (us, row) in enumerate(zip(user_stories, story_rows)):
+        yield ProgressEvent.model_construct(
+            phase=IngestionPhase.EXTRACTING_USER_STORIES,
+            message=f"User Story 생성: {us.id}",
+            progress=10 + (10 * (i + 1) // max(len(user_stories), 1)),
+            data={"object": {**row, "name": f"{us.role}: {us.action[:30]}...", "type": "UserStory"}},
+        )
+        await ui_pacing_pause()
 
     yield ProgressEvent(
         phase=IngestionPhase.EXTRACTING_USER_STORIES,
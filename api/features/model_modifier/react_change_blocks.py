@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Optional
+
+_JSON_FENCE_OPEN = "```json"
+_FENCE = "```"
+
+
+def find_json_object_end(text: str, start: int) -> Optional[int]:
+    """
+    Return the index just past the first top-level JSON object at/after `start`.
+
+    Skips leading whitespace, then counts braces while respecting string literals
+    and escapes. Returns None if the object is not complete yet (or the text does
+    not start with an object), so the caller can wait for more tokens.
+    """
+    n = len(text)
+    i = start
+    while i < n and text[i].isspace():
+        i += 1
+    if i >= n or text[i] != "{":
+        return None
+
+    depth = 0
+    in_str = False
+    escaped = False
+    for j in range(i, n):
+        ch = text[j]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return j + 1
+    return None
+
+
+def next_change_block(buffer: str) -> Optional[tuple[str, int, int]]:
+    """
+    Locate the next ```json change block in a streaming buffer.
+
+    Returns (json_str, block_start, block_end) where buffer[block_start:block_end]
+    should be removed once the block is handled. The block is reported as soon as
+    its JSON object closes, without waiting for the closing fence; if the object
+    cannot be brace-matched, falls back to the closing fence.
+    """
+    block_start = buffer.find(_JSON_FENCE_OPEN)
+    if block_start < 0:
+        return None
+    start = block_start + len(_JSON_FENCE_OPEN)
+
+    end = find_json_object_end(buffer, start)
+    if end is not None:
+        block_end = end
+        fence = buffer.find(_FENCE, end)
+        if fence >= 0 and not buffer[end:fence].strip():
+            block_end = fence + len(_FENCE)
+        return buffer[start:end].strip(), block_start, block_end
+
+    fence = buffer.find(_FENCE, start)
+    if fence < 0:
+        return None
+    return buffer[start:fence].strip(), block_start, fence + len(_FENCE)
+
+
+class ChangeBlockBuffer:
+    """
+    Streaming LLM output with its ```json change blocks cut out as they complete.
+
+    A block is cut as soon as its JSON object closes (see `next_change_block`). If its
+    closing fence has not streamed in yet, the fence is remembered and cut once it arrives,
+    so it never lingers in `text` as a stray ```.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        # Where the closing fence of the last cut block is expected (None: not waiting).
+        self._fence_at: Optional[int] = None
+
+    def append(self, chunk: str) -> None:
+        self.text += chunk
+
+    def pop_block(self) -> Optional[str]:
+        """JSON text of the next complete change block (removed from `text`), else None."""
+        self._cut_pending_fence()
+        block = next_change_block(self.text)
+        if block is None:
+            return None
+        json_str, block_start, block_end = block
+        fence_pending = not self.text[block_start:block_end].endswith(_FENCE)
+        self.text = self.text[:block_start] + self.text[block_end:]
+        self._fence_at = block_start if fence_pending else None
+        return json_str
+
+    def _cut_pending_fence(self) -> None:
+        if self._fence_at is None:
+            return
+        tail = self.text[self._fence_at :]
+        rest = tail.lstrip()
+        if rest.startswith(_FENCE):
+            fence_end = self._fence_at + (len(tail) - len(rest)) + len(_FENCE)
+            self.text = self.text[: self._fence_at] + self.text[fence_end:]
+        elif not rest or _FENCE.startswith(rest):
+            return  # only whitespace / part of the fence so far: wait for more
+        self._fence_at = None
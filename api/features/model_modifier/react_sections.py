@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Optional
 
 
-def extract_section(text: str, section_name: str) -> Optional[str]:
-    import re
+@lru_cache(maxsize=None)
+def _section_patterns(section_name: str) -> tuple[re.Pattern[str], ...]:
+    return (
+        re.compile(
+            rf"(?:💭|⚡|👁️)?\s*{section_name}:\s*(.+?)(?=(?:💭|⚡|👁️)?\s*(?:THOUGHT|ACTION|OBSERVATION|SUMMARY)|```|\n\n|$)",
+            re.DOTALL | re.IGNORECASE,
+        ),
+        re.compile(rf"{section_name}:\s*(.+?)(?=\n|$)", re.DOTALL | re.IGNORECASE),
+    )
+
 
-    patterns = [
-        rf"(?:💭|⚡|👁️)?\s*{section_name}:\s*(.+?)(?=(?:💭|⚡|👁️)?\s*(?:THOUGHT|ACTION|OBSERVATION|SUMMARY)|```|\n\n|$)",
-        rf"{section_name}:\s*(.+?)(?=\n|$)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+def extract_section(text: str, section_name: str) -> Optional[str]:
+    for pattern in _section_patterns(section_name):
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
     return None
-
-
@@ -12,16 +12,26 @@ from api.platform.observability.smart_logger import SmartLogger
 
 from .chat_runtime_settings import AI_AUDIT_LOG_ENABLED, AI_AUDIT_LOG_FULL_OUTPUT, OPENAI_API_KEY, OPENAI_MODEL
 from .model_change_application import apply_change
+from .react_change_blocks import ChangeBlockBuffer
 from .react_prompt import REACT_SYSTEM_PROMPT
 from .react_sections import extract_section
 from .sse_events import format_sse_event
 
+_REACT_SYSTEM_PROMPT_SHA256 = sha256_text(REACT_SYSTEM_PROMPT)
+
+# (section label in the LLM output, SSE event type)
+_REACT_SECTIONS = (
+    ("THOUGHT", "thought"),
+    ("ACTION", "action"),
+    ("OBSERVATION", "observation"),
+)
+
 
 async def stream_react_response(
     prompt: str,
     selected_nodes: List[Dict[str, Any]],
     conversation_history: List[Dict[str, Any]],
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     try:
         if not OPENAI_API_KEY:
             yield format_sse_event(
@@ -41,15 +51,14 @@ async def stream_react_response(
         )
 
         nodes_context = "\n".join(
-            [
-                f"- {node.get('type', 'Unknown')}: {node.get('name', node.get('id'))} "
-                f"(ID: {node.get('id')}, BC: {node.get('bcId', 'N/A')})"
-                for node in selected_nodes
-            ]
+            f"- {node.get('type', 'Unknown')}: {node.get('name', node.get('id'))} "
+            f"(ID: {node.get('id')}, BC: {node.get('bcId', 'N/A')})"
+            for node in selected_nodes
         )
 
+        history_tail = conversation_history[-5:]
         messages = [SystemMessage(content=REACT_SYSTEM_PROMPT)]
-        for msg in conversation_history[-5:]:
+        for msg in history_tail:
             if msg.get("type") == "user":
                 messages.append(HumanMessage(content=msg.get("content", "")))
             elif msg.get("type") == "assistant":
@@ -86,13 +95,14 @@ For "connect" actions, include:
         messages.append(HumanMessage(content=current_message))
 
         applied_changes: list[dict[str, Any]] = []
-        buffer = ""
+        buffer = ChangeBlockBuffer()
         raw_output = ""
         chunk_count = 0
         total_chars = 0
         json_blocks_seen = 0
         json_blocks_applied = 0
         json_decode_errors = 0
+        last_emitted = {label: "" for label, _ in _REACT_SECTIONS}
 
         if AI_AUDIT_LOG_ENABLED:
             SmartLogger.log(
@@ -107,13 +117,13 @@ For "connect" actions, include:
                     "prompt": prompt,
                     "prompt_sha256": sha256_text(prompt),
                     "prompt_len": len(prompt),
-                    "system_prompt_sha256": sha256_text(REACT_SYSTEM_PROMPT),
+                    "system_prompt_sha256": _REACT_SYSTEM_PROMPT_SHA256,
                     "system_prompt_len": len(REACT_SYSTEM_PROMPT),
                     "constructed_user_message": current_message,
                     "constructed_user_message_sha256": sha256_text(current_message),
                     "constructed_user_message_len": len(current_message),
                     "selected_nodes": summarize_for_log(selected_nodes),
-                    "conversation_history_tail": summarize_for_log(conversation_history[-5:]),
+                    "conversation_history_tail": summarize_for_log(history_tail),
                 },
             )
 
@@ -121,7 +131,7 @@ For "connect" actions, include:
             if not chunk.content:
                 continue
 
-            buffer += chunk.content
+            buffer.append(chunk.content)
             raw_output += chunk.content
             chunk_count += 1
             total_chars += len(chunk.content)
@@ -136,27 +146,15 @@ For "connect" actions, include:
                         params={"first_token_ms": first_token_ms, "model": OPENAI_MODEL},
                     )
 
-            if "THOUGHT:" in buffer:
-                thought = extract_section(buffer, "THOUGHT")
-                if thought:
-                    yield format_sse_event("thought", {"content": thought})
-
-            if "ACTION:" in buffer:
-                action_txt = extract_section(buffer, "ACTION")
-                if action_txt:
-                    yield format_sse_event("action", {"content": action_txt})
-
-            if "OBSERVATION:" in buffer:
-                obs = extract_section(buffer, "OBSERVATION")
-                if obs:
-                    yield format_sse_event("observation", {"content": obs})
-
-            while "```json" in buffer and "```" in buffer[buffer.find("```json") + 7 :]:
-                start = buffer.find("```json") + 7
-                end = buffer.find("```", start)
-                if end <= start:
-                    break
-                json_str = buffer[start:end].strip()
+            for label, event_type in _REACT_SECTIONS:
+                if f"{label}:" not in buffer.text:
+                    continue
+                section_text = extract_section(buffer.text, label)
+                if section_text and section_text != last_emitted[label]:
+                    last_emitted[label] = section_text
+                    yield format_sse_event(event_type, {"content": section_text})
+
+            while (json_str := buffer.pop_block()) is not None:
                 try:
                     json_blocks_seen += 1
                     change = json.loads(json_str)
@@ -180,8 +178,6 @@ For "connect" actions, include:
                         )
                 except json.JSONDecodeError:
                     json_decode_errors += 1
-                    pass
-                buffer = buffer[: buffer.find("```json")] + buffer[end + 3 :]
 
             yield format_sse_event("content", {"content": chunk.content})
 
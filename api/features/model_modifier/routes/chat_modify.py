@@ -7,6 +7,7 @@ from starlette.requests import Request
 from api.features.model_modifier.chat_contracts import ModifyRequest
 from api.features.model_modifier.chat_runtime_settings import AI_AUDIT_LOG_ENABLED, OPENAI_MODEL
 from api.features.model_modifier.react_streaming import stream_react_response
+from api.features.model_modifier.sse_events import SSE_DONE
 from api.platform.observability.request_logging import http_context, sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
@@ -43,7 +44,7 @@ async def modify_nodes(request: ModifyRequest, http_request: Request):
     async def generate():
         async for event in stream_react_response(request.prompt, request.selectedNodes, request.conversationHistory):
             yield event
-        yield "data: [DONE]\n\n"
+        yield SSE_DONE
 
     return StreamingResponse(
         generate(),
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict
 
+from pydantic_core import to_json
 
-def format_sse_event(event_type: str, data: Dict[str, Any]) -> str:
-    event_data = {"type": event_type, **data}
-    return f"data: {json.dumps(event_data, ensure_ascii=False)}\n\n"
 
+SSE_DONE = b"data: [DONE]\n\n"
+
+
+def format_sse_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    # pydantic-core's serializer writes UTF-8 bytes directly (non-ASCII kept as-is).
+    return b"data: " + to_json({"type": event_type, **data}) + b"\n\n"
 
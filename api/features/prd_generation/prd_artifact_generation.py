@@ -5,8 +5,17 @@ from datetime import datetime
 from api.features.prd_generation.prd_api_contracts import Database, Framework, TechStackConfig
 
 
+_SLUG_TABLE = str.maketrans({" ": "_"})
+
+
+def bc_slug(bc: dict) -> str:
+    """File/directory-safe name for a BC, shared by the zip paths and agent configs."""
+    return (bc.get("name", "unknown") or "unknown").lower().translate(_SLUG_TABLE)
+
+
 def generate_main_prd(bcs: list[dict], config: TechStackConfig) -> str:
-    prd = f"""# {config.project_name} - Product Requirements Document
+    parts = [
+        f"""# {config.project_name} - Product Requirements Document
 
 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -21,24 +30,25 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 | **Deployment** | {config.deployment.value} |
 
 ## Bounded Contexts
-"""
-
-    prd += "\n| BC Name | Aggregates | Commands | Events | Policies |\n"
-    prd += "|---------|------------|----------|--------|----------|\n"
+""",
+        "\n| BC Name | Aggregates | Commands | Events | Policies |\n",
+        "|---------|------------|----------|--------|----------|\n",
+    ]
     for bc in bcs:
-        aggs = bc.get("aggregates", []) or []
-        cmds = sum(len(a.get("commands", []) or []) for a in aggs)
-        evts = sum(len(a.get("events", []) or []) for a in aggs)
-        pols = len(bc.get("policies", []) or [])
-        prd += f"| {bc.get('name', 'Unknown')} | {len(aggs)} | {cmds} | {evts} | {pols} |\n"
+        counts = bc["counts"]
+        parts.append(
+            f"| {bc.get('name', 'Unknown')} | {counts['aggregates']} | {counts['commands']} "
+            f"| {counts['events']} | {counts['policies']} |\n"
+        )
 
-    prd += "\n## Notes\n- This PRD was generated from the Event Storming model stored in Neo4j.\n"
-    return prd
+    parts.append("\n## Notes\n- This PRD was generated from the Event Storming model stored in Neo4j.\n")
+    return "".join(parts)
 
 
 def generate_bc_spec(bc: dict, config: TechStackConfig) -> str:
     name = bc.get("name", "Unknown")
-    spec = f"""# {name} Bounded Context Specification
+    parts = [
+        f"""# {name} Bounded Context Specification
 
 ## Overview
 - **BC ID**: {bc.get("id", "")}
@@ -46,33 +56,34 @@ def generate_bc_spec(bc: dict, config: TechStackConfig) -> str:
 
 ## Aggregates
 """
-    for agg in bc.get("aggregates", []) or []:
-        spec += f"\n### {agg.get('name', 'Unknown')}\n"
+    ]
+    for agg in bc["aggregates"]:
+        parts.append(f"\n### {agg.get('name', 'Unknown')}\n")
         if agg.get("rootEntity"):
-            spec += f"- Root Entity: `{agg['rootEntity']}`\n"
-        if agg.get("commands"):
-            spec += "- Commands:\n"
+            parts.append(f"- Root Entity: `{agg['rootEntity']}`\n")
+        if agg["commands"]:
+            parts.append("- Commands:\n")
             for cmd in agg["commands"]:
-                if cmd.get("id"):
-                    spec += f"  - `{cmd.get('name','')}` (actor: {cmd.get('actor','')})\n"
-        if agg.get("events"):
-            spec += "- Events:\n"
+                parts.append(f"  - `{cmd.get('name','')}` (actor: {cmd.get('actor','')})\n")
+        if agg["events"]:
+            parts.append("- Events:\n")
             for evt in agg["events"]:
-                if evt.get("id"):
-                    spec += f"  - `{evt.get('name','')}` (v{evt.get('version','1')})\n"
+                parts.append(f"  - `{evt.get('name','')}` (v{evt.get('version','1')})\n")
 
-    if bc.get("policies"):
-        spec += "\n## Policies\n"
+    if bc["policies"]:
+        parts.append("\n## Policies\n")
         for pol in bc["policies"]:
-            if pol.get("id"):
-                spec += f"- `{pol.get('name','')}`: triggers `{pol.get('triggerEventId')}` -> invokes `{pol.get('invokeCommandId')}`\n"
+            parts.append(
+                f"- `{pol.get('name','')}`: triggers `{pol.get('triggerEventId')}` -> invokes `{pol.get('invokeCommandId')}`\n"
+            )
 
-    spec += "\n## Implementation Notes\n"
-    spec += f"- Framework: `{config.framework.value}`\n- Messaging: `{config.messaging.value}`\n"
-    return spec
+    parts.append("\n## Implementation Notes\n")
+    parts.append(f"- Framework: `{config.framework.value}`\n- Messaging: `{config.messaging.value}`\n")
+    return "".join(parts)
 
 
 def generate_claude_md(bcs: list[dict], config: TechStackConfig) -> str:
+    bc_lines = "\n".join(f"- {bc.get('name','Unknown')} ({bc.get('id','')})" for bc in bcs)
     return f"""# CLAUDE.md - AI Assistant Context
 
 ## Project
@@ -83,7 +94,7 @@ def generate_claude_md(bcs: list[dict], config: TechStackConfig) -> str:
 - Database: {config.database.value}
 
 ## Bounded Contexts
-{chr(10).join([f"- {bc.get('name','Unknown')} ({bc.get('id','')})" for bc in bcs])}
+{bc_lines}
 """
 
 
@@ -96,8 +107,8 @@ def generate_cursor_rules(config: TechStackConfig) -> str:
 """
 
 
-def generate_agent_config(bc: dict) -> str:
-    bc_name = (bc.get("name", "unknown") or "unknown").lower().replace(" ", "_")
+def generate_agent_config(bc: dict, slug: str | None = None) -> str:
+    bc_name = slug or bc_slug(bc)
     return f"""# Agent Configuration: {bc.get('name','Unknown')}
 
 ## Scope
@@ -107,18 +118,17 @@ def generate_agent_config(bc: dict) -> str:
 
 
 def generate_readme(bcs: list[dict], config: TechStackConfig) -> str:
+    bc_lines = "\n".join(f"- {bc.get('name','Unknown')}: {bc.get('description','')}" for bc in bcs)
     return f"""# {config.project_name}
 
 Generated from Event Storming model.
 
 ## Bounded Contexts
-{chr(10).join([f"- {bc.get('name','Unknown')}: {bc.get('description','')}" for bc in bcs])}
+{bc_lines}
 """
 
 
-def generate_dockerfile(config: TechStackConfig) -> str:
-    if config.framework == Framework.FASTAPI:
-        return """FROM python:3.11-slim
+_DOCKERFILE_FASTAPI = """FROM python:3.11-slim
 WORKDIR /app
 COPY requirements.txt .
 RUN pip install --no-cache-dir -r requirements.txt
@@ -126,21 +136,30 @@ COPY . .
 EXPOSE 8000
 CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
 """
-    if config.framework in [Framework.NESTJS, Framework.EXPRESS]:
-        return """FROM node:18-alpine
+
+_DOCKERFILE_NODE = """FROM node:18-alpine
 WORKDIR /app
 COPY package*.json ./
 RUN npm ci
 COPY . .
 CMD ["npm","run","start"]
 """
-    return """# Dockerfile template (customize per service)
+
+_DOCKERFILE_DEFAULT = """# Dockerfile template (customize per service)
 """
 
+_DOCKERFILES: dict[Framework, str] = {
+    Framework.FASTAPI: _DOCKERFILE_FASTAPI,
+    Framework.NESTJS: _DOCKERFILE_NODE,
+    Framework.EXPRESS: _DOCKERFILE_NODE,
+}
 
-def generate_docker_compose(config: TechStackConfig) -> str:
-    if config.database == Database.POSTGRESQL:
-        db_service = """  postgres:
+_COMPOSE_TEMPLATE = """version: "3.8"
+services:
+{db_service}
+"""
+
+_COMPOSE_POSTGRES = _COMPOSE_TEMPLATE.format(db_service="""  postgres:
     image: postgres:15
     environment:
       POSTGRES_DB: ${DB_NAME:-app}
@@ -148,19 +167,25 @@ def generate_docker_compose(config: TechStackConfig) -> str:
       POSTGRES_PASSWORD: ${DB_PASSWORD:-postgres}
     ports:
       - "5432:5432"
-"""
-    elif config.database == Database.MONGODB:
-        db_service = """  mongodb:
+""")
+
+_COMPOSE_MONGO = _COMPOSE_TEMPLATE.format(db_service="""  mongodb:
     image: mongo:6
     ports:
       - "27017:27017"
-"""
-    else:
-        db_service = ""
+""")
+
+_COMPOSE_EMPTY = _COMPOSE_TEMPLATE.format(db_service="")
+
+_DOCKER_COMPOSES: dict[Database, str] = {
+    Database.POSTGRESQL: _COMPOSE_POSTGRES,
+    Database.MONGODB: _COMPOSE_MONGO,
+}
 
-    return f"""version: "3.8"
-services:
-{db_service}
-"""
+
+def generate_dockerfile(config: TechStackConfig) -> str:
+    return _DOCKERFILES.get(config.framework, _DOCKERFILE_DEFAULT)
 
 
+def generate_docker_compose(config: TechStackConfig) -> str:
+    return _DOCKER_COMPOSES.get(config.database, _COMPOSE_EMPTY)
@@ -7,10 +7,39 @@ from api.platform.observability.request_logging import summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
 
-def fetch_bc_data(bc_id: str) -> dict | None:
+def get_bcs_from_nodes(node_ids: list[str]) -> list[dict]:
     t0 = time.perf_counter()
     query = """
-    MATCH (bc:BoundedContext {id: $bc_id})
+    // Direct BC nodes
+    UNWIND $node_ids as nodeId
+    OPTIONAL MATCH (bc:BoundedContext {id: nodeId})
+    WITH collect(DISTINCT bc.id) as directBCs
+
+    // BCs containing the nodes (Aggregates / Policies)
+    UNWIND $node_ids as nodeId
+    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE]->(:Aggregate {id: nodeId})
+    OPTIONAL MATCH (polBc:BoundedContext)-[:HAS_POLICY]->(:Policy {id: nodeId})
+    WITH directBCs, collect(DISTINCT bc.id) + collect(DISTINCT polBc.id) as containingBCs
+
+    // BCs for Commands (via Aggregate)
+    UNWIND $node_ids as nodeId
+    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE]->(agg:Aggregate)-[:HAS_COMMAND]->(cmd:Command {id: nodeId})
+    WITH directBCs, containingBCs, collect(DISTINCT bc.id) as cmdBCs
+
+    // BCs for Events (via Command)
+    UNWIND $node_ids as nodeId
+    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE]->(agg2:Aggregate)-[:HAS_COMMAND]->(cmd2:Command)-[:EMITS]->(evt:Event {id: nodeId})
+    WITH directBCs, containingBCs, cmdBCs, collect(DISTINCT bc.id) as evtBCs
+
+    WITH directBCs + containingBCs + cmdBCs + evtBCs as allBCIds
+    UNWIND allBCIds as bcId
+    WITH DISTINCT bcId WHERE bcId IS NOT NULL
+
+    // Project every resolved BC in the same round trip into the nested map consumed by
+    // PRD artifact generation. Shape is normalized here: aggregates, policies and each
+    // aggregate's commands/events are always lists without OPTIONAL MATCH null
+    // placeholders, and counts is always present.
+    MATCH (bc:BoundedContext {id: bcId})
     OPTIONAL MATCH (bc)-[:HAS_AGGREGATE]->(agg:Aggregate)
     OPTIONAL MATCH (agg)-[:HAS_COMMAND]->(cmd:Command)
     OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
@@ -21,8 +50,8 @@ def fetch_bc_data(bc_id: str) -> dict | None:
         id: agg.id,
         name: agg.name,
         rootEntity: agg.rootEntity,
-        commands: commands,
-        events: events
+        commands: [c IN commands WHERE c.id IS NOT NULL],
+        events: [e IN events WHERE e.id IS NOT NULL]
     }) as aggregates
 
     OPTIONAL MATCH (bc)-[:HAS_POLICY]->(pol:Policy)
@@ -38,95 +67,46 @@ def fetch_bc_data(bc_id: str) -> dict | None:
         invokeCommandName: invokeCmd.name
     }) as policies
 
-    RETURN {
+    WITH bc,
+         [a IN aggregates WHERE a.id IS NOT NULL] as aggregates,
+         [p IN policies WHERE p.id IS NOT NULL] as policies
+    WITH {
         id: bc.id,
         name: bc.name,
         description: bc.description,
-        aggregates: [a IN aggregates WHERE a.id IS NOT NULL],
-        policies: [p IN policies WHERE p.id IS NOT NULL]
+        aggregates: aggregates,
+        policies: policies,
+        counts: {
+            aggregates: size(aggregates),
+            commands: reduce(n = 0, a IN aggregates | n + size(a.commands)),
+            events: reduce(n = 0, a IN aggregates | n + size(a.events)),
+            policies: size(policies)
+        }
     } as bc_data
+    RETURN collect(bc_data) as bcs
     """
 
-    with get_session() as session:
-        result = session.run(query, bc_id=bc_id)
-        record = result.single()
-        if record:
-            bc_data = dict(record["bc_data"])
-            SmartLogger.log(
-                "INFO",
-                "PRD: fetched BC data from Neo4j.",
-                category="api.prd.neo4j.fetch_bc",
-                params={
-                    "bc_id": bc_id,
-                    "duration_ms": int((time.perf_counter() - t0) * 1000),
-                    "summary": {
-                        "aggregates": len(bc_data.get("aggregates") or []),
-                        "policies": len(bc_data.get("policies") or []),
-                    },
-                },
-            )
-            return bc_data
-    SmartLogger.log(
-        "WARNING",
-        "PRD: BC not found while fetching data.",
-        category="api.prd.neo4j.fetch_bc.not_found",
-        params={"bc_id": bc_id, "duration_ms": int((time.perf_counter() - t0) * 1000)},
-    )
-    return None
-
-
-def get_bcs_from_nodes(node_ids: list[str]) -> list[dict]:
-    t0 = time.perf_counter()
-    query = """
-    // Direct BC nodes
-    UNWIND $node_ids as nodeId
-    OPTIONAL MATCH (bc:BoundedContext {id: nodeId})
-    WITH collect(DISTINCT bc.id) as directBCs
-
-    // BCs containing the nodes
-    UNWIND $node_ids as nodeId
-    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE|HAS_POLICY*1..3]->(n {id: nodeId})
-    WITH directBCs, collect(DISTINCT bc.id) as containingBCs
-
-    // BCs for Commands (via Aggregate)
-    UNWIND $node_ids as nodeId
-    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE]->(agg:Aggregate)-[:HAS_COMMAND]->(cmd:Command {id: nodeId})
-    WITH directBCs, containingBCs, collect(DISTINCT bc.id) as cmdBCs
-
-    // BCs for Events (via Command)
-    UNWIND $node_ids as nodeId
-    OPTIONAL MATCH (bc:BoundedContext)-[:HAS_AGGREGATE]->(agg2:Aggregate)-[:HAS_COMMAND]->(cmd2:Command)-[:EMITS]->(evt:Event {id: nodeId})
-    WITH directBCs, containingBCs, cmdBCs, collect(DISTINCT bc.id) as evtBCs
-
-    WITH directBCs + containingBCs + cmdBCs + evtBCs as allBCIds
-    UNWIND allBCIds as bcId
-    WITH DISTINCT bcId WHERE bcId IS NOT NULL
-    RETURN collect(bcId) as bc_ids
-    """
-
-    bc_ids: list[str] = []
+    bcs: list[dict] = []
     with get_session() as session:
         result = session.run(query, node_ids=node_ids)
         record = result.single()
         if record:
-            bc_ids = record["bc_ids"] or []
+            bcs = record["bcs"] or []
 
     SmartLogger.log(
         "INFO",
-        "PRD: resolved BC IDs from selected node IDs.",
+        "PRD: resolved and fetched BC data from selected node IDs.",
         category="api.prd.neo4j.resolve_bcs",
         params={
             "inputs": {"node_ids": summarize_for_log(node_ids)},
-            "resolved_bc_ids": bc_ids,
+            "resolved_bc_ids": [bc.get("id") for bc in bcs],
             "duration_ms": int((time.perf_counter() - t0) * 1000),
+            "summary": {
+                "aggregates": sum(bc["counts"]["aggregates"] for bc in bcs),
+                "policies": sum(bc["counts"]["policies"] for bc in bcs),
+            },
         },
     )
-
-    bcs: list[dict] = []
-    for bc_id in bc_ids:
-        bc_data = fetch_bc_data(bc_id)
-        if bc_data:
-            bcs.append(bc_data)
     return bcs
 
 
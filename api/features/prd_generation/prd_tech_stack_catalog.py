@@ -1,33 +1,45 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from api.features.prd_generation.prd_api_contracts import Database, DeploymentStyle, Framework, Language, MessagingPlatform
 
 
+_FRAMEWORK_LANGUAGES: dict[Framework, list[str]] = {
+    Framework.SPRING_BOOT: ["java", "kotlin"],
+    Framework.SPRING_WEBFLUX: ["java", "kotlin"],
+    Framework.NESTJS: ["typescript"],
+    Framework.EXPRESS: ["typescript", "javascript"],
+    Framework.FASTAPI: ["python"],
+    Framework.GIN: ["go"],
+    Framework.FIBER: ["go"],
+}
+
+_MESSAGING_DESCRIPTIONS: dict[MessagingPlatform, str] = {
+    MessagingPlatform.KAFKA: "Distributed event streaming, best for microservices",
+    MessagingPlatform.RABBITMQ: "Message broker with flexible routing",
+    MessagingPlatform.REDIS_STREAMS: "Lightweight, good for simpler use cases",
+    MessagingPlatform.PULSAR: "Multi-tenant, geo-replication support",
+    MessagingPlatform.IN_MEMORY: "For modular monolith, uses internal event bus",
+}
+
+
 def _get_framework_languages(framework: Framework) -> list[str]:
-    mapping = {
-        Framework.SPRING_BOOT: ["java", "kotlin"],
-        Framework.SPRING_WEBFLUX: ["java", "kotlin"],
-        Framework.NESTJS: ["typescript"],
-        Framework.EXPRESS: ["typescript", "javascript"],
-        Framework.FASTAPI: ["python"],
-        Framework.GIN: ["go"],
-        Framework.FIBER: ["go"],
-    }
-    return mapping.get(framework, [])
+    return list(_FRAMEWORK_LANGUAGES.get(framework, []))
 
 
 def _get_messaging_description(messaging: MessagingPlatform) -> str:
-    descriptions = {
-        MessagingPlatform.KAFKA: "Distributed event streaming, best for microservices",
-        MessagingPlatform.RABBITMQ: "Message broker with flexible routing",
-        MessagingPlatform.REDIS_STREAMS: "Lightweight, good for simpler use cases",
-        MessagingPlatform.PULSAR: "Multi-tenant, geo-replication support",
-        MessagingPlatform.IN_MEMORY: "For modular monolith, uses internal event bus",
-    }
-    return descriptions.get(messaging, "")
+    return _MESSAGING_DESCRIPTIONS.get(messaging, "")
 
 
+@lru_cache(maxsize=1)
 def build_tech_stack_options() -> dict:
+    """
+    Tech stack choices for the PRD generator UI.
+
+    The payload only depends on code-level enums, so it is built once per process.
+    Callers must treat the returned dict as read-only.
+    """
     return {
         "languages": [{"value": l.value, "label": l.name.title()} for l in Language],
         "frameworks": [
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import time
 import zipfile
 from datetime import datetime
+from typing import Callable, Iterator
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from starlette.requests import Request
 
-from api.features.prd_generation.prd_api_contracts import PRDGenerationRequest
+from api.features.prd_generation.prd_api_contracts import PRDGenerationRequest, TechStackConfig
 from api.features.prd_generation.prd_artifact_generation import (
+    bc_slug,
     generate_agent_config,
     generate_bc_spec,
     generate_claude_md,
@@ -21,7 +24,7 @@ from api.features.prd_generation.prd_artifact_generation import (
     generate_readme,
 )
 from api.features.prd_generation.prd_model_data import get_bcs_from_nodes
-from api.platform.observability.request_logging import http_context, sha256_bytes, summarize_for_log
+from api.platform.observability.request_logging import http_context, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 
 router = APIRouter()
@@ -33,15 +36,16 @@ async def generate_prd(request: PRDGenerationRequest, http_request: Request):
     if not request.node_ids:
         raise HTTPException(status_code=400, detail="node_ids cannot be empty")
 
-    SmartLogger.log(
-        "INFO",
-        "PRD: generation plan requested.",
-        category="api.prd.generate.request",
-        params={
-            **http_context(http_request),
-            "inputs": {"node_ids": summarize_for_log(request.node_ids), "tech_stack": request.tech_stack.model_dump()},
-        },
-    )
+    if SmartLogger.is_enabled("INFO"):
+        SmartLogger.log(
+            "INFO",
+            "PRD: generation plan requested.",
+            category="api.prd.generate.request",
+            params={
+                **http_context(http_request),
+                "inputs": {"node_ids": summarize_for_log(request.node_ids), "tech_stack": request.tech_stack.model_dump()},
+            },
+        )
 
     bcs = get_bcs_from_nodes(request.node_ids)
     if not bcs:
@@ -49,15 +53,17 @@ async def generate_prd(request: PRDGenerationRequest, http_request: Request):
 
     config = request.tech_stack
 
-    files_to_generate = ["CLAUDE.md", "PRD.md", ".cursorrules"]
-    for bc in bcs:
-        bc_name = (bc.get("name", "unknown") or "unknown").lower().replace(" ", "_")
-        files_to_generate.append(f".claude/agents/{bc_name}_agent.md")
-        files_to_generate.append(f"specs/{bc_name}_spec.md")
-
-    if config.include_docker:
-        files_to_generate.append("docker-compose.yml")
-        files_to_generate.append("Dockerfile")
+    files_to_generate = [
+        "CLAUDE.md",
+        "PRD.md",
+        ".cursorrules",
+        *(
+            path
+            for bc_name in map(bc_slug, bcs)
+            for path in (f".claude/agents/{bc_name}_agent.md", f"specs/{bc_name}_spec.md")
+        ),
+        *(("docker-compose.yml", "Dockerfile") if config.include_docker else ()),
+    ]
 
     payload = {
         "success": True,
@@ -66,79 +72,135 @@ async def generate_prd(request: PRDGenerationRequest, http_request: Request):
         "files_to_generate": files_to_generate,
         "download_url": "/api/prd/download",
     }
-    SmartLogger.log(
-        "INFO",
-        "PRD: generation plan created.",
-        category="api.prd.generate.done",
-        params={
-            **http_context(http_request),
-            "duration_ms": int((time.perf_counter() - t0) * 1000),
-            "summary": {"bcs": len(bcs), "files_to_generate": len(files_to_generate)},
-        },
-    )
+    if SmartLogger.is_enabled("INFO"):
+        SmartLogger.log(
+            "INFO",
+            "PRD: generation plan created.",
+            category="api.prd.generate.done",
+            params={
+                **http_context(http_request),
+                "duration_ms": int((time.perf_counter() - t0) * 1000),
+                "summary": {"bcs": len(bcs), "files_to_generate": len(files_to_generate)},
+            },
+        )
     return payload
 
 
+class _ZipChunkSink(io.RawIOBase):
+    """Unseekable write target: ZipFile output is collected here and drained per entry."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _prd_zip_entries(bcs: list[dict], config: TechStackConfig) -> Iterator[tuple[str, str]]:
+    """(archive path, content) pairs, rendered lazily so each entry is produced on demand."""
+    yield "CLAUDE.md", generate_claude_md(bcs, config)
+    yield "PRD.md", generate_main_prd(bcs, config)
+    yield ".cursorrules", generate_cursor_rules(config)
+
+    for bc in bcs:
+        bc_name = bc_slug(bc)
+        yield f"specs/{bc_name}_spec.md", generate_bc_spec(bc, config)
+        yield f".claude/agents/{bc_name}_agent.md", generate_agent_config(bc, bc_name)
+
+    if config.include_docker:
+        yield "docker-compose.yml", generate_docker_compose(config)
+        yield "Dockerfile", generate_dockerfile(config)
+
+    yield "README.md", generate_readme(bcs, config)
+
+
+def _iter_prd_zip(
+    bcs: list[dict],
+    config: TechStackConfig,
+    on_complete: Callable[[int, str], None],
+) -> Iterator[bytes]:
+    """
+    Yield the zip archive as it is written, one chunk per entry.
+
+    Sync generator on purpose: StreamingResponse iterates it in the threadpool, so
+    rendering + deflate stay off the event loop. `on_complete(size, sha256)` runs once
+    the central directory has been written.
+    """
+    sink = _ZipChunkSink()
+    digest = hashlib.sha256()
+    size = 0
+    # Small markdown payloads: fastest deflate level keeps download latency low.
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+        for path, content in _prd_zip_entries(bcs, config):
+            zip_file.writestr(path, content)
+            chunk = sink.drain()
+            if chunk:
+                digest.update(chunk)
+                size += len(chunk)
+                yield chunk
+
+    chunk = sink.drain()
+    if chunk:
+        digest.update(chunk)
+        size += len(chunk)
+        yield chunk
+    on_complete(size, digest.hexdigest())
+
+
 @router.post("/download")
 async def download_prd_zip(request: PRDGenerationRequest, http_request: Request):
     t0 = time.perf_counter()
     if not request.node_ids:
         raise HTTPException(status_code=400, detail="node_ids cannot be empty")
 
-    SmartLogger.log(
-        "INFO",
-        "PRD: zip download requested.",
-        category="api.prd.download.request",
-        params={
-            **http_context(http_request),
-            "inputs": {"node_ids": summarize_for_log(request.node_ids), "tech_stack": request.tech_stack.model_dump()},
-        },
-    )
+    if SmartLogger.is_enabled("INFO"):
+        SmartLogger.log(
+            "INFO",
+            "PRD: zip download requested.",
+            category="api.prd.download.request",
+            params={
+                **http_context(http_request),
+                "inputs": {"node_ids": summarize_for_log(request.node_ids), "tech_stack": request.tech_stack.model_dump()},
+            },
+        )
 
     bcs = get_bcs_from_nodes(request.node_ids)
     if not bcs:
         raise HTTPException(status_code=404, detail="No Bounded Contexts found for the given nodes")
 
     config = request.tech_stack
-    zip_buffer = io.BytesIO()
-
-    t_zip0 = time.perf_counter()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        zip_file.writestr("CLAUDE.md", generate_claude_md(bcs, config))
-        zip_file.writestr("PRD.md", generate_main_prd(bcs, config))
-        zip_file.writestr(".cursorrules", generate_cursor_rules(config))
-
-        for bc in bcs:
-            bc_name = (bc.get("name", "unknown") or "unknown").lower().replace(" ", "_")
-            zip_file.writestr(f"specs/{bc_name}_spec.md", generate_bc_spec(bc, config))
-            zip_file.writestr(f".claude/agents/{bc_name}_agent.md", generate_agent_config(bc))
-
-        if config.include_docker:
-            zip_file.writestr("docker-compose.yml", generate_docker_compose(config))
-            zip_file.writestr("Dockerfile", generate_dockerfile(config))
-
-        zip_file.writestr("README.md", generate_readme(bcs, config))
-
-    zip_buffer.seek(0)
-    zip_bytes = zip_buffer.getvalue()
-    zip_size = len(zip_bytes)
-    zip_sha = sha256_bytes(zip_bytes)
     filename = f"{config.project_name}_prd_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    # The body streams after the middleware has finished, so capture request context now.
+    log_ctx = http_context(http_request)
+    t_zip0 = time.perf_counter()
 
-    SmartLogger.log(
-        "INFO",
-        "PRD: zip built and streaming response returned.",
-        category="api.prd.download.done",
-        params={
-            **http_context(http_request),
-            "duration_ms": int((time.perf_counter() - t0) * 1000),
-            "zip_build_ms": int((time.perf_counter() - t_zip0) * 1000),
-            "summary": {"bcs": len(bcs), "zip_bytes": zip_size, "zip_sha256": zip_sha, "filename": filename},
-        },
+    def _log_zip_streamed(zip_size: int, zip_sha: str) -> None:
+        if not SmartLogger.is_enabled("INFO"):
+            return
+        SmartLogger.log(
+            "INFO",
+            "PRD: zip streamed to client.",
+            category="api.prd.download.done",
+            params={
+                **log_ctx,
+                "duration_ms": int((time.perf_counter() - t0) * 1000),
+                "zip_build_ms": int((time.perf_counter() - t_zip0) * 1000),
+                "summary": {"bcs": len(bcs), "zip_bytes": zip_size, "zip_sha256": zip_sha, "filename": filename},
+            },
+        )
+
+    return StreamingResponse(
+        _iter_prd_zip(bcs, config, _log_zip_streamed),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
-
-    zip_buffer = io.BytesIO(zip_bytes)
-    zip_buffer.seek(0)
-    return StreamingResponse(zip_buffer, media_type="application/zip", headers={"Content-Disposition": f"attachment; filename={filename}"})
-
-
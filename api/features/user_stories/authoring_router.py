@@ -69,7 +69,7 @@ async def add_user_story(request: AddUserStoryRequest, http_request: Request) ->
     )
 
     try:
-        result = run_user_story_planning(
+        result = await run_user_story_planning(
             role=request.role,
             action=request.action,
             benefit=request.benefit or "",
@@ -111,7 +111,7 @@ async def add_user_story(request: AddUserStoryRequest, http_request: Request) ->
 async def apply_user_story(request: ApplyUserStoryRequest, http_request: Request) -> dict[str, Any]:
     applied_changes: list[dict[str, Any]] = []
     errors: list[str] = []
-    user_story_id = f"US-{str(uuid.uuid4())[:8].upper()}"
+    user_story_id = f"US-{uuid.uuid4().hex[:8].upper()}"
     t0 = time.perf_counter()
 
     SmartLogger.log(
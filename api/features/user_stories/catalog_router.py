@@ -21,7 +21,9 @@ async def get_all_user_stories(request: Request) -> list[dict[str, Any]]:
     query = """
     MATCH (us:UserStory)
     OPTIONAL MATCH (us)-[:IMPLEMENTS]->(bc:BoundedContext)
-    RETURN {
+    WITH us, bc
+    ORDER BY us.id
+    RETURN collect({
         id: us.id,
         role: us.role,
         action: us.action,
@@ -30,24 +32,25 @@ async def get_all_user_stories(request: Request) -> list[dict[str, Any]]:
         status: us.status,
         bcId: bc.id,
         bcName: bc.name
-    } as user_story
-    ORDER BY us.id
+    }) as user_stories
     """
-    SmartLogger.log(
-        "INFO",
-        "User stories list requested: returning all user stories with BC assignment.",
-        category="api.user_stories.list.request",
-        params=http_context(request),
-    )
-    with get_session() as session:
-        result = session.run(query)
-        items = [dict(record["user_story"]) for record in result]
+    if SmartLogger.is_enabled("INFO"):
         SmartLogger.log(
             "INFO",
-            "User stories list returned.",
-            category="api.user_stories.list.done",
-            params={**http_context(request), "count": len(items)},
+            "User stories list requested: returning all user stories with BC assignment.",
+            category="api.user_stories.list.request",
+            params=http_context(request),
         )
+    with get_session() as session:
+        record = session.run(query).single()
+        items = record["user_stories"] if record else []
+        if SmartLogger.is_enabled("INFO"):
+            SmartLogger.log(
+                "INFO",
+                "User stories list returned.",
+                category="api.user_stories.list.done",
+                params={**http_context(request), "count": len(items)},
+            )
         return items
 
 
@@ -59,31 +62,34 @@ async def get_unassigned_user_stories(request: Request) -> list[dict[str, Any]]:
     query = """
     MATCH (us:UserStory)
     WHERE NOT (us)-[:IMPLEMENTS]->(:BoundedContext)
-    RETURN {
+    WITH us
+    ORDER BY us.id
+    RETURN collect({
         id: us.id,
         role: us.role,
         action: us.action,
         benefit: us.benefit,
         priority: us.priority,
         status: us.status
-    } as user_story
-    ORDER BY us.id
+    }) as user_stories
     """
-    SmartLogger.log(
-        "INFO",
-        "Unassigned user stories requested: finding user stories without BC assignment.",
-        category="api.user_stories.unassigned.request",
-        params=http_context(request),
-    )
-    with get_session() as session:
-        result = session.run(query)
-        items = [dict(record["user_story"]) for record in result]
+    if SmartLogger.is_enabled("INFO"):
         SmartLogger.log(
             "INFO",
-            "Unassigned user stories returned.",
-            category="api.user_stories.unassigned.done",
-            params={**http_context(request), "count": len(items)},
+            "Unassigned user stories requested: finding user stories without BC assignment.",
+            category="api.user_stories.unassigned.request",
+            params=http_context(request),
         )
+    with get_session() as session:
+        record = session.run(query).single()
+        items = record["user_stories"] if record else []
+        if SmartLogger.is_enabled("INFO"):
+            SmartLogger.log(
+                "INFO",
+                "Unassigned user stories returned.",
+                category="api.user_stories.unassigned.done",
+                params={**http_context(request), "count": len(items)},
+            )
         return items
 
 
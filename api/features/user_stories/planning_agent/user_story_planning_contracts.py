@@ -28,6 +28,29 @@ class ProposedObject(BaseModel):
     commandId: Optional[str] = None
 
 
+class AnalysisResult(BaseModel):
+    """Structured output of the analyze step."""
+
+    intent: str = ""
+    domain_keywords: List[str] = Field(default_factory=list)
+    action_verbs: List[str] = Field(default_factory=list)
+    state_changes: List[str] = Field(default_factory=list)
+
+
+class GenerationResult(BaseModel):
+    """Structured output of the generate-objects step."""
+
+    summary: str = ""
+    objects: List[ProposedObject] = Field(default_factory=list)
+
+
+class CombinedResult(AnalysisResult):
+    """Structured output of the fused analyze + generate step (target BC known up front)."""
+
+    summary: str = ""
+    objects: List[ProposedObject] = Field(default_factory=list)
+
+
 class UserStoryPlanningState(BaseModel):
     # Input
     role: str = ""
@@ -5,16 +5,35 @@ from typing import Any, Dict, Optional
 from langgraph.graph import END, StateGraph
 
 from .user_story_planning_contracts import PlanningScope, UserStoryPlanningState
-from .user_story_planning_nodes import analyze_story_node, find_matching_bc_node, generate_objects_node
+from .user_story_planning_nodes import (
+    analyze_and_generate_node,
+    analyze_story_node,
+    find_matching_bc_node,
+    generate_objects_node,
+)
+
+
+def _route_entry(state: UserStoryPlanningState) -> str:
+    # With a known target BC nothing in generation depends on the analysis: fuse the LLM calls.
+    if state.auto_generate and state.target_bc_id:
+        return "analyze_and_generate"
+    return "analyze_story"
+
+
+def _route_after_fused(state: UserStoryPlanningState) -> str:
+    # The fused node leaves matched_bc_id unset when the target BC does not exist.
+    return END if state.matched_bc_id else "analyze_story"
 
 
 def create_user_story_planning_graph():
     graph = StateGraph(UserStoryPlanningState)
+    graph.add_node("analyze_and_generate", analyze_and_generate_node)
     graph.add_node("analyze_story", analyze_story_node)
     graph.add_node("find_matching_bc", find_matching_bc_node)
     graph.add_node("generate_objects", generate_objects_node)
 
-    graph.set_entry_point("analyze_story")
+    graph.set_conditional_entry_point(_route_entry, ["analyze_and_generate", "analyze_story"])
+    graph.add_conditional_edges("analyze_and_generate", _route_after_fused, [END, "analyze_story"])
     graph.add_edge("analyze_story", "find_matching_bc")
     graph.add_edge("find_matching_bc", "generate_objects")
     graph.add_edge("generate_objects", END)
@@ -22,14 +41,25 @@ def create_user_story_planning_graph():
     return graph.compile()
 
 
-def run_user_story_planning(
+_compiled_graph = None
+
+
+def get_user_story_planning_graph():
+    """Get the compiled planning graph, building it once per process (it holds no run state)."""
+    global _compiled_graph
+    if _compiled_graph is None:
+        _compiled_graph = create_user_story_planning_graph()
+    return _compiled_graph
+
+
+async def run_user_story_planning(
     role: str,
     action: str,
     benefit: str,
     target_bc_id: Optional[str] = None,
     auto_generate: bool = True,
 ) -> Dict[str, Any]:
-    graph = create_user_story_planning_graph()
+    graph = get_user_story_planning_graph()
     initial_state = UserStoryPlanningState(
         role=role,
         action=action,
@@ -38,14 +68,14 @@ def run_user_story_planning(
         auto_generate=auto_generate,
     )
 
-    result = graph.invoke(initial_state)
+    result = await graph.ainvoke(initial_state)
 
     if hasattr(result, "scope"):
         scope_val = result.scope.value
         scope_reasoning = result.scope_reasoning
         keywords = result.domain_keywords
         related = result.related_objects
-        changes = [obj.dict() for obj in result.proposed_objects]
+        changes = [obj.model_dump() for obj in result.proposed_objects]
         summary = result.plan_summary
     else:
         scope_val = (result.get("scope") or PlanningScope.EXISTING_BC).value
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, Dict
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, ValidationError
 
-from api.platform.env import get_llm_provider_model
 from api.platform.observability.request_logging import sha256_text, summarize_for_log
 from api.platform.observability.smart_logger import SmartLogger
 from api.platform.env import (
@@ -13,14 +14,125 @@ from api.platform.env import (
     AI_AUDIT_LOG_FULL_OUTPUT,
     AI_AUDIT_LOG_FULL_PROMPT,
 )
+from api.platform.neo4j import get_session
+
+from .user_story_planning_contracts import (
+    AnalysisResult,
+    CombinedResult,
+    GenerationResult,
+    PlanningScope,
+    ProposedObject,
+    UserStoryPlanningState,
+)
+from .user_story_planning_runtime import cached_llm_invoke, llm_cache_key, llm_provider_model
+
+_ANALYZE_SYSTEM_MSG = "You are a DDD expert analyzing user stories for domain modeling."
+# Naming guidelines shared by both generating prompts.
+_GENERATE_GUIDELINES = (
+    "- Aggregate names: nouns (Order)\n"
+    "- Command names: verbs (PlaceOrder)\n"
+    "- Event names: past tense (OrderPlaced)\n"
+    "- Reuse existing objects when appropriate"
+)
+_GENERATE_SYSTEM_MSG = "You are a DDD expert generating domain objects.\n" + _GENERATE_GUIDELINES
+_COMBINED_SYSTEM_MSG = (
+    "You are a DDD expert analyzing a user story and generating its domain objects.\n" + _GENERATE_GUIDELINES
+)
+# System prompts are static, so their digests are computed once at import.
+_SYSTEM_SHA256 = {
+    msg: sha256_text(msg) for msg in (_ANALYZE_SYSTEM_MSG, _GENERATE_SYSTEM_MSG, _COMBINED_SYSTEM_MSG)
+}
+
+# Prompt size caps for the generate step (input tokens drive both latency and cost).
+_PROMPT_MAX_KEYWORDS = 15
+_PROMPT_MAX_RELATED = 20
+
+# Cypher kept as constants: the server plan cache is keyed on the exact query text.
+_CY_TARGET_BC = """
+MATCH (bc:BoundedContext {id: $bc_id})
+RETURN bc.id as id, bc.name as name
+"""
+
+# Top-scoring BC and its related objects in one round trip; a best score below 2
+# yields no row, which means "propose a new BC".
+_CY_BC_MATCH = """
+MATCH (bc:BoundedContext)
+OPTIONAL MATCH (bc)-[:HAS_AGGREGATE]->(agg:Aggregate)
+WITH bc,
+     toLower(bc.name) as bcName,
+     toLower(coalesce(bc.description, '')) as bcDescription,
+     [a IN collect(agg) | toLower(a.name)] as aggNames
+// A BC-level hit scores once per aggregate row (at least one), as per-row scoring did.
+WITH bc, bcName, bcDescription, aggNames,
+     CASE WHEN size(aggNames) = 0 THEN 1 ELSE size(aggNames) END as rows
+UNWIND $keywords as keyword
+WITH bc,
+     CASE
+         WHEN bcName CONTAINS keyword THEN 3 * rows
+         WHEN bcDescription CONTAINS keyword THEN 2 * rows
+         ELSE size([name IN aggNames WHERE name CONTAINS keyword])
+     END as score
+WHERE score > 0
+WITH bc, sum(score) as totalScore
+ORDER BY totalScore DESC
+LIMIT 1
+WITH bc, totalScore
+WHERE totalScore >= 2
+CALL {
+    WITH bc
+    OPTIONAL MATCH (bc)-[:HAS_AGGREGATE]->(agg:Aggregate)
+    OPTIONAL MATCH (agg)-[:HAS_COMMAND]->(cmd:Command)
+    OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
+    RETURN
+        collect(DISTINCT {id: agg.id, name: agg.name, type: 'Aggregate'}) as aggregates,
+        collect(DISTINCT {id: cmd.id, name: cmd.name, type: 'Command'}) as commands,
+        collect(DISTINCT {id: evt.id, name: evt.name, type: 'Event'}) as events
+}
+RETURN bc.id as id, bc.name as name, totalScore as score, aggregates, commands, events
+"""
+
+
+def _dedupe_for_prompt(values: list[str]) -> list[str]:
+    """Case-insensitive dedupe (first spelling wins), capped at _PROMPT_MAX_KEYWORDS."""
+    unique: dict[str, str] = {}
+    for value in values:
+        unique.setdefault(value.lower(), value)
+    return list(unique.values())[:_PROMPT_MAX_KEYWORDS]
+
+
+def _audit_enabled(level: str, category: str) -> bool:
+    """Audit payloads (hashes, dumps, summaries) are only built if the record would be emitted."""
+    return AI_AUDIT_LOG_ENABLED and SmartLogger.is_enabled(level, category=category)
+
+
+async def _invoke_structured(
+    schema: type[BaseModel], system_msg: str, prompt: str, *, system_sha256: str, prompt_sha256: str
+):
+    """Returns (result, cache_hit, error); output the model could not fit to `schema` becomes `error`."""
+    try:
+        result, cache_hit = await cached_llm_invoke(
+            schema, system_msg, prompt, cache_key=llm_cache_key(schema, system_sha256, prompt_sha256)
+        )
+        return result, cache_hit, None
+    except (OutputParserException, ValidationError) as e:
+        return None, False, e
 
-from .user_story_planning_contracts import PlanningScope, ProposedObject, UserStoryPlanningState
-from .user_story_planning_runtime import generate_id, get_llm, get_neo4j_driver, get_neo4j_session
 
+def _lookup_target_bc(bc_id: str) -> Dict[str, Any] | None:
+    with get_session() as session:
+        result = session.run(_CY_TARGET_BC, bc_id=bc_id)
+        record = result.single()
+        if record:
+            return {
+                "scope": PlanningScope.EXISTING_BC,
+                "scope_reasoning": f"Using specified BC: {record['name']}",
+                "matched_bc_id": record["id"],
+                "matched_bc_name": record["name"],
+            }
+        return None
 
-def analyze_story_node(state: UserStoryPlanningState) -> Dict[str, Any]:
-    llm = get_llm()
 
+async def analyze_story_node(state: UserStoryPlanningState) -> Dict[str, Any]:
     prompt = f"""Analyze this user story and extract domain modeling information.
 
 User Story:
@@ -42,10 +154,14 @@ Respond in JSON:
   "state_changes": ["..."]
 }}"""
 
-    provider, model = get_llm_provider_model()
-    system_msg = "You are a DDD expert analyzing user stories for domain modeling."
+    provider, model = llm_provider_model()
+    system_msg = _ANALYZE_SYSTEM_MSG
 
-    if AI_AUDIT_LOG_ENABLED:
+    # Hashed once: shared by the audit log and the response cache key.
+    prompt_sha256 = sha256_text(prompt)
+    system_sha256 = _SYSTEM_SHA256[system_msg]
+
+    if _audit_enabled("INFO", "agent.user_story_graph.analyze.llm.start"):
         SmartLogger.log(
             "INFO",
             "User story planning (analyze): LLM invoke starting.",
@@ -60,29 +176,29 @@ Respond in JSON:
                     "auto_generate": state.auto_generate,
                 },
                 "prompt_len": len(prompt),
-                "prompt_sha256": sha256_text(prompt),
+                "prompt_sha256": prompt_sha256,
                 "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
                 "system_len": len(system_msg),
-                "system_sha256": sha256_text(system_msg),
+                "system_sha256": system_sha256,
             }
         )
 
+    # The target BC lookup does not depend on the analysis, so overlap it with the LLM call.
     t_llm0 = time.perf_counter()
-    response = llm.invoke([SystemMessage(content=system_msg), HumanMessage(content=prompt)])
+    llm_task = _invoke_structured(
+        AnalysisResult, system_msg, prompt, system_sha256=system_sha256, prompt_sha256=prompt_sha256
+    )
+    if state.target_bc_id:
+        (result, cache_hit, error), target_bc = await asyncio.gather(
+            llm_task, asyncio.to_thread(_lookup_target_bc, state.target_bc_id)
+        )
+    else:
+        (result, cache_hit, error), target_bc = await llm_task, None
     llm_ms = int((time.perf_counter() - t_llm0) * 1000)
 
-    import json
-
-    try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        result = json.loads(content.strip())
-        if AI_AUDIT_LOG_ENABLED:
-            resp_text = getattr(response, "content", "") or ""
+    if error is None:
+        if _audit_enabled("INFO", "agent.user_story_graph.analyze.llm.done"):
+            resp_dump = result.model_dump()
             SmartLogger.log(
                 "INFO",
                 "User story planning (analyze): LLM invoke completed.",
@@ -90,156 +206,101 @@ Respond in JSON:
                 params={
                     "llm": {"provider": provider, "model": model},
                     "llm_ms": llm_ms,
-                    "response_len": len(resp_text),
-                    "response_sha256": sha256_text(resp_text),
-                    "response": resp_text if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_text),
+                    "cache_hit": cache_hit,
+                    "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
                     "parsed": {
-                        "intent_preview": (result.get("intent") or "")[:200],
-                        "domain_keywords": (result.get("domain_keywords") or [])[:30],
-                        "action_verbs": (result.get("action_verbs") or [])[:30],
+                        "intent_preview": result.intent[:200],
+                        "domain_keywords": result.domain_keywords[:30],
+                        "action_verbs": result.action_verbs[:30],
                     },
                 }
             )
         return {
-            "story_intent": result.get("intent", ""),
-            "domain_keywords": result.get("domain_keywords", []),
-            "action_verbs": result.get("action_verbs", []),
-        }
-    except Exception as e:
-        if AI_AUDIT_LOG_ENABLED:
-            resp_text = getattr(response, "content", "") or ""
-            SmartLogger.log(
-                "WARNING",
-                "User story planning (analyze): failed to parse LLM response; using fallback.",
-                category="agent.user_story_graph.analyze.llm.parse_error",
-                params={
-                    "llm": {"provider": provider, "model": model},
-                    "llm_ms": llm_ms,
-                    "error": {"type": type(e).__name__, "message": str(e)},
-                    "response_len": len(resp_text),
-                    "response_sha256": sha256_text(resp_text),
-                    "response_preview": resp_text[:1500],
-                }
-            )
-        return {
-            "story_intent": state.action,
-            "domain_keywords": [state.action.split()[0]] if state.action else [],
-            "action_verbs": [],
-            "error": str(e),
+            "story_intent": result.intent,
+            "domain_keywords": result.domain_keywords,
+            "action_verbs": result.action_verbs,
+            **(target_bc or {}),
         }
 
+    if _audit_enabled("WARNING", "agent.user_story_graph.analyze.llm.parse_error"):
+        resp_text = getattr(error, "llm_output", None) or ""
+        SmartLogger.log(
+            "WARNING",
+            "User story planning (analyze): failed to parse LLM response; using fallback.",
+            category="agent.user_story_graph.analyze.llm.parse_error",
+            params={
+                "llm": {"provider": provider, "model": model},
+                "llm_ms": llm_ms,
+                "error": {"type": type(error).__name__, "message": str(error)},
+                "response_len": len(resp_text),
+                "response_preview": resp_text[:1500],
+            }
+        )
+    return {
+        "story_intent": state.action,
+        "domain_keywords": [state.action.split()[0]] if state.action else [],
+        "action_verbs": [],
+        "error": str(error),
+        **(target_bc or {}),
+    }
+
 
-def find_matching_bc_node(state: UserStoryPlanningState) -> Dict[str, Any]:
-    if state.target_bc_id:
-        driver = get_neo4j_driver()
-        try:
-            with get_neo4j_session(driver) as session:
-                result = session.run(
-                    """
-                    MATCH (bc:BoundedContext {id: $bc_id})
-                    RETURN bc.id as id, bc.name as name
-                    """,
-                    bc_id=state.target_bc_id,
-                )
-                record = result.single()
-                if record:
-                    return {
-                        "scope": PlanningScope.EXISTING_BC,
-                        "scope_reasoning": f"Using specified BC: {record['name']}",
-                        "matched_bc_id": record["id"],
-                        "matched_bc_name": record["name"],
-                    }
-        finally:
-            driver.close()
-
-    driver = get_neo4j_driver()
+async def find_matching_bc_node(state: UserStoryPlanningState) -> Dict[str, Any]:
+    if state.target_bc_id and state.matched_bc_id == state.target_bc_id:
+        # Already resolved alongside the analysis LLM call.
+        return {}
+    return await asyncio.to_thread(_match_bc_by_keywords, state)
+
+
+def _match_bc_by_keywords(state: UserStoryPlanningState) -> Dict[str, Any]:
     keywords = state.domain_keywords + state.action_verbs
 
-    try:
-        with get_neo4j_session(driver) as session:
-            result = session.run(
-                """
-                UNWIND $keywords as keyword
-                MATCH (bc:BoundedContext)
-                OPTIONAL MATCH (bc)-[:HAS_AGGREGATE]->(agg:Aggregate)
-                WITH bc, agg, keyword,
-                     CASE
-                         WHEN toLower(bc.name) CONTAINS toLower(keyword) THEN 3
-                         WHEN toLower(coalesce(bc.description, '')) CONTAINS toLower(keyword) THEN 2
-                         WHEN agg IS NOT NULL AND toLower(agg.name) CONTAINS toLower(keyword) THEN 1
-                         ELSE 0
-                     END as score
-                WHERE score > 0
-                WITH bc, sum(score) as totalScore
-                ORDER BY totalScore DESC
-                LIMIT 1
-                RETURN bc.id as id, bc.name as name, totalScore as score
-                """,
-                keywords=keywords,
-            )
-            record = result.single()
-
-            if record and record["score"] >= 2:
-                related_result = session.run(
-                    """
-                    MATCH (bc:BoundedContext {id: $bc_id})
-                    OPTIONAL MATCH (bc)-[:HAS_AGGREGATE]->(agg:Aggregate)
-                    OPTIONAL MATCH (agg)-[:HAS_COMMAND]->(cmd:Command)
-                    OPTIONAL MATCH (cmd)-[:EMITS]->(evt:Event)
-                    RETURN
-                        collect(DISTINCT {id: agg.id, name: agg.name, type: 'Aggregate'}) as aggregates,
-                        collect(DISTINCT {id: cmd.id, name: cmd.name, type: 'Command'}) as commands,
-                        collect(DISTINCT {id: evt.id, name: evt.name, type: 'Event'}) as events
-                    """,
-                    bc_id=record["id"],
-                )
-                related_record = related_result.single()
-
-                related_objects: list[dict[str, Any]] = []
-                if related_record:
-                    for agg in related_record["aggregates"]:
-                        if agg.get("id"):
-                            related_objects.append(dict(agg))
-                    for cmd in related_record["commands"]:
-                        if cmd.get("id"):
-                            related_objects.append(dict(cmd))
-                    for evt in related_record["events"]:
-                        if evt.get("id"):
-                            related_objects.append(dict(evt))
-
-                return {
-                    "scope": PlanningScope.EXISTING_BC,
-                    "scope_reasoning": f"Found matching BC '{record['name']}' based on keywords: {keywords}",
-                    "matched_bc_id": record["id"],
-                    "matched_bc_name": record["name"],
-                    "related_objects": related_objects,
-                }
+    with get_session() as session:
+        result = session.run(_CY_BC_MATCH, keywords=[k.lower() for k in keywords])
+        record = result.single()
+
+        if record:
+            # Collected maps arrive as plain dicts; OPTIONAL MATCH misses show up with a null id.
+            related_objects: list[dict[str, Any]] = [
+                obj for bucket in ("aggregates", "commands", "events") for obj in record[bucket] if obj["id"]
+            ]
 
             return {
-                "scope": PlanningScope.NEW_BC,
-                "scope_reasoning": f"No matching BC found for keywords: {keywords}. Proposing new BC.",
-                "matched_bc_id": None,
-                "matched_bc_name": None,
-                "related_objects": [],
+                "scope": PlanningScope.EXISTING_BC,
+                "scope_reasoning": f"Found matching BC '{record['name']}' based on keywords: {keywords}",
+                "matched_bc_id": record["id"],
+                "matched_bc_name": record["name"],
+                "related_objects": related_objects,
             }
-    finally:
-        driver.close()
+
+        return {
+            "scope": PlanningScope.NEW_BC,
+            "scope_reasoning": f"No matching BC found for keywords: {keywords}. Proposing new BC.",
+            "matched_bc_id": None,
+            "matched_bc_name": None,
+            "related_objects": [],
+        }
 
 
-def generate_objects_node(state: UserStoryPlanningState) -> Dict[str, Any]:
+async def generate_objects_node(state: UserStoryPlanningState) -> Dict[str, Any]:
     if not state.auto_generate:
         return {
             "proposed_objects": [],
             "plan_summary": "Auto-generation disabled. User story will be created without related objects.",
         }
 
-    llm = get_llm()
+    keywords = _dedupe_for_prompt(state.domain_keywords)
+    verbs = _dedupe_for_prompt(state.action_verbs)
 
+    # related_objects is ordered aggregates -> commands -> events, so the cap keeps the aggregates.
+    related = state.related_objects[:_PROMPT_MAX_RELATED]
     related_text = (
-        "\n".join([f"- {obj.get('type', 'Unknown')}: {obj.get('name', '?')}" for obj in state.related_objects])
-        if state.related_objects
+        "\n".join(f"- {obj.get('type', 'Unknown')}: {obj.get('name', '?')}" for obj in related)
+        if related
         else "None"
     )
+    if len(state.related_objects) > len(related):
+        related_text += f"\n- ... and {len(state.related_objects) - len(related)} more"
 
     bc_context = (
         f"Target BC: {state.matched_bc_name} (ID: {state.matched_bc_id})"
@@ -256,8 +317,8 @@ def generate_objects_node(state: UserStoryPlanningState) -> Dict[str, Any]:
 
 ## Analysis
 - Intent: {state.story_intent}
-- Domain Keywords: {state.domain_keywords}
-- Action Verbs: {state.action_verbs}
+- Domain Keywords: {", ".join(keywords)}
+- Action Verbs: {", ".join(verbs)}
 
 ## Context
 {bc_context}
@@ -292,16 +353,14 @@ Respond in JSON:
   ]
 }}"""
 
-    provider, model = get_llm_provider_model()
-    system_msg = (
-        "You are a DDD expert generating domain objects.\n"
-        "- Aggregate names: nouns (Order)\n"
-        "- Command names: verbs (PlaceOrder)\n"
-        "- Event names: past tense (OrderPlaced)\n"
-        "- Reuse existing objects when appropriate"
-    )
+    provider, model = llm_provider_model()
+    system_msg = _GENERATE_SYSTEM_MSG
+
+    # Hashed once: shared by the audit log and the response cache key.
+    prompt_sha256 = sha256_text(prompt)
+    system_sha256 = _SYSTEM_SHA256[system_msg]
 
-    if AI_AUDIT_LOG_ENABLED:
+    if _audit_enabled("INFO", "agent.user_story_graph.generate_objects.llm.start"):
         SmartLogger.log(
             "INFO",
             "User story planning (generate objects): LLM invoke starting.",
@@ -312,82 +371,210 @@ Respond in JSON:
                 "matched_bc": {"id": state.matched_bc_id, "name": state.matched_bc_name},
                 "related_objects_count": len(state.related_objects or []),
                 "prompt_len": len(prompt),
-                "prompt_sha256": sha256_text(prompt),
+                "prompt_sha256": prompt_sha256,
                 "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
                 "system_len": len(system_msg),
-                "system_sha256": sha256_text(system_msg),
+                "system_sha256": system_sha256,
             }
         )
 
     t_llm0 = time.perf_counter()
-    response = llm.invoke([SystemMessage(content=system_msg), HumanMessage(content=prompt)])
+    result, cache_hit, error = await _invoke_structured(
+        GenerationResult, system_msg, prompt, system_sha256=system_sha256, prompt_sha256=prompt_sha256
+    )
     llm_ms = int((time.perf_counter() - t_llm0) * 1000)
 
-    import json
-
-    try:
-        content = response.content
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-
-        result = json.loads(content.strip())
-        proposed_objects: list[ProposedObject] = []
-        for obj in result.get("objects", []):
-            proposed_objects.append(
-                ProposedObject(
-                    action=obj.get("action", "create"),
-                    targetType=obj.get("targetType", "Unknown"),
-                    targetId=obj.get("targetId", generate_id("OBJ")),
-                    targetName=obj.get("targetName", ""),
-                    targetBcId=obj.get("targetBcId") or state.matched_bc_id,
-                    targetBcName=obj.get("targetBcName") or state.matched_bc_name,
-                    description=obj.get("description", ""),
-                    reason=obj.get("reason", ""),
-                    connectionType=obj.get("connectionType"),
-                    sourceId=obj.get("sourceId"),
-                    actor=obj.get("actor"),
-                    aggregateId=obj.get("aggregateId"),
-                    commandId=obj.get("commandId"),
-                )
-            )
-
-        if AI_AUDIT_LOG_ENABLED:
-            resp_text = getattr(response, "content", "") or ""
+    if error is not None:
+        if _audit_enabled("WARNING", "agent.user_story_graph.generate_objects.llm.parse_error"):
+            resp_text = getattr(error, "llm_output", None) or ""
             SmartLogger.log(
-                "INFO",
-                "User story planning (generate objects): LLM invoke completed.",
-                category="agent.user_story_graph.generate_objects.llm.done",
+                "WARNING",
+                "User story planning (generate objects): failed to parse LLM response; returning empty plan.",
+                category="agent.user_story_graph.generate_objects.llm.parse_error",
                 params={
                     "llm": {"provider": provider, "model": model},
                     "llm_ms": llm_ms,
+                    "error": {"type": type(error).__name__, "message": str(error)},
                     "response_len": len(resp_text),
-                    "response_sha256": sha256_text(resp_text),
-                    "response": resp_text if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_text),
-                    "summary_preview": (result.get("summary") or "")[:300],
-                    "objects_count": len(proposed_objects),
-                    "objects": summarize_for_log([o.dict() for o in proposed_objects]),
+                    "response_preview": resp_text[:1500],
                 }
             )
+        return {"proposed_objects": [], "plan_summary": f"Error generating objects: {str(error)}", "error": str(error)}
+
+    # `result` may be a shared cache entry: copy objects instead of filling BC defaults in place.
+    proposed_objects: list[ProposedObject] = [
+        obj.model_copy(
+            update={
+                "targetBcId": obj.targetBcId or state.matched_bc_id,
+                "targetBcName": obj.targetBcName or state.matched_bc_name,
+            }
+        )
+        for obj in result.objects
+    ]
 
-        return {"proposed_objects": proposed_objects, "plan_summary": result.get("summary", "")}
-    except Exception as e:
-        if AI_AUDIT_LOG_ENABLED:
-            resp_text = getattr(response, "content", "") or ""
+    if _audit_enabled("INFO", "agent.user_story_graph.generate_objects.llm.done"):
+        resp_dump = result.model_dump()
+        SmartLogger.log(
+            "INFO",
+            "User story planning (generate objects): LLM invoke completed.",
+            category="agent.user_story_graph.generate_objects.llm.done",
+            params={
+                "llm": {"provider": provider, "model": model},
+                "llm_ms": llm_ms,
+                "cache_hit": cache_hit,
+                "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
+                "summary_preview": result.summary[:300],
+                "objects_count": len(proposed_objects),
+                "objects": summarize_for_log([o.model_dump() for o in proposed_objects]),
+            }
+        )
+
+    return {"proposed_objects": proposed_objects, "plan_summary": result.summary}
+
+
+async def analyze_and_generate_node(state: UserStoryPlanningState) -> Dict[str, Any]:
+    """
+    auto_generate with a target BC: the BC context does not depend on the analysis, so
+    analysis and object generation are asked for in one LLM call. Returns {} when the
+    target BC does not exist, and the graph falls back to analyze -> match -> generate.
+    """
+    target_bc = await asyncio.to_thread(_lookup_target_bc, state.target_bc_id)
+    if target_bc is None:
+        return {}
+
+    prompt = f"""Analyze this user story and generate the domain objects it needs.
+
+## User Story
+- As a: {state.role}
+- I want to: {state.action}
+- So that: {state.benefit}
+
+## Context
+Target BC: {target_bc["matched_bc_name"]} (ID: {target_bc["matched_bc_id"]})
+
+## Task
+1. Extract the primary intent, domain keywords (nouns), action verbs (commands)
+   and state changes (events, past tense)
+2. Generate objects in this BC:
+   1) Aggregate
+   2) Command
+   3) Event (past tense)
+
+Respond in JSON:
+{{
+  "intent": "...",
+  "domain_keywords": ["..."],
+  "action_verbs": ["..."],
+  "state_changes": ["..."],
+  "summary": "...",
+  "objects": [
+    {{
+      "action": "create",
+      "targetType": "Aggregate|Command|Event",
+      "targetId": "ID",
+      "targetName": "Name",
+      "targetBcId": "BC-ID",
+      "targetBcName": "BC Name",
+      "description": "...",
+      "reason": "...",
+      "actor": "...",
+      "aggregateId": "...",
+      "commandId": "..."
+    }}
+  ]
+}}"""
+
+    provider, model = llm_provider_model()
+    system_msg = _COMBINED_SYSTEM_MSG
+
+    # Hashed once: shared by the audit log and the response cache key.
+    prompt_sha256 = sha256_text(prompt)
+    system_sha256 = _SYSTEM_SHA256[system_msg]
+
+    if _audit_enabled("INFO", "agent.user_story_graph.analyze_and_generate.llm.start"):
+        SmartLogger.log(
+            "INFO",
+            "User story planning (analyze + generate): LLM invoke starting.",
+            category="agent.user_story_graph.analyze_and_generate.llm.start",
+            params={
+                "llm": {"provider": provider, "model": model},
+                "inputs": {
+                    "role": state.role,
+                    "action": state.action,
+                    "benefit": state.benefit,
+                    "target_bc_id": state.target_bc_id,
+                },
+                "matched_bc": {"id": target_bc["matched_bc_id"], "name": target_bc["matched_bc_name"]},
+                "prompt_len": len(prompt),
+                "prompt_sha256": prompt_sha256,
+                "prompt": prompt if AI_AUDIT_LOG_FULL_PROMPT else summarize_for_log(prompt),
+                "system_len": len(system_msg),
+                "system_sha256": system_sha256,
+            }
+        )
+
+    t_llm0 = time.perf_counter()
+    result, cache_hit, error = await _invoke_structured(
+        CombinedResult, system_msg, prompt, system_sha256=system_sha256, prompt_sha256=prompt_sha256
+    )
+    llm_ms = int((time.perf_counter() - t_llm0) * 1000)
+
+    if error is not None:
+        if _audit_enabled("WARNING", "agent.user_story_graph.analyze_and_generate.llm.parse_error"):
+            resp_text = getattr(error, "llm_output", None) or ""
             SmartLogger.log(
                 "WARNING",
-                "User story planning (generate objects): failed to parse LLM response; returning empty plan.",
-                category="agent.user_story_graph.generate_objects.llm.parse_error",
+                "User story planning (analyze + generate): failed to parse LLM response; returning empty plan.",
+                category="agent.user_story_graph.analyze_and_generate.llm.parse_error",
                 params={
                     "llm": {"provider": provider, "model": model},
                     "llm_ms": llm_ms,
-                    "error": {"type": type(e).__name__, "message": str(e)},
+                    "error": {"type": type(error).__name__, "message": str(error)},
                     "response_len": len(resp_text),
-                    "response_sha256": sha256_text(resp_text),
                     "response_preview": resp_text[:1500],
                 }
             )
-        return {"proposed_objects": [], "plan_summary": f"Error generating objects: {str(e)}", "error": str(e)}
+        return {
+            "story_intent": state.action,
+            "domain_keywords": [state.action.split()[0]] if state.action else [],
+            "action_verbs": [],
+            **target_bc,
+            "proposed_objects": [],
+            "plan_summary": f"Error generating objects: {str(error)}",
+            "error": str(error),
+        }
 
+    # `result` may be a shared cache entry: copy objects instead of filling BC defaults in place.
+    proposed_objects: list[ProposedObject] = [
+        obj.model_copy(
+            update={
+                "targetBcId": obj.targetBcId or target_bc["matched_bc_id"],
+                "targetBcName": obj.targetBcName or target_bc["matched_bc_name"],
+            }
+        )
+        for obj in result.objects
+    ]
+
+    if _audit_enabled("INFO", "agent.user_story_graph.analyze_and_generate.llm.done"):
+        resp_dump = result.model_dump()
+        SmartLogger.log(
+            "INFO",
+            "User story planning (analyze + generate): LLM invoke completed.",
+            category="agent.user_story_graph.analyze_and_generate.llm.done",
+            params={
+                "llm": {"provider": provider, "model": model},
+                "llm_ms": llm_ms,
+                "cache_hit": cache_hit,
+                "response": resp_dump if AI_AUDIT_LOG_FULL_OUTPUT else summarize_for_log(resp_dump),
+                "objects_count": len(proposed_objects),
+            }
+        )
 
+    return {
+        "story_intent": result.intent,
+        "domain_keywords": result.domain_keywords,
+        "action_verbs": result.action_verbs,
+        **target_bc,
+        "proposed_objects": proposed_objects,
+        "plan_summary": result.summary,
+    }
@@ -1,45 +1,105 @@
 from __future__ import annotations
 
-import uuid
+import asyncio
+import time
+from collections import OrderedDict
 
-from neo4j import GraphDatabase
+from langchain_core.messages import HumanMessage, SystemMessage
 
-from api.platform.env import (
-    get_llm_provider_model,
-    get_neo4j_database,
-    get_neo4j_password,
-    get_neo4j_uri,
-    get_neo4j_user,
-)
+from api.platform.env import env_str, get_llm_provider_model
+from api.platform.observability.request_logging import sha256_text
 
-def get_llm():
-    provider, model = get_llm_provider_model()
-
-    if provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
-
-        return ChatAnthropic(model=model, temperature=0)
+# Bounds concurrent provider calls across all in-flight planning runs.
+LLM_CONCURRENCY = int(env_str("USER_STORY_PLANNING_LLM_CONCURRENCY", "4") or "4")
+llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
 
-    from langchain_openai import ChatOpenAI
+# Exact-match response cache (temperature=0, so identical prompts give identical plans).
+LLM_CACHE_TTL_SEC = float(env_str("USER_STORY_PLANNING_LLM_CACHE_TTL_SEC", "600") or "0")
+LLM_CACHE_MAX_ENTRIES = int(env_str("USER_STORY_PLANNING_LLM_CACHE_MAX_ENTRIES", "256") or "0")
+_llm_cache: OrderedDict[str, tuple[float, object]] = OrderedDict()
+# In-flight calls by cache key, so concurrent identical prompts share one provider request.
+_inflight: dict[str, asyncio.Future] = {}
 
-    return ChatOpenAI(model=model, temperature=0)
+# LLM provider/model read from env once per process.
+_provider_model: tuple[str, str] = get_llm_provider_model()
+_llm = None
+_structured_llms: dict[type, object] = {}
 
 
-def get_neo4j_driver():
-    uri = get_neo4j_uri()
-    user = get_neo4j_user()
-    password = get_neo4j_password()
-    return GraphDatabase.driver(uri, auth=(user, password))
+def llm_provider_model() -> tuple[str, str]:
+    """(provider, model) snapshot taken at import."""
+    return _provider_model
 
 
-def get_neo4j_session(driver):
-    db = get_neo4j_database()
-    if db:
-        return driver.session(database=db)
-    return driver.session()
-
+def get_llm():
+    """Get the chat model, built once per process so its HTTP client pool is reused."""
+    global _llm
+    if _llm is not None:
+        return _llm
 
-def generate_id(prefix: str) -> str:
-    return f"{prefix}-{str(uuid.uuid4())[:8].upper()}"
+    provider, model = _provider_model
 
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
 
+        _llm = ChatAnthropic(model=model, temperature=0)
+    else:
+        from langchain_openai import ChatOpenAI
+
+        _llm = ChatOpenAI(model=model, temperature=0)
+    return _llm
+
+
+def get_structured_llm(schema: type):
+    """`get_llm().with_structured_output(schema)`, built once per schema."""
+    runnable = _structured_llms.get(schema)
+    if runnable is None:
+        runnable = _structured_llms[schema] = get_llm().with_structured_output(schema)
+    return runnable
+
+
+def llm_cache_key(schema: type, system_sha256: str, prompt_sha256: str) -> str:
+    """Cache key from digests the caller already computed for its audit log."""
+    _, model = _provider_model
+    return f"{model}:{schema.__name__}:{system_sha256}:{prompt_sha256}"
+
+
+async def cached_llm_invoke(schema: type, system: str, prompt: str, *, cache_key: str | None = None):
+    """
+    Invoke the LLM for a `schema` instance (bounded by `llm_semaphore`), reusing a recent
+    result for the same model/schema/system/prompt. Concurrent identical calls share one
+    in-flight request. Returns (result, cache_hit), where cache_hit also covers joining an
+    in-flight call; results are shared, so callers must not mutate them.
+    """
+    key = cache_key or llm_cache_key(schema, sha256_text(system), sha256_text(prompt))
+    if LLM_CACHE_TTL_SEC > 0 and LLM_CACHE_MAX_ENTRIES > 0:
+        entry = _llm_cache.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                _llm_cache.move_to_end(key)
+                return entry[1], True
+            del _llm_cache[key]
+
+    task = _inflight.get(key)
+    if task is not None:
+        # shield: a cancelled waiter must not cancel the call others are waiting on.
+        return await asyncio.shield(task), True
+
+    task = asyncio.ensure_future(_invoke_and_cache(key, schema, system, prompt))
+    _inflight[key] = task
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task), False
+
+
+async def _invoke_and_cache(key: str, schema: type, system: str, prompt: str):
+    async with llm_semaphore:
+        response = await get_structured_llm(schema).ainvoke(
+            [SystemMessage(content=system), HumanMessage(content=prompt)]
+        )
+
+    if LLM_CACHE_TTL_SEC > 0 and LLM_CACHE_MAX_ENTRIES > 0:
+        _llm_cache[key] = (time.monotonic() + LLM_CACHE_TTL_SEC, response)
+        _llm_cache.move_to_end(key)
+        while len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+            _llm_cache.popitem(last=False)
+    return response
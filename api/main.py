@@ -12,6 +12,7 @@ from __future__ import annotations
 from dotenv import load_dotenv
 load_dotenv()
 
+import importlib
 import os
 from contextlib import asynccontextmanager
 
@@ -27,7 +28,8 @@ from api.platform.observability.request_logging import (
     set_request_id,
 )
 from api.platform.observability.smart_logger import SmartLogger
-from api.platform.neo4j import init_neo4j_driver, close_neo4j_driver
+from api.platform.env import env_str
+from api.platform.neo4j import close_neo4j_driver, ensure_node_id_constraints, init_neo4j_driver
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -41,6 +43,15 @@ async def lifespan(app: FastAPI):
         },
     )
     init_neo4j_driver(log=True)
+    try:
+        ensure_node_id_constraints(log=True)
+    except Exception as e:
+        SmartLogger.log(
+            "WARNING",
+            "Neo4j schema bootstrap skipped: database unavailable.",
+            category="api.lifespan.neo4j_schema",
+            params={"error": {"type": type(e).__name__, "message": str(e)}},
+        )
     yield
     close_neo4j_driver(log=True)
     SmartLogger.log("INFO", "API stopped", category="api.lifespan")
@@ -80,7 +91,7 @@ async def _request_id_middleware(request: Request, call_next):
         "INFO",
         "HTTP request received: starting route execution.",
         category="api.http.start",
-        params=http_context(request),
+        params=lambda: http_context(request),
     )
 
     try:
@@ -89,7 +100,7 @@ async def _request_id_middleware(request: Request, call_next):
             "INFO",
             "HTTP request completed.",
             category="api.http.end",
-            params={
+            params=lambda: {
                 **http_context(request),
                 "result": {
                     "status_code": response.status_code,
@@ -104,7 +115,7 @@ async def _request_id_middleware(request: Request, call_next):
             "ERROR",
             "HTTP request failed: route raised an exception.",
             category="api.http.error",
-            params={
+            params=lambda: {
                 **http_context(request),
                 "error": {"type": type(e).__name__, "message": str(e)},
                 "duration_ms": timer.ms(),
@@ -115,39 +126,32 @@ async def _request_id_middleware(request: Request, call_next):
         # Avoid leaking request_id into unrelated async contexts.
         set_request_id(None)
 
-# Include ingestion router
-from api.features.ingestion.router import router as ingestion_router
-app.include_router(ingestion_router)
-
-# Include change management router
-from api.features.change_management.router import router as change_router
-app.include_router(change_router)
-
-# Include chat-based model modification router
-from api.features.model_modifier.router import router as chat_router
-app.include_router(chat_router)
-
-# Include PRD generator router
-from api.features.prd_generation.router import router as prd_router
-app.include_router(prd_router)
-
-# Include user story add/apply router
-from api.features.user_stories.authoring_router import router as user_story_router
-app.include_router(user_story_router)
-
-
 """
-Feature routers (business capabilities)
+Feature routers (business capabilities), included in this order.
+API_DISABLED_FEATURES (comma-separated module paths, e.g. "api.features.prd_generation.router")
+skips a router without importing it, so its LLM/Neo4j dependencies are never loaded.
 """
-from api.features.health.router import router as health_router
-from api.features.contexts.router import router as contexts_router
-from api.features.canvas_graph.router import router as canvas_graph_router
-from api.features.user_stories.catalog_router import router as user_stories_catalog_router
-
-app.include_router(health_router)
-app.include_router(contexts_router)
-app.include_router(canvas_graph_router)
-app.include_router(user_stories_catalog_router)
+FEATURE_ROUTERS: tuple[str, ...] = (
+    "api.features.ingestion.router",
+    "api.features.change_management.router",
+    "api.features.model_modifier.router",  # chat-based model modification
+    "api.features.prd_generation.router",
+    "api.features.user_stories.authoring_router",  # user story add/apply
+    "api.features.health.router",
+    "api.features.contexts.router",
+    "api.features.canvas_graph.router",
+    "api.features.user_stories.catalog_router",
+)
+
+_DISABLED_FEATURES = frozenset(
+    name.strip() for name in (env_str("API_DISABLED_FEATURES") or "").split(",") if name.strip()
+)
+
+for _module_path in FEATURE_ROUTERS:
+    if _module_path in _DISABLED_FEATURES:
+        SmartLogger.log("INFO", "Feature router disabled via env.", category="api.main", params={"module": _module_path})
+        continue
+    app.include_router(importlib.import_module(_module_path).router)
 
 
 if __name__ == "__main__":
@@ -8,11 +8,16 @@ feature modules can import consistent behavior instead of duplicating logic.
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable
 
-_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
 
 
+# The environment is fixed once the app is up (.env is loaded first thing in `api.main`),
+# so reads are memoized; call `env_cache_clear()` after changing os.environ (e.g. in tests).
+@lru_cache(maxsize=256)
 def env_str(key: str, default: str | None = None, *, strip: bool = True) -> str | None:
     """Read an environment variable as string with optional stripping."""
     val = os.getenv(key)
@@ -32,6 +37,7 @@ def env_first(keys: Iterable[str], default: str | None = None, *, strip: bool =
     return default
 
 
+@lru_cache(maxsize=256)
 def env_flag(key: str, default: bool = False) -> bool:
     """Read an environment variable as a boolean flag."""
     val = (os.getenv(key) or "").strip().lower()
@@ -40,18 +46,50 @@ def env_flag(key: str, default: bool = False) -> bool:
     return val in _TRUE_VALUES
 
 
+def env_cache_clear() -> None:
+    """Forget memoized `env_str`/`env_flag` reads (`ENV` and module-level flags are not re-read)."""
+    env_str.cache_clear()
+    env_flag.cache_clear()
+
+
 # =============================================================================
 # Common cross-feature configuration getters
 # =============================================================================
 
+@dataclass(frozen=True)
+class Env:
+    """
+    Connection/LLM settings, read once at import (`api.main` loads .env before importing
+    this). Unset values are None; the getters below apply their defaults.
+    """
+
+    llm_provider: str | None
+    llm_model: str | None
+    neo4j_uri: str | None
+    neo4j_user: str | None
+    neo4j_password: str | None
+    neo4j_database: str | None
+
+
+ENV = Env(
+    llm_provider=env_str("LLM_PROVIDER"),
+    llm_model=env_str("LLM_MODEL"),
+    neo4j_uri=env_str("NEO4J_URI"),
+    neo4j_user=env_str("NEO4J_USER"),
+    neo4j_password=env_str("NEO4J_PASSWORD"),
+    # Supports legacy 'neo4j_database'.
+    neo4j_database=env_first(["NEO4J_DATABASE", "neo4j_database"], default=None),
+)
+
+
 def get_llm_provider(default: str = "openai") -> str:
     """Get configured LLM provider (e.g. 'openai', 'anthropic')."""
-    return env_str("LLM_PROVIDER", default) or default
+    return ENV.llm_provider or default
 
 
 def get_llm_model(default: str = "gpt-4o") -> str:
     """Get configured LLM model name."""
-    return env_str("LLM_MODEL", default) or default
+    return ENV.llm_model or default
 
 
 def get_llm_provider_model(
@@ -63,21 +101,20 @@ def get_llm_provider_model(
 
 
 def get_neo4j_uri(default: str = "bolt://localhost:7687") -> str:
-    return env_str("NEO4J_URI", default) or default
+    return ENV.neo4j_uri or default
 
 
 def get_neo4j_user(default: str = "neo4j") -> str:
-    return env_str("NEO4J_USER", default) or default
+    return ENV.neo4j_user or default
 
 
 def get_neo4j_password(default: str = "12345msaez") -> str:
-    return env_str("NEO4J_PASSWORD", default) or default
+    return ENV.neo4j_password or default
 
 
 def get_neo4j_database() -> str | None:
     """Get target Neo4j database name (supports legacy 'neo4j_database')."""
-    db = env_first(["NEO4J_DATABASE", "neo4j_database"], default=None)
-    return (db or "").strip() or None
+    return ENV.neo4j_database
 
 
 # =============================================================================
@@ -8,6 +8,7 @@ This module intentionally centralizes:
 - Neo4j connection configuration
 - driver lifecycle
 - session creation
+- id lookup schema (uniqueness constraints) bootstrap
 
 So feature modules can focus on their domain behavior and Cypher, without
 re-implementing connection plumbing.
@@ -17,10 +18,13 @@ import time
 from typing import Optional
 
 from neo4j import GraphDatabase
-from neo4j import Driver
+from neo4j import Driver, Record
+from neo4j.exceptions import ServiceUnavailable
 
 from api.platform.observability.smart_logger import SmartLogger
 from api.platform.env import (
+    env_flag,
+    env_str,
     get_neo4j_database,
     get_neo4j_password,
     get_neo4j_uri,
@@ -32,6 +36,30 @@ NEO4J_URI = get_neo4j_uri()
 NEO4J_USER = get_neo4j_user()
 NEO4J_PASSWORD = get_neo4j_password()
 NEO4J_DATABASE = get_neo4j_database()
+# Opt-in: the schema normally comes from docs/cypher/schema. When enabled, the API creates
+# any missing id constraints at startup.
+NEO4J_ENSURE_SCHEMA = env_flag("NEO4J_ENSURE_SCHEMA", False)
+
+# Connection pool, sized for concurrent SSE runs + API reads sharing one driver. A run waits
+# at most the acquisition timeout for a free connection instead of queueing indefinitely.
+NEO4J_POOL_OPTIONS = {
+    "max_connection_pool_size": int(env_str("NEO4J_MAX_POOL_SIZE", "50") or "50"),
+    "connection_acquisition_timeout": float(env_str("NEO4J_CONN_ACQUIRE_TIMEOUT_SEC", "30") or "30"),
+    "max_connection_lifetime": float(env_str("NEO4J_MAX_CONN_LIFETIME_SEC", "3600") or "3600"),
+    "keep_alive": True,
+}
+
+# Same names as docs/cypher/schema/01_constraints.cypher so `IF NOT EXISTS` is a no-op
+# when the schema was already loaded. Each constraint is backed by an index on `id`,
+# which every `MATCH (n:Label {id: $id})` lookup relies on.
+_NODE_ID_CONSTRAINTS: tuple[tuple[str, str], ...] = (
+    ("constraint_userstory_id", "UserStory"),
+    ("constraint_boundedcontext_id", "BoundedContext"),
+    ("constraint_aggregate_id", "Aggregate"),
+    ("constraint_command_id", "Command"),
+    ("constraint_event_id", "Event"),
+    ("constraint_policy_id", "Policy"),
+)
 
 _driver: Optional[Driver] = None
 
@@ -46,7 +74,7 @@ def init_neo4j_driver(*, log: bool = True) -> Driver:
         return _driver
 
     t0 = time.perf_counter()
-    _driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    _driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD), **NEO4J_POOL_OPTIONS)
 
     if log:
         SmartLogger.log(
@@ -57,6 +85,7 @@ def init_neo4j_driver(*, log: bool = True) -> Driver:
                 "neo4j_uri": NEO4J_URI,
                 "neo4j_user": NEO4J_USER,
                 "neo4j_database": NEO4J_DATABASE,
+                "pool": NEO4J_POOL_OPTIONS,
                 "duration_ms": int((time.perf_counter() - t0) * 1000),
             },
         )
@@ -93,3 +122,50 @@ def get_session():
     return get_driver().session()
 
 
+def _collect_records(tx, cypher: str, params: dict) -> list[Record]:
+    return list(tx.run(cypher, params))
+
+
+def run_read(cypher: str, **params) -> list[Record]:
+    """
+    Run a read query in a managed transaction and return all records.
+    The driver retries it on transient errors (e.g. leader switch, deadlock).
+    """
+    with get_session() as session:
+        return session.execute_read(_collect_records, cypher, params)
+
+
+def ensure_node_id_constraints(*, log: bool = True) -> None:
+    """
+    Create the id uniqueness constraints (and their backing indexes) if missing, when
+    NEO4J_ENSURE_SCHEMA is set.
+    Per-constraint failures (e.g. duplicate ids, missing schema rights) are logged and
+    skipped; an unreachable database raises so the caller can decide.
+    """
+    if not NEO4J_ENSURE_SCHEMA:
+        return
+
+    t0 = time.perf_counter()
+    failed: list[dict] = []
+    with get_session() as session:
+        for name, label in _NODE_ID_CONSTRAINTS:
+            try:
+                session.run(
+                    f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+                ).consume()
+            except ServiceUnavailable:
+                raise
+            except Exception as e:
+                failed.append({"constraint": name, "error": {"type": type(e).__name__, "message": str(e)}})
+
+    if log:
+        SmartLogger.log(
+            "WARNING" if failed else "INFO",
+            "Neo4j id constraints ensured." if not failed else "Neo4j id constraints partially ensured.",
+            category="platform.neo4j.schema.ensure",
+            params={
+                "constraints": [name for name, _ in _NODE_ID_CONSTRAINTS],
+                "failed": failed,
+                "duration_ms": int((time.perf_counter() - t0) * 1000),
+            },
+        )
@@ -5,6 +5,8 @@ import hashlib
 import json
 import time
 import uuid
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Mapping, Sequence
 
 try:
@@ -32,12 +34,24 @@ def get_request_id() -> str | None:
     return _request_id_var.get()
 
 
-def sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+# Per-process memo for sha256_text: the same prompt/response is often logged at several sites.
+# Texts above the cap are hashed every time so the cache cannot pin very large strings.
+_SHA256_TEXT_CACHE_SIZE = 512
+_SHA256_TEXT_CACHE_MAX_CHARS = 256 * 1024
+
+
+# Digests here are log/cache fingerprints, not security primitives.
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="replace"), usedforsecurity=False).hexdigest()
+
 
+_sha256_text_cached = lru_cache(maxsize=_SHA256_TEXT_CACHE_SIZE)(_sha256_text)
 
-def sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+
+def sha256_text(text: str) -> str:
+    if len(text) > _SHA256_TEXT_CACHE_MAX_CHARS:
+        return _sha256_text(text)
+    return _sha256_text_cached(text)
 
 
 def _is_sequence(value: Any) -> bool:
@@ -51,10 +65,11 @@ def summarize_for_log(
     max_str: int = 800,
     max_list: int = 80,
     max_dict_items: int = 200,
+    hash_threshold: int = 16384,
 ) -> Any:
     """
     Summarize potentially-large payloads for logging while keeping reproduction context:
-    - Long strings: keep len, sha256, preview
+    - Long strings: keep len, preview (+ sha256 once len >= hash_threshold)
     - Large lists/dicts: truncate with counts
     """
     if max_depth <= 0:
@@ -69,34 +84,38 @@ def summarize_for_log(
     if isinstance(value, str):
         if len(value) <= max_str:
             return value
-        return {
+        summary = {
             "__type__": "str",
             "__len__": len(value),
-            "__sha256__": sha256_text(value),
             "__preview__": value[: max_str // 2],
             "__suffix__": value[- max_str // 4 :],
         }
+        # Medium strings are identified well enough by len + preview/suffix; skip the digest.
+        if len(value) >= hash_threshold:
+            summary["__sha256__"] = sha256_text(value)
+        return summary
 
     if isinstance(value, (bytes, bytearray)):
         return {"__type__": type(value).__name__, "__len__": len(value)}
 
     if isinstance(value, Mapping):
-        items = list(value.items())
+        # Only the kept items are visited; large mappings are not copied into a list first.
         out: dict[str, Any] = {}
-        for k, v in items[:max_dict_items]:
+        for k, v in islice(value.items(), max_dict_items):
             out[str(k)] = summarize_for_log(
                 v,
                 max_depth=max_depth - 1,
                 max_str=max_str,
                 max_list=max_list,
                 max_dict_items=max_dict_items,
+                hash_threshold=hash_threshold,
             )
-        if len(items) > max_dict_items:
-            out["__truncated_items__"] = len(items) - max_dict_items
+        if len(value) > max_dict_items:
+            out["__truncated_items__"] = len(value) - max_dict_items
         return out
 
     if _is_sequence(value):
-        seq = list(value)
+        # islice rather than list()/slicing: no full copy, and deque-like sequences work too.
         out_list = [
             summarize_for_log(
                 x,
@@ -104,11 +123,12 @@ def summarize_for_log(
                 max_str=max_str,
                 max_list=max_list,
                 max_dict_items=max_dict_items,
+                hash_threshold=hash_threshold,
             )
-            for x in seq[:max_list]
+            for x in islice(value, max_list)
         ]
-        if len(seq) > max_list:
-            out_list.append({"__truncated_items__": len(seq) - max_list})
+        if len(value) > max_list:
+            out_list.append({"__truncated_items__": len(value) - max_list})
         return out_list
 
     # Last resort: try JSON serialization, else repr
@@ -123,19 +143,31 @@ def http_context(request: Request) -> dict[str, Any]:
     """
     Common request context for all API logs.
     NOTE: Do not include raw headers by default to avoid leaking secrets.
+
+    Built once per request and kept on `request.state` (rebuilt only when routing has filled
+    in path params since). Treat the returned dict as read-only.
     """
+    state = getattr(request, "state", None)
+    path_params = dict(getattr(request, "path_params", {}) or {})
+    cached = getattr(state, "http_ctx", None)
+    if cached is not None and cached["http"]["path_params"] == path_params:
+        return cached
+
     rid = get_request_id()
     client_host = getattr(getattr(request, "client", None), "host", None)
-    return {
+    ctx = {
         "request_id": rid,
         "http": {
             "method": getattr(request, "method", None),
             "path": str(getattr(getattr(request, "url", None), "path", None)),
             "query": dict(getattr(request, "query_params", {}) or {}),
-            "path_params": dict(getattr(request, "path_params", {}) or {}),
+            "path_params": path_params,
             "client_host": client_host,
         },
     }
+    if state is not None:
+        state.http_ctx = ctx
+    return ctx
 
 
 class RequestTimer:
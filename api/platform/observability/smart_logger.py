@@ -5,7 +5,14 @@ import importlib.util
 import os
 import traceback
 from pathlib import Path
-from typing import Protocol
+from typing import Callable, Protocol
+
+
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+
+def _level_no(level: str | None, default: int = 0) -> int:
+    return _LEVELS.get((level or "").strip().upper(), default)
 
 
 class _SmartLoggerLike(Protocol):
@@ -71,6 +78,12 @@ def _resolve_impl() -> tuple[type[_SmartLoggerLike], str]:
     _safe_setdefault_env("SMART_LOGGER_REMOVE_LOG_ON_CREATE", "False")
 
     class _FallbackLogger:
+        min_level_no: int = _level_no(os.getenv("SMART_LOGGER_MIN_LEVEL"))
+
+        @classmethod
+        def is_enabled(cls, level: str, category: str | None = None) -> bool:
+            return _level_no(level, _LEVELS["INFO"]) >= cls.min_level_no
+
         @classmethod
         def log(
             cls,
@@ -80,6 +93,8 @@ def _resolve_impl() -> tuple[type[_SmartLoggerLike], str]:
             params: dict | None = None,
             max_inline_chars: int = 100,
         ) -> None:
+            if not cls.is_enabled(level, category):
+                return
             print(f"{level}: {message}")
 
     return _FallbackLogger, "fallback(print)"
@@ -99,16 +114,36 @@ class SmartLogger:
 
     impl_source: str = _IMPL_SOURCE
 
+    @classmethod
+    def is_enabled(cls, level: str, category: str | None = None) -> bool:
+        """
+        Whether a record at `level` would be emitted.
+        Use it to skip building expensive `params` payloads for dropped records.
+        Implementations without `is_enabled` are assumed to emit everything.
+        """
+        impl_check = getattr(_IMPL, "is_enabled", None)
+        if not callable(impl_check):
+            return True
+        try:
+            return bool(impl_check(level, category=category))
+        except Exception:
+            return True
+
     @classmethod
     def log(
         cls,
         level: str,
         message: str,
         category: str | None = None,
-        params: dict | None = None,
+        params: dict | Callable[[], dict] | None = None,
         max_inline_chars: int = 100,
     ) -> None:
+        """`params` may be a zero-arg callable; it is only called if the record will be emitted."""
+        if callable(params) and not cls.is_enabled(level, category):
+            return
         try:
+            if callable(params):
+                params = params()
             _IMPL.log(level, message, category=category, params=params, max_inline_chars=max_inline_chars)
         except Exception:
             # Last-ditch fallback: keep the app running and still emit something.
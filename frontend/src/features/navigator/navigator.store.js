@@ -322,6 +322,39 @@ export const useNavigatorStore = defineStore('navigator', () => {
     }
   }
   
+  // Remove items added during ingestion that ended up not being saved
+  function removeItems(itemIds) {
+    const ids = new Set(itemIds)
+    const keep = (items) => (items || []).filter(item => !ids.has(item.id))
+    
+    for (const bcId in contextTrees.value) {
+      const tree = contextTrees.value[bcId]
+      const aggregates = keep(tree.aggregates)
+      
+      // Update BC's aggregate count
+      const removedAggregates = (tree.aggregates?.length || 0) - aggregates.length
+      const bc = contexts.value.find(c => c.id === bcId)
+      if (bc && removedAggregates) {
+        bc.aggregateCount = Math.max((bc.aggregateCount || 0) - removedAggregates, 0)
+      }
+      
+      tree.aggregates = aggregates
+      tree.policies = keep(tree.policies)
+      for (const aggregate of aggregates) {
+        aggregate.events = keep(aggregate.events)
+        aggregate.commands = keep(aggregate.commands)
+        for (const command of aggregate.commands) {
+          command.events = keep(command.events)
+        }
+      }
+    }
+    
+    // Force reactivity update
+    contextTrees.value = { ...contextTrees.value }
+    contexts.value = keep(contexts.value)
+    userStories.value = keep(userStories.value)
+  }
+  
   // Generic add item to tree (legacy, for backwards compatibility)
   function addItemToTree(contextId, item) {
     markAsNew(item.id)
@@ -523,6 +556,7 @@ export const useNavigatorStore = defineStore('navigator', () => {
     addCommand,
     addEvent,
     addPolicy,
+    removeItems,
     addItemToTree,
     isNewlyAdded,
     refreshAll,